@@ -0,0 +1,10 @@
+"""
+Mindbug Benchmarks
+Débits du moteur (step, clone, coups légaux, passifs) et de l'IA
+(déterminisations, parties aléatoires, itérations MCTS), avec baseline.
+
+Usage : python -m benchmarks --duration 1 --baseline benchmarks/baseline.json
+"""
+
+from .suite import BENCHMARKS, BenchmarkResult, run_suite
+from .report import Comparison, compare, regressions
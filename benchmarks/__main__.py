@@ -0,0 +1,58 @@
+import argparse
+import os
+import sys
+
+from benchmarks.suite import BENCHMARKS, run_suite
+from benchmarks import report
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de débit Mindbug.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=1.0,
+                        help="Temps de mesure par benchmark (secondes).")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS)
+    parser.add_argument("--output", help="Fichier JSON de résultats.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Baisse relative tolérée avant de signaler une régression.")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Écrit les résultats comme nouvelle baseline.")
+    args = parser.parse_args(argv)
+
+    results = run_suite(seed=args.seed, duration=args.duration, only=args.only)
+    current = report.to_json(results, seed=args.seed, duration=args.duration)
+
+    for name, res in results.items():
+        print(f"{name:<12} {res.ops_per_sec:>12,.1f} ops/s  ({res.ops} ops, {res.seconds:.2f}s)")
+    if "clone" in results and "deepcopy" in results and results["deepcopy"].ops_per_sec > 0:
+        speedup = results["clone"].ops_per_sec / results["deepcopy"].ops_per_sec
+        print(f"clone() vs deepcopy : x{speedup:.1f}")
+
+    if args.output:
+        report.save(current, args.output)
+    if args.save_baseline:
+        report.save(current, args.baseline)
+        print(f"💾 Baseline écrite : {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("⚠️ Pas de baseline : comparaison ignorée.")
+        return 0
+
+    comparisons = report.compare(current, report.load(args.baseline))
+    for c in comparisons:
+        flag = "❌" if c.is_regression(args.threshold) else "  "
+        print(f"{flag} {c.name:<12} x{c.ratio:.2f} vs baseline")
+
+    failed = report.regressions(comparisons, args.threshold)
+    if failed:
+        print(f"❌ {len(failed)} régression(s) au-delà de {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
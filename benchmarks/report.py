@@ -0,0 +1,64 @@
+"""
+Sérialisation JSON des résultats et comparaison avec une baseline.
+"""
+import json
+import platform
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+from benchmarks.suite import BenchmarkResult
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """current / baseline (> 1 : plus rapide)."""
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio < 1.0 - threshold
+
+
+def to_json(results: Dict[str, BenchmarkResult], seed: int, duration: float) -> Dict:
+    return {
+        "meta": {
+            "seed": seed,
+            "duration": duration,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": {name: res.to_dict() for name, res in results.items()},
+    }
+
+
+def save(report: Dict, path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def load(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(current: Dict, baseline: Dict) -> List[Comparison]:
+    """Compare les ops/s des benchmarks présents dans les deux rapports."""
+    comparisons = []
+    base_results = baseline.get("results", {})
+    for name, res in current.get("results", {}).items():
+        if name in base_results:
+            comparisons.append(Comparison(name=name,
+                                          baseline=base_results[name]["ops_per_sec"],
+                                          current=res["ops_per_sec"]))
+    return comparisons
+
+
+def regressions(comparisons: List[Comparison], threshold: float) -> List[Comparison]:
+    return [c for c in comparisons if c.is_regression(threshold)]
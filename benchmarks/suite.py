@@ -0,0 +1,204 @@
+"""
+Benchmarks de débit du moteur et de l'IA.
+
+Chaque benchmark tourne pendant une durée fixe sur des positions reproductibles
+(graines fixes) et renvoie un nombre d'opérations : on compare ensuite les
+opérations/seconde d'une version à l'autre (cf. benchmarks.report).
+"""
+import contextlib
+import io
+import random
+import time
+from copy import deepcopy
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.utils.logger import silenced
+from mindbug_ai.mcts.agent import MCTSAgent
+from mindbug_ai.mcts.determinizer import Determinizer
+
+# Garde-fou : une partie aléatoire ne dépasse jamais ce nombre d'actions
+MAX_GAME_STEPS = 500
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    ops: int
+    seconds: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["ops_per_sec"] = self.ops_per_sec
+        return data
+
+
+# =============================================================================
+#  POSITIONS DE RÉFÉRENCE
+# =============================================================================
+
+def random_game(seed: int, rng: random.Random, on_step: Callable = None) -> MindbugGame:
+    """
+    Joue une partie complète à coups aléatoires depuis la position de départ `seed`.
+    `on_step(game)` est appelé avant chaque coup (collecte de positions).
+    """
+    game = MindbugGame.start_headless(seed=seed)
+    for _ in range(MAX_GAME_STEPS):
+        moves = game.get_legal_moves()
+        if not moves:
+            break
+        if on_step:
+            on_step(game)
+        action, index = rng.choice(moves)
+        game.step(action, index)
+    return game
+
+
+def collect_positions(seed: int, count: int = 64) -> List[MindbugGame]:
+    """Positions de milieu de partie variées (main, blocage, sélection...)."""
+    rng = random.Random(seed)
+    positions = []
+    game_seed = seed
+    while len(positions) < count:
+        random_game(game_seed, rng, on_step=lambda g: positions.append(g.clone()))
+        game_seed += 1
+    # Échantillon régulier sur toutes les parties jouées
+    stride = max(1, len(positions) // count)
+    return positions[::stride][:count]
+
+
+# =============================================================================
+#  BENCHMARKS
+# =============================================================================
+
+def _run_for(duration: float, op: Callable[[int], None]) -> BenchmarkResult:
+    """Appelle op(i) en boucle pendant `duration` secondes."""
+    ops = 0
+    start = time.perf_counter()
+    deadline = start + duration
+    while True:
+        op(ops)
+        ops += 1
+        if time.perf_counter() >= deadline:
+            break
+    return BenchmarkResult(name="", ops=ops, seconds=time.perf_counter() - start)
+
+
+def bench_step(seed: int, duration: float) -> BenchmarkResult:
+    """MindbugGame.step, mesuré seul au fil de parties aléatoires."""
+    rng = random.Random(seed)
+    ops, elapsed = 0, 0.0
+    game_seed = seed
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        game = MindbugGame.start_headless(seed=game_seed)
+        game_seed += 1
+        for _ in range(MAX_GAME_STEPS):
+            moves = game.get_legal_moves()
+            if not moves:
+                break
+            action, index = rng.choice(moves)
+            t0 = time.perf_counter()
+            game.step(action, index)
+            elapsed += time.perf_counter() - t0
+            ops += 1
+    return BenchmarkResult(name="", ops=ops, seconds=elapsed)
+
+
+def bench_clone(positions: List[MindbugGame], duration: float) -> BenchmarkResult:
+    n = len(positions)
+    return _run_for(duration, lambda i: positions[i % n].clone())
+
+
+def bench_deepcopy(positions: List[MindbugGame], duration: float) -> BenchmarkResult:
+    """Référence : copie naïve, pour vérifier l'avantage de clone()."""
+    n = len(positions)
+    return _run_for(duration, lambda i: deepcopy(positions[i % n]))
+
+
+def bench_legal_moves(positions: List[MindbugGame], duration: float) -> BenchmarkResult:
+    n = len(positions)
+    return _run_for(duration, lambda i: positions[i % n].get_legal_moves())
+
+
+def bench_passives(positions: List[MindbugGame], duration: float) -> BenchmarkResult:
+    n = len(positions)
+    return _run_for(duration, lambda i: positions[i % n].effect_manager.apply_passive_effects())
+
+
+def bench_determinize(positions: List[MindbugGame], seed: int, duration: float) -> BenchmarkResult:
+    """Determinizer.determinize sur des copies (le re-mélange d'une même copie est valide)."""
+    random.seed(seed)
+    sims = [g.clone() for g in positions]
+    determinizer = Determinizer()
+    n = len(sims)
+
+    def op(i):
+        sim = sims[i % n]
+        determinizer.determinize(sim.state, observer_idx=sim.state.active_player_idx)
+
+    return _run_for(duration, op)
+
+
+def bench_games(seed: int, duration: float) -> BenchmarkResult:
+    """Parties complètes à coups aléatoires (création + initiative + jeu)."""
+    rng = random.Random(seed)
+    return _run_for(duration, lambda i: random_game(seed + i, rng))
+
+
+def bench_mcts(positions: List[MindbugGame], seed: int, duration: float,
+               think_time: float = 0.25) -> BenchmarkResult:
+    """Itérations MCTS (solveur désactivé) réparties sur plusieurs positions."""
+    random.seed(seed)
+    agent = MCTSAgent(simulation_time=think_time, use_solver=False)
+    candidates = [g for g in positions if len(g.get_legal_moves()) > 1]
+    ops, elapsed, i = 0, 0.0, 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        while elapsed < duration and candidates:
+            game = candidates[i % len(candidates)].clone()
+            t0 = time.perf_counter()
+            agent.get_action(game)
+            elapsed += time.perf_counter() - t0
+            ops += agent.last_iterations
+            i += 1
+    return BenchmarkResult(name="", ops=ops, seconds=elapsed)
+
+
+BENCHMARKS = ("step", "clone", "deepcopy", "legal_moves", "passives",
+              "determinize", "games", "mcts")
+
+
+def run_suite(seed: int = 1, duration: float = 1.0,
+              only: Optional[List[str]] = None) -> Dict[str, BenchmarkResult]:
+    """
+    Lance les benchmarks demandés (tous par défaut) et renvoie {nom: résultat}.
+    `duration` est le temps de mesure approximatif par benchmark, en secondes.
+    """
+    names = list(only) if only else list(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"❌ Benchmarks inconnus : {sorted(unknown)}")
+
+    results = {}
+    with silenced():
+        positions = collect_positions(seed)
+        runners = {
+            "step": lambda: bench_step(seed, duration),
+            "clone": lambda: bench_clone(positions, duration),
+            "deepcopy": lambda: bench_deepcopy(positions, duration),
+            "legal_moves": lambda: bench_legal_moves(positions, duration),
+            "passives": lambda: bench_passives(positions, duration),
+            "determinize": lambda: bench_determinize(positions, seed, duration),
+            "games": lambda: bench_games(seed, duration),
+            "mcts": lambda: bench_mcts(positions, seed, duration),
+        }
+        for name in names:
+            result = runners[name]()
+            result.name = name
+            results[name] = result
+    return results
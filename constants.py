@@ -72,6 +72,12 @@ COLOR_BORDER_NORMAL = (0, 0, 0)
 # Chemin vers le JSON des données (Interne -> resource_path)
 PATH_DATA = resource_path(os.path.join("data", "cards.json"))
 
+# Poids du modèle de valeur linéaire (mindbug_ai.learning)
+PATH_VALUE_MODEL = resource_path(os.path.join("data", "value_model.json"))
+
+# Poids de la politique de rollout softmax (mindbug_ai.learning)
+PATH_ROLLOUT_POLICY = resource_path(os.path.join("data", "rollout_policy.json"))
+
 # Chemin vers le dossier des assets (Interne -> resource_path)
 PATH_ASSETS = resource_path("assets")
 
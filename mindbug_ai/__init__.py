@@ -4,4 +4,6 @@ Architecture Modulaire : Interface -> Factory -> Implementation
 """
 
 from .interface import AgentInterface
-from .factory import AgentFactory
\ No newline at end of file
+from .factory import AgentFactory, STRATEGIES
+from .heuristic import HeuristicAgent
+from .tactics import TacticalAnalyzer, AttackOption, BlockOption
\ No newline at end of file
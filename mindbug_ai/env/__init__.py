@@ -0,0 +1,5 @@
+"""
+Environnements d'apprentissage par renforcement (PettingZoo, vectorisé).
+"""
+from .aec import MindbugEnv, MAX_EPISODE_STEPS, env, raw_env
+from .vector import MindbugVectorEnv
@@ -0,0 +1,161 @@
+"""
+Environnement PettingZoo (AEC) : deux agents jouent MindbugGame à tour de rôle.
+
+- Actions : entier dans [0, ACTION_COUNT) (cf. mindbug_ai.learning.encoder).
+- Observation : {"observation": vecteur float32, "action_mask": int8}, vue du joueur.
+- Récompenses : +1 / -1 en fin de partie, 0 sinon.
+- L'agent sélectionné est celui qui doit agir (le sélecteur pendant une sélection).
+
+reset() ne relit pas le JSON des cartes : le DeckFactory et la configuration sont
+créés une fois par environnement, les tampons d'observation sont préalloués.
+"""
+from typing import Optional
+
+import numpy as np
+from gymnasium import spaces
+from pettingzoo import AECEnv
+from pettingzoo.utils import wrappers
+
+from constants import PATH_DATA
+from mindbug_engine.core.config import ConfigurationService
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.infrastructure.deck_factory import DeckFactory
+from mindbug_engine.utils.logger import silenced
+from mindbug_ai.learning.encoder import (ACTION_COUNT, OBSERVATION_SIZE, action_to_move,
+                                         encode_batch, legal_action_mask)
+
+# Garde-fou : au-delà, l'épisode est tronqué (cf. selfplay.MAX_GAME_STEPS)
+MAX_EPISODE_STEPS = 500
+
+
+class MindbugEnv(AECEnv):
+
+    metadata = {"name": "mindbug_v0", "render_modes": ["ansi"], "is_parallelizable": False}
+
+    def __init__(self, render_mode: Optional[str] = None, max_steps: int = MAX_EPISODE_STEPS,
+                 config: Optional[ConfigurationService] = None):
+        super().__init__()
+        self.render_mode = render_mode
+        self.max_steps = max_steps
+
+        # Ressources partagées par tous les épisodes
+        self.config = config or ConfigurationService(load_from_disk=False)
+        self.deck_factory = DeckFactory(PATH_DATA)
+
+        self.possible_agents = ["player_0", "player_1"]
+        self.agent_name_mapping = {name: i for i, name in enumerate(self.possible_agents)}
+
+        self._action_space = spaces.Discrete(ACTION_COUNT)
+        self._observation_space = spaces.Dict({
+            "observation": spaces.Box(-np.inf, np.inf, (OBSERVATION_SIZE,), np.float32),
+            "action_mask": spaces.Box(0, 1, (ACTION_COUNT,), np.int8),
+        })
+
+        # Tampons réutilisés à chaque observe() (une ligne par joueur)
+        self._obs = np.zeros((2, OBSERVATION_SIZE), dtype=np.float32)
+        self._mask = np.zeros(ACTION_COUNT, dtype=bool)
+
+        self.game: Optional[MindbugGame] = None
+        self._next_seed: Optional[int] = None
+        self.episode_seed: Optional[int] = None
+        self.num_steps = 0
+
+    def observation_space(self, agent):
+        return self._observation_space
+
+    def action_space(self, agent):
+        return self._action_space
+
+    # =========================================================================
+    #  CYCLE DE VIE
+    # =========================================================================
+
+    def reset(self, seed: Optional[int] = None, options: Optional[dict] = None):
+        # Graine explicite, sinon la suivante de la série (parties reproductibles enchaînées)
+        if seed is not None:
+            self._next_seed = seed
+        self.episode_seed = self._next_seed
+        if self._next_seed is not None:
+            self._next_seed += 1
+
+        with silenced():
+            self.game = MindbugGame.start_headless(seed=self.episode_seed, config=self.config,
+                                                   deck_factory=self.deck_factory)
+        self.num_steps = 0
+
+        self.agents = list(self.possible_agents)
+        self.rewards = {a: 0.0 for a in self.agents}
+        self._cumulative_rewards = {a: 0.0 for a in self.agents}
+        self.terminations = {a: False for a in self.agents}
+        self.truncations = {a: False for a in self.agents}
+        self.infos = {a: {} for a in self.agents}
+        self.agent_selection = self._acting_agent()
+
+    def step(self, action):
+        agent = self.agent_selection
+        if self.terminations[agent] or self.truncations[agent]:
+            self._was_dead_step(action)
+            return
+
+        move = action_to_move(action)
+        with silenced():
+            if move not in self.game.get_legal_moves():
+                raise ValueError(f"❌ Action illégale pour {agent} : {action} {move}")
+
+            self._cumulative_rewards[agent] = 0.0
+            self.rewards = {a: 0.0 for a in self.agents}
+            self.game.step(move[0], move[1])
+            self.num_steps += 1
+
+            winner = self.game.state.winner
+            if winner is not None:
+                winner_idx = 0 if winner is self.game.state.player1 else 1
+                for a in self.agents:
+                    self.rewards[a] = 1.0 if self.agent_name_mapping[a] == winner_idx else -1.0
+                    self.terminations[a] = True
+            elif self.num_steps >= self.max_steps or not self.game.get_legal_moves():
+                for a in self.agents:
+                    self.truncations[a] = True
+
+        self.agent_selection = self._acting_agent()
+        self._accumulate_rewards()
+
+    def observe(self, agent):
+        """
+        Observation du point de vue de `agent`. Le masque n'est non nul que pour
+        l'agent qui doit agir. Les tableaux sont des copies des tampons internes.
+        """
+        idx = self.agent_name_mapping[agent]
+        mask = np.zeros(ACTION_COUNT, dtype=np.int8)
+        # Les coups légaux rafraîchissent les passifs (journalisés) : silence
+        with silenced():
+            encode_batch([self.game], [idx], out=self._obs[idx:idx + 1])
+            if agent == self.agent_selection and not (self.terminations[agent] or self.truncations[agent]):
+                mask[legal_action_mask(self.game, self._mask)] = 1
+        return {"observation": self._obs[idx].copy(), "action_mask": mask}
+
+    def render(self):
+        if self.render_mode is None or self.game is None:
+            return None
+        state = self.game.state
+        lines = [f"Tour {state.turn_count} - {getattr(state.phase, 'value', state.phase)}"]
+        for i, player in enumerate((state.player1, state.player2)):
+            board = ", ".join(f"{c.name} ({c.power})" for c in player.board) or "-"
+            lines.append(f"{self.possible_agents[i]} : {player.hp} PV, {player.mindbugs} Mindbug(s), "
+                         f"main {len(player.hand)}, plateau : {board}")
+        return "\n".join(lines)
+
+    def close(self):
+        self.game = None
+
+    def _acting_agent(self) -> str:
+        return self.possible_agents[self.game.state.acting_player_idx]
+
+
+def raw_env(**kwargs) -> MindbugEnv:
+    return MindbugEnv(**kwargs)
+
+
+def env(**kwargs):
+    """Environnement enveloppé (ordre des appels vérifié, cf. PettingZoo)."""
+    return wrappers.OrderEnforcingWrapper(raw_env(**kwargs))
@@ -0,0 +1,269 @@
+"""
+Environnement vectorisé : W processus, K parties chacun (N = W * K emplacements).
+
+Chaque emplacement est une partie en auto-jeu : l'observation est celle du
+joueur qui doit agir (cf. encode_batch), l'action reçue est la sienne. Les
+tableaux d'échange vivent en mémoire partagée (multiprocessing.shared_memory) :
+les processus n'échangent par Pipe que des commandes de quelques octets.
+
+Tableaux (une ligne par emplacement, écrasés à chaque step) :
+- obs (N, OBSERVATION_SIZE) float32, masks (N, ACTION_COUNT) bool ;
+- acting (N,) int8 : joueur qui doit agir ;
+- rewards (N, 2) float32 : récompense de chaque joueur pour ce step (+1 / -1 en fin de partie) ;
+- dones (N,) bool : partie terminée (ou tronquée) à ce step, puis relancée
+  automatiquement : obs / masks décrivent déjà la nouvelle partie ;
+- winners (N,) int8 : vainqueur de la partie terminée (-1 si aucun).
+
+Graines : l'emplacement i joue les graines seed + i, seed + i + N, seed + i + 2N...
+"""
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from constants import PATH_DATA
+from mindbug_engine.core.config import ConfigurationService
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.infrastructure.deck_factory import DeckFactory
+from mindbug_engine.utils.logger import silenced
+from mindbug_ai.env.aec import MAX_EPISODE_STEPS
+from mindbug_ai.learning.encoder import ACTION_COUNT, OBSERVATION_SIZE, action_to_move, encode_batch
+
+# Nom -> (forme par emplacement, dtype)
+_BUFFERS = {
+    "obs": ((OBSERVATION_SIZE,), np.float32),
+    "masks": ((ACTION_COUNT,), np.bool_),
+    "actions": ((), np.int32),
+    "acting": ((), np.int8),
+    "rewards": ((2,), np.float32),
+    "dones": ((), np.bool_),
+    "winners": ((), np.int8),
+}
+
+
+def _attach(names: Dict[str, str], num_envs: int):
+    """Ouvre les blocs de mémoire partagée et renvoie (blocs, tableaux)."""
+    blocks, arrays = {}, {}
+    for key, (shape, dtype) in _BUFFERS.items():
+        block = shared_memory.SharedMemory(name=names[key])
+        blocks[key] = block
+        arrays[key] = np.ndarray((num_envs,) + shape, dtype=dtype, buffer=block.buf)
+    return blocks, arrays
+
+
+class _GameSlots:
+    """Les K parties d'un processus, écrivant dans leur tranche des tableaux partagés."""
+
+    def __init__(self, arrays, start: int, count: int, seed: Optional[int], stride: int, max_steps: int):
+        self.view = {key: arr[start:start + count] for key, arr in arrays.items()}
+        self.count = count
+        self.stride = stride
+        self.max_steps = max_steps
+        self.config = ConfigurationService(load_from_disk=False)
+        self.deck_factory = DeckFactory(PATH_DATA)
+        self.next_seeds = [None if seed is None else seed + start + i for i in range(count)]
+        self.games = [None] * count
+        self.steps = [0] * count
+
+    def _new_game(self, i: int):
+        seed = self.next_seeds[i]
+        if seed is not None:
+            self.next_seeds[i] = seed + self.stride
+        self.games[i] = MindbugGame.start_headless(seed=seed, config=self.config,
+                                                   deck_factory=self.deck_factory)
+        self.steps[i] = 0
+
+    def _publish(self):
+        view = self.view
+        encode_batch(self.games, out=view["obs"], masks=view["masks"])
+        view["acting"][:] = [g.state.acting_player_idx for g in self.games]
+
+    def reset(self):
+        for i in range(self.count):
+            self._new_game(i)
+        self.view["rewards"][:] = 0.0
+        self.view["dones"][:] = False
+        self.view["winners"][:] = -1
+        self._publish()
+
+    def step(self):
+        view = self.view
+        view["rewards"][:] = 0.0
+        view["dones"][:] = False
+        view["winners"][:] = -1
+        for i, game in enumerate(self.games):
+            move = action_to_move(view["actions"][i])
+            game.step(move[0], move[1])
+            self.steps[i] += 1
+
+            winner = game.state.winner
+            if winner is not None:
+                winner_idx = 0 if winner is game.state.player1 else 1
+                view["rewards"][i, winner_idx] = 1.0
+                view["rewards"][i, 1 - winner_idx] = -1.0
+                view["winners"][i] = winner_idx
+                view["dones"][i] = True
+            elif self.steps[i] >= self.max_steps or not game.get_legal_moves():
+                view["dones"][i] = True
+
+            if view["dones"][i]:
+                self._new_game(i)
+        self._publish()
+
+
+def _worker(conn, names, num_envs, start, count, seed, stride, max_steps):
+    blocks, arrays = _attach(names, num_envs)
+    try:
+        with silenced():
+            slots = _GameSlots(arrays, start, count, seed, stride, max_steps)
+            while True:
+                command = conn.recv()
+                if command == "step":
+                    slots.step()
+                elif command == "reset":
+                    slots.reset()
+                elif command == "close":
+                    break
+                conn.send(True)
+    except Exception as e:
+        conn.send(e)
+    finally:
+        slots = arrays = None
+        for block in blocks.values():
+            block.close()
+        conn.close()
+
+
+class MindbugVectorEnv:
+
+    def __init__(self, num_workers: int = 2, envs_per_worker: int = 8, seed: Optional[int] = None,
+                 max_steps: int = MAX_EPISODE_STEPS, context: Optional[str] = None):
+        """
+        num_workers=0 : les parties tournent dans le processus courant (débogage, tests).
+        context : méthode de démarrage multiprocessing ("fork", "spawn"...), défaut du système.
+        """
+        self.num_workers = num_workers
+        self.envs_per_worker = envs_per_worker
+        self.num_envs = max(num_workers, 1) * envs_per_worker
+
+        self._blocks = {}
+        self.buffers: Dict[str, np.ndarray] = {}
+        for key, (shape, dtype) in _BUFFERS.items():
+            nbytes = max(1, int(np.prod((self.num_envs,) + shape)) * np.dtype(dtype).itemsize)
+            block = shared_memory.SharedMemory(create=True, size=nbytes)
+            self._blocks[key] = block
+            self.buffers[key] = np.ndarray((self.num_envs,) + shape, dtype=dtype, buffer=block.buf)
+
+        self._local: Optional[_GameSlots] = None
+        self._pipes = []
+        self._processes = []
+        if num_workers == 0:
+            self._local = _GameSlots(self.buffers, 0, self.num_envs, seed, self.num_envs, max_steps)
+        else:
+            ctx = mp.get_context(context)
+            names = {key: block.name for key, block in self._blocks.items()}
+            for w in range(num_workers):
+                parent, child = ctx.Pipe()
+                process = ctx.Process(target=_worker, daemon=True,
+                                      args=(child, names, self.num_envs, w * envs_per_worker,
+                                            envs_per_worker, seed, self.num_envs, max_steps))
+                process.start()
+                child.close()
+                self._pipes.append(parent)
+                self._processes.append(process)
+        self.closed = False
+
+    # =========================================================================
+    #  API
+    # =========================================================================
+
+    def reset(self):
+        """Relance toutes les parties. Retourne (obs, masks, acting)."""
+        self._broadcast("reset")
+        b = self.buffers
+        return b["obs"], b["masks"], b["acting"]
+
+    def step_async(self, actions: Sequence[int]):
+        """Lève ValueError, sans jouer aucun emplacement, si une action est hors du masque."""
+        actions = np.asarray(actions)
+        masks = self.buffers["masks"]
+        in_range = (actions >= 0) & (actions < ACTION_COUNT)
+        legal = in_range & masks[np.arange(self.num_envs), np.where(in_range, actions, 0)]
+        if not legal.all():
+            slot = int(np.flatnonzero(~legal)[0])
+            raise ValueError(f"❌ Action illégale pour l'emplacement {slot} : {actions[slot]}")
+        self.buffers["actions"][:] = actions
+        if self._local is None:
+            for pipe in self._pipes:
+                pipe.send("step")
+
+    def step_wait(self):
+        """Retourne (obs, masks, acting, rewards, dones, winners) : vues sur la mémoire partagée."""
+        if self._local is not None:
+            with silenced():
+                self._local.step()
+        else:
+            self._gather()
+        b = self.buffers
+        return b["obs"], b["masks"], b["acting"], b["rewards"], b["dones"], b["winners"]
+
+    def step(self, actions: Sequence[int]):
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for pipe in self._pipes:
+            try:
+                pipe.send("close")
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for pipe in self._pipes:
+            pipe.close()
+        self._local = None
+        self.buffers = {}
+        for block in self._blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                # Des vues NumPy sont encore tenues par l'appelant : libérées avec elles
+                pass
+            block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # =========================================================================
+    #  COMMUNICATION
+    # =========================================================================
+
+    def _broadcast(self, command: str):
+        if self._local is not None:
+            with silenced():
+                getattr(self._local, command)()
+            return
+        for pipe in self._pipes:
+            pipe.send(command)
+        self._gather()
+
+    def _gather(self):
+        for pipe in self._pipes:
+            reply = pipe.recv()
+            if isinstance(reply, Exception):
+                raise RuntimeError(f"❌ Erreur dans un processus de l'environnement : {reply!r}") from reply
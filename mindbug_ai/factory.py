@@ -1,6 +1,11 @@
+from mindbug_engine.core.config import ConfigurationService
 from mindbug_engine.core.consts import Difficulty
 from .interface import AgentInterface
 from .mcts.agent import MCTSAgent
+from .heuristic.agent import HeuristicAgent
+
+# Stratégies disponibles : la liste appartient à la configuration (paramètres)
+STRATEGIES = ConfigurationService.AI_STRATEGIES
 
 
 class AgentFactory:
@@ -10,8 +15,10 @@ class AgentFactory:
         Crée l'agent.
         Args:
             difficulty: Enum Difficulty (EASY, MEDIUM, HARD) ou str compatible.
-            strategy: "MCTS".
+            strategy: "MCTS" (recherche) ou "HEURISTIC" (règles, instantané).
         """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"❌ Stratégie inconnue : {strategy}")
         if isinstance(difficulty, str):
             try:
                 difficulty = Difficulty(difficulty)
@@ -29,7 +36,15 @@ class AgentFactory:
             if difficulty == Difficulty.EXTREME:
                 time_budget = 6.0
 
-            return MCTSAgent(simulation_time=time_budget)
+            # Budgets courts : RAVE stabilise la décision avec moins de simulations
+            rave_k = 50 if difficulty in (Difficulty.EASY, Difficulty.MEDIUM) else None
+
+            return MCTSAgent(simulation_time=time_budget, rave_k=rave_k)
+
+        elif strategy == "HEURISTIC":
+            # Aucune recherche : la difficulté règle la part de coups au hasard
+            randomness = {Difficulty.EASY: 0.25, Difficulty.MEDIUM: 0.1}.get(difficulty, 0.0)
+            return HeuristicAgent(randomness=randomness)
 
         else:
             raise ValueError(f"❌ Stratégie inconnue : {strategy}")
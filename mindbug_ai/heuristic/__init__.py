@@ -0,0 +1,2 @@
+from .agent import BENEFICIAL_CHOICES, HeuristicAgent, selected_card
+from .values import CardValues, EFFECT_VALUES
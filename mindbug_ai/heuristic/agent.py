@@ -0,0 +1,151 @@
+import random
+from typing import Optional, Tuple
+
+from mindbug_ai.interface import AgentInterface
+from mindbug_ai.heuristic.values import CardValues
+from mindbug_ai.tactics import TacticalAnalyzer
+from mindbug_engine.core.consts import Phase
+from mindbug_engine.utils.combat_oracle import CombatOracle
+
+# Effets qui profitent au joueur qui choisit la cible (on prend la meilleure carte)
+BENEFICIAL_CHOICES = ("PLAY", "MOVE")
+
+# Zones désignées par les coups de sélection : (nom de zone, chez l'adversaire)
+_SELECT_ZONES = {
+    "SELECT_HAND": ("hand", False),
+    "SELECT_BOARD": ("board", False),
+    "SELECT_DISCARD": ("discard", False),
+    "SELECT_OPP_HAND": ("hand", True),
+    "SELECT_OPP_BOARD": ("board", True),
+    "SELECT_OPP_DISCARD": ("discard", True),
+}
+
+
+def selected_card(move, selector, opponent):
+    """Carte désignée par un coup SELECT_* (zone du sélecteur ou de son adversaire)."""
+    zone, is_opp = _SELECT_ZONES[move[0]]
+    return getattr(opponent if is_opp else selector, zone)[move[1]]
+
+
+class HeuristicAgent(AgentInterface):
+    """
+    Agent sans recherche : règles de la politique de rollout, tactique de combat
+    à un coup (CombatOracle) et table de valeur des cartes.
+    Décide en quelques microsecondes, sans cloner la partie.
+    """
+
+    def __init__(self, randomness: float = 0.0, seed: Optional[int] = None):
+        # Probabilité de jouer un coup légal au hasard (niveaux faciles)
+        self.randomness = randomness
+        self.rng = random.Random(seed)
+
+    @property
+    def name(self) -> str:
+        return "MindBot (Heuristique)"
+
+    def get_action(self, game) -> Optional[Tuple[str, int]]:
+        legal_moves = game.get_legal_moves()
+        if not legal_moves:
+            return None
+        if len(legal_moves) == 1:
+            return legal_moves[0]
+        if self.randomness and self.rng.random() < self.randomness:
+            return self.rng.choice(legal_moves)
+
+        phase = game.state.phase
+        if phase == Phase.MINDBUG_DECISION:
+            return self._decide_mindbug(game, legal_moves)
+        if phase == Phase.BLOCK_DECISION:
+            return self._decide_block(game, legal_moves)
+        if phase == Phase.RESOLUTION_CHOICE:
+            return self._decide_selection(game, legal_moves)
+        return self._decide_main(game, legal_moves)
+
+    # =========================================================================
+    #  DÉCISIONS PAR PHASE
+    # =========================================================================
+
+    def _decide_mindbug(self, game, legal_moves):
+        state = game.state
+        card = state.pending_card
+        if not card or ("MINDBUG", -1) not in legal_moves:
+            return ("PASS", -1)
+
+        ap = state.active_player
+        opp = state.player2 if ap is state.player1 else state.player1
+        # Seuil d'exigence : plus il reste de cartes cachées, plus on attend mieux
+        if ap.mindbugs >= 2:
+            required = 9 if len(opp.hand) >= 3 else 8
+        else:
+            required = 10 if len(opp.hand) >= 2 else 7
+        return ("MINDBUG", -1) if CardValues.value(card) >= required else ("PASS", -1)
+
+    def _decide_block(self, game, legal_moves):
+        ap = game.state.active_player
+        choice = TacticalAnalyzer.defender_choice(TacticalAnalyzer.pending_blocks(game), ap.hp)
+        if choice is not None and ("BLOCK", choice.blocker_index) in legal_moves:
+            return ("BLOCK", choice.blocker_index)
+        return ("NO_BLOCK", -1)
+
+    def _decide_main(self, game, legal_moves):
+        state = game.state
+        ap = state.active_player
+        opp = state.player2 if ap is state.player1 else state.player1
+
+        attacks = [m for m in legal_moves if m[0] == "ATTACK"]
+        plays = [m for m in legal_moves if m[0] == "PLAY"]
+
+        best_attack = None
+        if attacks:
+            options = TacticalAnalyzer.attack_options(game)
+            scored = [(options[m[1]], m) for m in attacks if m[1] < len(options)]
+            for option, m in scored:
+                if option.lethal:
+                    return m
+            if scored:
+                option, best_attack = max(scored, key=lambda x: (x[0].score, x[0].trade))
+                # Attaque gratuite ou échange gagnant
+                if option.score > 0 or (option.score == 0 and option.trade > 0):
+                    return best_attack
+
+        if plays:
+            # Face à des Mindbugs adverses, on joue d'abord les cartes les moins précieuses
+            pick = min if opp.mindbugs > 0 else max
+            return pick(plays, key=lambda m: CardValues.value(ap.hand[m[1]]))
+
+        return best_attack or legal_moves[0]
+
+    def _decide_selection(self, game, legal_moves):
+        state = game.state
+        req = state.active_request
+        selector = req.selector if req else state.active_player
+        opponent = state.player2 if selector is state.player1 else state.player1
+        reason = getattr(req.reason, "value", req.reason) if req else None
+
+        # Sélection multiple : re-choisir une carte déjà retenue l'annulerait
+        if req and req.current_selection:
+            fresh = [m for m in legal_moves
+                     if selected_card(m, selector, opponent) not in req.current_selection]
+            legal_moves = fresh or legal_moves
+
+        if reason == "HUNTER_TARGET" and state.pending_attacker:
+            # Chasseur : le bloqueur qui donne le meilleur échange à l'attaquant
+            attacker = state.pending_attacker
+
+            def hunter_score(m):
+                target = selected_card(m, selector, opponent)
+                outcome = CombatOracle.duel(attacker, target)
+                return outcome.score, CardValues.value(target)
+
+            return max(legal_moves, key=hunter_score)
+
+        beneficial = reason in BENEFICIAL_CHOICES
+
+        def selection_score(m):
+            value = CardValues.value(selected_card(m, selector, opponent))
+            own = not _SELECT_ZONES[m[0]][1]
+            # Effet favorable : la meilleure carte ; sinon on frappe fort chez l'adversaire
+            # et on sacrifie le moins précieux chez soi
+            return value if beneficial or not own else -value
+
+        return max(legal_moves, key=selection_score)
@@ -0,0 +1,40 @@
+"""
+Table de valeur des cartes pour les agents heuristiques.
+
+Valeur = menace (puissance + mots-clés, cf. TacticalAnalyzer.threat) + bonus
+des effets de la carte. Les bonus d'effets ne dépendent que de l'id de la carte :
+ils sont calculés une fois puis lus dans la table.
+"""
+from typing import Dict
+
+from mindbug_ai.tactics import TacticalAnalyzer
+
+# Bonus par type d'effet (échelle : points de puissance)
+EFFECT_VALUES: Dict[str, int] = {
+    "STEAL": 4,
+    "DESTROY": 3,
+    "PLAY": 3,
+    "DISCARD": 2,
+    "BAN": 2,
+    "MOVE": 1,
+    "MODIFY_STAT": 1,
+    "ADD_KEYWORD": 1,
+    "COPY_KEYWORDS": 1,
+}
+
+
+class CardValues:
+    # id de carte -> bonus des effets
+    _effect_bonus: Dict[str, int] = {}
+
+    @classmethod
+    def effect_bonus(cls, card) -> int:
+        bonus = cls._effect_bonus.get(card.id)
+        if bonus is None:
+            bonus = sum(EFFECT_VALUES.get(getattr(e.type, "value", e.type), 0) for e in card.effects)
+            cls._effect_bonus[card.id] = bonus
+        return bonus
+
+    @classmethod
+    def value(cls, card) -> int:
+        return TacticalAnalyzer.threat(card) + cls.effect_bonus(card)
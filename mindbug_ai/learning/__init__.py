@@ -0,0 +1,10 @@
+"""
+Apprentissage hors ligne : caractéristiques et encodage NumPy, auto-jeu, modèle de valeur et politique de rollout.
+"""
+from .features import FEATURE_NAMES, FEATURE_COUNT, position_features
+from .encoder import (ACTION_COUNT, OBSERVATION_SIZE, OBSERVATION_LAYOUT, action_to_move,
+                      encode, encode_batch, legal_action_mask, move_to_action)
+from .value_model import LinearValueModel
+from .policy import MOVE_FEATURE_NAMES, MOVE_FEATURE_COUNT, SoftmaxPolicy, move_features
+from .selfplay import generate_dataset, generate_policy_dataset, play_game, SearchRecorder
+from .shards import ShardDataset, ShardWriter, generate_shards
@@ -0,0 +1,270 @@
+"""
+Encodage NumPy d'une partie : vecteur float32 de taille fixe + masque des actions légales.
+
+Le vecteur est vu par un joueur (ensemble d'information, cf. Observation) : la
+main adverse et les pioches ne sont encodées que par leur taille. Disposition
+(OBSERVATION_LAYOUT, nom -> (début, largeur)) :
+- scalaires : PV, Mindbugs, tailles de main / pioche des deux camps, pioche globale ;
+- phase (one-hot), qui est actif / doit choisir, raison et taille de la sélection ;
+- comptes par id de carte : ma main, mon plateau, ma défausse, plateau et défausse adverses ;
+- emplacements (MAX_SLOTS) de ma main (id one-hot) et des deux plateaux
+  (id one-hot, puissance, blessure, bits de mots-clés) ;
+- carte en attente de Mindbug (id one-hot), emplacement de l'attaquant en cours.
+
+Actions : un entier par coup (ACTION_COUNT au total), cf. move_to_action / action_to_move.
+
+La version batch (encode_batch) relève d'abord les cartes de chaque partie dans
+des tableaux d'entiers, puis remplit le tableau (N, D) préalloué par indexation
+vectorisée : aucune boucle Python par caractéristique.
+"""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from mindbug_engine.core.consts import EffectType, Keyword, KEYWORD_BITS, Phase
+from mindbug_engine.core.models import mask_of
+from mindbug_engine.infrastructure.card_loader import CardLoader
+
+# Cartes d'une partie : 20 en jeu + 2 pour le duel d'initiative
+MAX_SLOTS = 22
+
+# Disposition du vecteur : lue dans le catalogue à l'import de l'encodeur
+CARD_IDS = CardLoader.card_ids()
+CARD_INDEX = CardLoader.card_indices()
+
+# Une colonne par carte du catalogue, plus une pour les cartes inconnues (tests, extensions)
+CARD_COLUMNS = len(CARD_IDS) + 1
+_UNKNOWN_CARD = len(CARD_IDS)
+
+PHASES = tuple(Phase)
+_PHASE_INDEX = {phase: i for i, phase in enumerate(PHASES)}
+REQUEST_REASONS = tuple(e.value for e in EffectType) + ("HUNTER_TARGET",)
+_REASON_INDEX = {reason: i for i, reason in enumerate(REQUEST_REASONS)}
+
+_KEYWORD_SHIFTS = np.array([KEYWORD_BITS[kw.value].bit_length() - 1 for kw in Keyword])
+
+# =============================================================================
+#  ACTIONS
+# =============================================================================
+
+# Coups indexés par un emplacement (MAX_SLOTS actions chacun), puis coups sans index
+SLOT_ACTIONS = ("PLAY", "ATTACK", "BLOCK",
+                "SELECT_HAND", "SELECT_BOARD", "SELECT_DISCARD",
+                "SELECT_OPP_HAND", "SELECT_OPP_BOARD", "SELECT_OPP_DISCARD")
+FLAT_ACTIONS = ("NO_BLOCK", "MINDBUG", "PASS")
+ACTION_COUNT = len(SLOT_ACTIONS) * MAX_SLOTS + len(FLAT_ACTIONS)
+
+_SLOT_ACTION_BASE = {name: i * MAX_SLOTS for i, name in enumerate(SLOT_ACTIONS)}
+_FLAT_ACTION_ID = {name: len(SLOT_ACTIONS) * MAX_SLOTS + i for i, name in enumerate(FLAT_ACTIONS)}
+
+
+def move_to_action(move: Tuple[str, int]) -> int:
+    """(Action, Index) -> entier. ValueError si le coup n'est pas représentable."""
+    name, idx = move
+    if name in _FLAT_ACTION_ID:
+        return _FLAT_ACTION_ID[name]
+    if name in _SLOT_ACTION_BASE and 0 <= idx < MAX_SLOTS:
+        return _SLOT_ACTION_BASE[name] + idx
+    raise ValueError(f"❌ Coup non encodable : {move}")
+
+
+def action_to_move(action: int) -> Tuple[str, int]:
+    action = int(action)
+    if not 0 <= action < ACTION_COUNT:
+        raise ValueError(f"❌ Action hors de l'espace d'actions : {action}")
+    slot_actions = len(SLOT_ACTIONS) * MAX_SLOTS
+    if action >= slot_actions:
+        return FLAT_ACTIONS[action - slot_actions], -1
+    return SLOT_ACTIONS[action // MAX_SLOTS], action % MAX_SLOTS
+
+
+def legal_action_mask(game, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Masque booléen (ACTION_COUNT,) des coups légaux de la position."""
+    if out is None:
+        out = np.zeros(ACTION_COUNT, dtype=bool)
+    else:
+        out[:] = False
+    moves = game.get_legal_moves()
+    if moves:
+        out[[move_to_action(m) for m in moves]] = True
+    return out
+
+
+# =============================================================================
+#  DISPOSITION DU VECTEUR
+# =============================================================================
+
+SCALARS = ("me_hp", "me_mindbugs", "me_hand", "me_deck",
+           "opp_hp", "opp_mindbugs", "opp_hand", "opp_deck", "deck", "turn")
+# Zones dont la composition est visible par le joueur (comptes par id)
+COUNT_ZONES = ("me_hand", "me_board", "me_discard", "opp_board", "opp_discard")
+
+
+def _build_layout():
+    widths = [("scalars", len(SCALARS)),
+              ("phase", len(PHASES)),
+              ("flags", 4),  # je suis actif, je dois agir, sélection en cours, Furie en attente
+              ("request_reason", len(REQUEST_REASONS)),
+              ("request_count", 1)]
+    widths += [(f"count_{zone}", CARD_COLUMNS) for zone in COUNT_ZONES]
+    widths += [("hand_slots", MAX_SLOTS * CARD_COLUMNS)]
+    for side in ("me", "opp"):
+        widths += [(f"{side}_board_slots", MAX_SLOTS * CARD_COLUMNS),
+                   (f"{side}_board_power", MAX_SLOTS),
+                   (f"{side}_board_damaged", MAX_SLOTS),
+                   (f"{side}_board_keywords", MAX_SLOTS * len(Keyword))]
+    widths += [("pending_card", CARD_COLUMNS),
+               ("pending_attacker", 2 * MAX_SLOTS)]  # emplacement : mon plateau puis le sien
+
+    layout, offset = {}, 0
+    for name, width in widths:
+        layout[name] = (offset, width)
+        offset += width
+    return layout, offset
+
+
+OBSERVATION_LAYOUT, OBSERVATION_SIZE = _build_layout()
+
+
+def _off(name: str) -> int:
+    return OBSERVATION_LAYOUT[name][0]
+
+
+def _card_index(card) -> int:
+    return CARD_INDEX.get(card.id, _UNKNOWN_CARD)
+
+
+# =============================================================================
+#  ENCODAGE
+# =============================================================================
+
+class _Gathered:
+    """Relevé brut d'un batch : uniquement des tableaux d'entiers / flottants."""
+
+    def __init__(self, n: int):
+        self.scalars = np.zeros((n, len(SCALARS)), dtype=np.float32)
+        self.phase = np.zeros(n, dtype=np.intp)
+        self.flags = np.zeros((n, 4), dtype=np.float32)
+        self.reason = np.full(n, -1, dtype=np.intp)
+        self.request_count = np.zeros(n, dtype=np.float32)
+        # Ids par zone visible (-1 = emplacement vide) ; ordre : COUNT_ZONES
+        self.zone_ids = np.full((n, len(COUNT_ZONES), MAX_SLOTS), -1, dtype=np.intp)
+        # Plateaux (moi, adversaire)
+        self.power = np.zeros((n, 2, MAX_SLOTS), dtype=np.float32)
+        self.damaged = np.zeros((n, 2, MAX_SLOTS), dtype=np.float32)
+        self.masks = np.zeros((n, 2, MAX_SLOTS), dtype=np.int64)
+        self.pending_card = np.full(n, -1, dtype=np.intp)
+        self.pending_attacker = np.full(n, -1, dtype=np.intp)
+
+    def collect(self, row: int, game, player_idx: int):
+        state = game.state
+        me, opp = (state.player1, state.player2) if player_idx == 0 else (state.player2, state.player1)
+
+        self.scalars[row] = (me.hp, me.mindbugs, len(me.hand), len(me.deck),
+                             opp.hp, opp.mindbugs, len(opp.hand), len(opp.deck),
+                             len(state.deck), state.turn_count)
+        self.phase[row] = _PHASE_INDEX[Phase(state.phase)]
+
+        req = state.active_request
+        self.flags[row, 0] = state.active_player_idx == player_idx
+        self.flags[row, 1] = game.state.acting_player_idx == player_idx
+        self.flags[row, 2] = req is not None
+        self.flags[row, 3] = state.frenzy_candidate is not None
+        if req is not None:
+            self.reason[row] = _REASON_INDEX.get(getattr(req.reason, "value", req.reason), -1)
+            self.request_count[row] = req.count
+
+        ids = self.zone_ids[row]
+        for z, zone in enumerate((me.hand, me.board, me.discard, opp.board, opp.discard)):
+            for s, card in enumerate(zone[:MAX_SLOTS]):
+                ids[z, s] = _card_index(card)
+
+        for side, player in enumerate((me, opp)):
+            for s, card in enumerate(player.board[:MAX_SLOTS]):
+                self.power[row, side, s] = card.power
+                self.damaged[row, side, s] = card.is_damaged
+                self.masks[row, side, s] = mask_of(card)
+
+        if state.pending_card is not None:
+            self.pending_card[row] = _card_index(state.pending_card)
+        attacker = state.pending_attacker
+        if attacker is not None:
+            for side, player in enumerate((me, opp)):
+                for s, card in enumerate(player.board[:MAX_SLOTS]):
+                    if card is attacker:
+                        self.pending_attacker[row] = side * MAX_SLOTS + s
+
+    def fill(self, out: np.ndarray):
+        n = len(out)
+        rows = np.arange(n)
+        out[:] = 0.0
+
+        o = _off("scalars")
+        out[:, o:o + len(SCALARS)] = self.scalars
+        out[rows, _off("phase") + self.phase] = 1.0
+        o = _off("flags")
+        out[:, o:o + 4] = self.flags
+        has_reason = self.reason >= 0
+        out[rows[has_reason], _off("request_reason") + self.reason[has_reason]] = 1.0
+        out[:, _off("request_count")] = self.request_count
+
+        # Comptes par id : une colonne par carte, np.add.at pour les copies multiples
+        r, z, s = np.nonzero(self.zone_ids >= 0)
+        card = self.zone_ids[r, z, s]
+        count_offsets = np.array([_off(f"count_{zone}") for zone in COUNT_ZONES])
+        np.add.at(out, (r, count_offsets[z] + card), 1.0)
+
+        # Emplacements : id one-hot (main = zone 0, plateaux = zones 1 et 3)
+        slot_offsets = {0: _off("hand_slots"), 1: _off("me_board_slots"), 3: _off("opp_board_slots")}
+        for zone, base in slot_offsets.items():
+            sel = z == zone
+            out[r[sel], base + s[sel] * CARD_COLUMNS + card[sel]] = 1.0
+
+        kw_count = len(_KEYWORD_SHIFTS)
+        bits = ((self.masks[..., None] >> _KEYWORD_SHIFTS) & 1).astype(np.float32)
+        for side, name in enumerate(("me", "opp")):
+            o = _off(f"{name}_board_power")
+            out[:, o:o + MAX_SLOTS] = self.power[:, side]
+            o = _off(f"{name}_board_damaged")
+            out[:, o:o + MAX_SLOTS] = self.damaged[:, side]
+            o = _off(f"{name}_board_keywords")
+            out[:, o:o + MAX_SLOTS * kw_count] = bits[:, side].reshape(n, -1)
+
+        has_card = self.pending_card >= 0
+        out[rows[has_card], _off("pending_card") + self.pending_card[has_card]] = 1.0
+        has_attacker = self.pending_attacker >= 0
+        out[rows[has_attacker], _off("pending_attacker") + self.pending_attacker[has_attacker]] = 1.0
+
+
+def encode_batch(games: Sequence, player_indices: Optional[Sequence[int]] = None,
+                 out: Optional[np.ndarray] = None,
+                 masks: Optional[np.ndarray] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Encode N parties dans `out` (N, OBSERVATION_SIZE) float32, préalloué ou créé.
+    player_indices : point de vue de chaque ligne (défaut : le joueur qui doit agir).
+    masks : tableau (N, ACTION_COUNT) bool à remplir avec les coups légaux (optionnel).
+    Retourne (out, masks).
+    """
+    n = len(games)
+    if out is None:
+        out = np.empty((n, OBSERVATION_SIZE), dtype=np.float32)
+    elif out.shape != (n, OBSERVATION_SIZE):
+        raise ValueError(f"❌ Tableau de sortie {out.shape}, attendu {(n, OBSERVATION_SIZE)}")
+
+    gathered = _Gathered(n)
+    for row, game in enumerate(games):
+        idx = game.state.acting_player_idx if player_indices is None else player_indices[row]
+        gathered.collect(row, game, idx)
+    gathered.fill(out)
+
+    if masks is not None:
+        for row, game in enumerate(games):
+            legal_action_mask(game, masks[row])
+    return out, masks
+
+
+def encode(game, player_idx: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Vecteur (OBSERVATION_SIZE,) float32 et masque (ACTION_COUNT,) bool d'une partie."""
+    obs, masks = encode_batch([game], None if player_idx is None else [player_idx],
+                              masks=np.zeros((1, ACTION_COUNT), dtype=bool))
+    return obs[0], masks[0]
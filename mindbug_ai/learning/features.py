@@ -0,0 +1,44 @@
+"""
+Vecteur de caractéristiques d'une position, du point de vue d'un joueur.
+
+Par camp (moi, puis l'adversaire) : PV, Mindbugs, taille de main, taille de
+pioche, nombre de créatures, puissance totale du plateau, nombre de créatures
+portant chaque mot-clé. Puis 1.0 si c'est au joueur de jouer.
+"""
+from typing import List
+
+import numpy as np
+
+from mindbug_engine.core.consts import Keyword, KEYWORD_BITS
+
+SIDE_FEATURES = ["hp", "mindbugs", "hand", "deck", "creatures", "power"] + \
+                [f"kw_{kw.value.lower()}" for kw in Keyword]
+FEATURE_NAMES = [f"me_{n}" for n in SIDE_FEATURES] + \
+                [f"opp_{n}" for n in SIDE_FEATURES] + ["my_turn"]
+FEATURE_COUNT = len(FEATURE_NAMES)
+
+_KEYWORD_BITS = [KEYWORD_BITS[kw.value] for kw in Keyword]
+
+
+def _side_features(player) -> List[float]:
+    board = player.board
+    power = 0
+    kw_counts = [0] * len(_KEYWORD_BITS)
+    for card in board:
+        power += card.power
+        mask = card.keyword_mask
+        if mask:
+            for i, bit in enumerate(_KEYWORD_BITS):
+                if mask & bit:
+                    kw_counts[i] += 1
+    return [player.hp, player.mindbugs, len(player.hand), len(player.deck),
+            len(board), power] + kw_counts
+
+
+def position_features(game, player_idx: int) -> np.ndarray:
+    """Caractéristiques (float32, FEATURE_COUNT) du point de vue de `player_idx`."""
+    state = game.state
+    me, opp = (state.player1, state.player2) if player_idx == 0 else (state.player2, state.player1)
+    values = _side_features(me) + _side_features(opp)
+    values.append(1.0 if state.active_player_idx == player_idx else 0.0)
+    return np.asarray(values, dtype=np.float32)
@@ -0,0 +1,42 @@
+"""
+Génère un jeu de données d'auto-jeu en fragments memmap (reprise automatique).
+
+    python -m mindbug_ai.learning.generate_shards data/selfplay --games 10000 --workers 8
+"""
+import argparse
+import os
+import time
+
+from mindbug_ai.learning.shards import generate_shards
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Génération de fragments d'auto-jeu Mindbug")
+    parser.add_argument("directory", help="Dossier de sortie (reprise si un manifeste existe)")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="Graine de la première partie")
+    parser.add_argument("--agent", choices=("heuristic", "mcts"), default="heuristic")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processus de jeu (0 : processus courant)")
+    parser.add_argument("--chunk-games", type=int, default=16, help="Parties par lot (unité de reprise)")
+    parser.add_argument("--shard-size", type=int, default=65536, help="Lignes par fragment")
+    parser.add_argument("--randomness", type=float, default=0.1, help="Coups aléatoires (agent heuristique)")
+    parser.add_argument("--time", type=float, default=0.05, help="Temps de recherche par coup (agent MCTS)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+
+    def progress(manifest):
+        elapsed = time.perf_counter() - t0
+        print(f"\r🎲 {manifest['games']}/{args.games} parties, {manifest['positions']} positions "
+              f"({elapsed:.0f}s)", end="", flush=True)
+
+    manifest = generate_shards(args.directory, args.games, seed=args.seed, agent=args.agent,
+                               workers=args.workers, chunk_games=args.chunk_games,
+                               shard_size=args.shard_size, randomness=args.randomness,
+                               simulation_time=args.time, progress=progress)
+    print(f"\n💾 {manifest['positions']} positions dans {len(manifest['shards'])} fragment(s) : {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
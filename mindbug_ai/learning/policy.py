@@ -0,0 +1,257 @@
+"""
+Politique de rollout apprise : softmax linéaire sur des caractéristiques par coup.
+
+P(coup) = softmax(features(coup) . w / T), un vecteur de caractéristiques par
+coup légal. Les poids sont ajustés (NumPy pur, entropie croisée + L2) sur les
+distributions de visites de la racine MCTS enregistrées pendant des parties.
+En rollout, les logits sont calculés depuis les caractéristiques creuses de
+chaque coup (sans matrice) ; la part des colonnes carte est mémoïsée.
+"""
+import json
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from mindbug_engine.core.consts import Keyword, KEYWORD_BITS, Phase
+from mindbug_engine.core.models import mask_of
+from mindbug_ai.heuristic.agent import BENEFICIAL_CHOICES, selected_card
+from mindbug_ai.heuristic.values import CardValues
+from mindbug_ai.mcts.priors import HeuristicPrior
+
+_ACTION_TYPES = ["PLAY", "ATTACK", "BLOCK", "NO_BLOCK", "MINDBUG", "PASS", "SELECT_OWN", "SELECT_OPP"]
+_ACTION_INDEX = {name: i for i, name in enumerate(_ACTION_TYPES)}
+
+MOVE_FEATURE_NAMES = [f"is_{a.lower()}" for a in _ACTION_TYPES] + \
+                     ["heuristic", "card_value", "card_power"] + \
+                     [f"kw_{kw.value.lower()}" for kw in Keyword] + \
+                     ["select_gain", "mindbug_left", "mindbug_opp_hand", "no_block_low_hp"]
+MOVE_FEATURE_COUNT = len(MOVE_FEATURE_NAMES)
+
+# Colonnes de la matrice de caractéristiques
+_COLUMN = {name: i for i, name in enumerate(MOVE_FEATURE_NAMES)}
+_HEURISTIC_COL = _COLUMN["heuristic"]
+# Attributs de la carte désignée : valeur, puissance, mots-clés (colonnes contiguës)
+_CARD_COLS = slice(_COLUMN["card_value"], _COLUMN["card_value"] + 2 + len(Keyword))
+_SELECT_GAIN_COL = _COLUMN["select_gain"]
+_MINDBUG_LEFT_COL = _COLUMN["mindbug_left"]
+_MINDBUG_OPP_HAND_COL = _COLUMN["mindbug_opp_hand"]
+_NO_BLOCK_LOW_HP_COL = _COLUMN["no_block_low_hp"]
+
+# Colonnes mots-clés pour chacun des 32 masques
+_KEYWORD_ROWS = [tuple(1.0 if mask & KEYWORD_BITS[kw.value] else 0.0 for kw in Keyword)
+                 for mask in range(1 << len(Keyword))]
+
+# Les scores heuristiques viennent du prior MCTS (tactique à un coup)
+_HEURISTIC = HeuristicPrior()
+
+# (id, puissance, masque) -> (valeur / 10, colonnes _CARD_COLS) : les attributs
+# d'une carte ne changent qu'avec sa puissance ou ses mots-clés
+_CARD_ATTRIBUTES: Dict[Tuple[str, int, int], Tuple[float, Tuple[float, ...]]] = {}
+
+
+def _action_type(action: str) -> str:
+    if action.startswith("SELECT_OPP"):
+        return "SELECT_OPP"
+    if action.startswith("SELECT_"):
+        return "SELECT_OWN"
+    return action
+
+
+def _card_attributes(card) -> Tuple[float, Tuple[float, ...]]:
+    mask = mask_of(card)
+    key = (card.id, card.power, mask)
+    attributes = _CARD_ATTRIBUTES.get(key)
+    if attributes is None:
+        value = CardValues.value(card) / 10.0
+        attributes = _CARD_ATTRIBUTES[key] = (value, (value, card.power / 10.0) + _KEYWORD_ROWS[mask])
+    return attributes
+
+
+def _move_rows(game, moves: Sequence[Tuple[str, int]]):
+    """
+    Caractéristiques creuses de chaque coup : ([(colonne, valeur)...], attributs de
+    la carte désignée pour _CARD_COLS, ou None). Base de move_features et des logits.
+    """
+    state = game.state
+    ap = state.active_player
+    opp = state.player2 if ap is state.player1 else state.player1
+
+    req = state.active_request
+    selector = req.selector if req else ap
+    sel_opp = state.player2 if selector is state.player1 else state.player1
+    reason = getattr(req.reason, "value", req.reason) if req else None
+
+    heuristic = _HEURISTIC.scores(game, moves)
+    rows = []
+    for (action, idx), score in zip(moves, heuristic):
+        kind = _action_type(action)
+        entries = [(_ACTION_INDEX[kind], 1.0), (_HEURISTIC_COL, score)]
+
+        card = None
+        if kind == "PLAY" and 0 <= idx < len(ap.hand):
+            card = ap.hand[idx]
+        elif kind in ("ATTACK", "BLOCK") and 0 <= idx < len(ap.board):
+            card = ap.board[idx]
+        elif kind == "MINDBUG":
+            card = state.pending_card
+        elif kind.startswith("SELECT"):
+            card = selected_card((action, idx), selector, sel_opp)
+
+        attributes = None
+        if card is not None:
+            value, attributes = _card_attributes(card)
+            if kind.startswith("SELECT"):
+                # Effet favorable : la meilleure carte ; sinon frapper l'adversaire
+                favorable = reason in BENEFICIAL_CHOICES or kind == "SELECT_OPP"
+                entries.append((_SELECT_GAIN_COL, value if favorable else -value))
+
+        if kind == "MINDBUG":
+            entries.append((_MINDBUG_LEFT_COL, ap.mindbugs))
+            entries.append((_MINDBUG_OPP_HAND_COL, len(opp.hand) / 5.0))
+        elif kind == "NO_BLOCK" and state.phase == Phase.BLOCK_DECISION:
+            entries.append((_NO_BLOCK_LOW_HP_COL, 1.0 if ap.hp <= 1 else 0.0))
+        rows.append((entries, attributes))
+    return rows
+
+
+def move_features(game, moves: Sequence[Tuple[str, int]]) -> np.ndarray:
+    """Matrice (len(moves), MOVE_FEATURE_COUNT) float32 : une ligne par coup légal."""
+    features = np.zeros((len(moves), MOVE_FEATURE_COUNT), dtype=np.float32)
+    for row, (entries, attributes) in enumerate(_move_rows(game, moves)):
+        f = features[row]
+        for col, value in entries:
+            f[col] = value
+        if attributes is not None:
+            f[_CARD_COLS] = attributes
+    return features
+
+
+def _group_softmax(logits: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Softmax indépendante sur chaque segment [starts[i], starts[i+1])."""
+    sizes = np.diff(np.append(starts, len(logits)))
+    shifted = logits - np.repeat(np.maximum.reduceat(logits, starts), sizes)
+    exp = np.exp(shifted)
+    return exp / np.repeat(np.add.reduceat(exp, starts), sizes)
+
+
+class SoftmaxPolicy:
+
+    def __init__(self, weights, temperature: float = 1.0, feature_names: Optional[List[str]] = None):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.temperature = temperature
+        self.feature_names = list(feature_names or MOVE_FEATURE_NAMES)
+        if len(self.weights) != len(self.feature_names):
+            raise ValueError(f"❌ {len(self.weights)} poids pour {len(self.feature_names)} caractéristiques")
+        # Rollouts : poids / température en flottants Python, et part des colonnes
+        # carte du logit mémoïsée par attributs (politique figée après construction)
+        self._scaled = (self.weights / temperature).tolist()
+        self._card_logits: Dict[Tuple[float, ...], float] = {}
+
+    # =========================================================================
+    #  POLITIQUE
+    # =========================================================================
+
+    def logits(self, game, moves: Sequence[Tuple[str, int]]) -> List[float]:
+        """features(coup) . w / T pour chaque coup, sans construire la matrice."""
+        w = self._scaled
+        card_logits = self._card_logits
+        result = []
+        for entries, attributes in _move_rows(game, moves):
+            z = 0.0
+            for col, value in entries:
+                z += w[col] * value
+            if attributes is not None:
+                card = card_logits.get(attributes)
+                if card is None:
+                    card = card_logits[attributes] = sum(a * b for a, b in zip(w[_CARD_COLS], attributes))
+                z += card
+            result.append(z)
+        return result
+
+    def probabilities(self, game, moves: Sequence[Tuple[str, int]]) -> np.ndarray:
+        logits = np.asarray(self.logits(game, moves))
+        exp = np.exp(logits - logits.max())
+        return exp / exp.sum()
+
+    def sample(self, game, moves: Sequence[Tuple[str, int]], rng=random) -> Optional[Tuple[str, int]]:
+        """Tire un coup selon la politique (rng : module random ou random.Random)."""
+        if not moves:
+            return None
+        if len(moves) == 1:
+            return moves[0]
+        logits = self.logits(game, moves)
+        top = max(logits)
+        weights = [math.exp(z - top) for z in logits]
+        r = rng.random() * sum(weights)
+        for move, weight in zip(moves, weights):
+            r -= weight
+            if r <= 0:
+                return move
+        return moves[-1]
+
+    # =========================================================================
+    #  ENTRAÎNEMENT
+    # =========================================================================
+
+    @staticmethod
+    def _stack(samples):
+        X = np.concatenate([s[0] for s in samples]).astype(np.float64)
+        targets = np.concatenate([s[1] for s in samples]).astype(np.float64)
+        starts = np.cumsum([0] + [len(s[0]) for s in samples[:-1]])
+        return X, targets, starts
+
+    @classmethod
+    def fit(cls, samples: List[Tuple[np.ndarray, np.ndarray]], epochs: int = 300, lr: float = 0.5,
+            l2: float = 1e-3) -> 'SoftmaxPolicy':
+        """
+        samples : liste de (features (n_coups, d), cible (n_coups,)) où la cible est
+        la distribution des visites MCTS (somme = 1). Descente de gradient batch.
+        """
+        samples = [s for s in samples if len(s[0])]
+        if not samples:
+            raise ValueError("❌ Jeu de données vide.")
+        X, targets, starts = cls._stack(samples)
+
+        # Seule l'échelle compte : un décalage constant s'annule dans la softmax
+        std = X.std(axis=0)
+        std[std == 0] = 1.0
+        Z = X / std
+
+        w = np.zeros(Z.shape[1])
+        for _ in range(epochs):
+            probs = _group_softmax(Z @ w, starts)
+            w -= lr * (Z.T @ (probs - targets) / len(samples) + l2 * w)
+        return cls(w / std)
+
+    def cross_entropy(self, samples: List[Tuple[np.ndarray, np.ndarray]]) -> float:
+        X, targets, starts = self._stack(samples)
+        probs = np.clip(_group_softmax(X @ self.weights, starts), 1e-9, 1.0)
+        return float(-np.sum(targets * np.log(probs)) / len(samples))
+
+    def agreement(self, samples: List[Tuple[np.ndarray, np.ndarray]]) -> float:
+        """Part des positions où le coup le plus probable est le plus visité."""
+        hits = [np.argmax(X @ self.weights) == np.argmax(t) for X, t in samples]
+        return float(np.mean(hits)) if hits else math.nan
+
+    # =========================================================================
+    #  PERSISTANCE (JSON)
+    # =========================================================================
+
+    def to_dict(self) -> dict:
+        return {"features": self.feature_names,
+                "weights": [float(w) for w in self.weights],
+                "temperature": self.temperature}
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'SoftmaxPolicy':
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("features") != MOVE_FEATURE_NAMES:
+            raise ValueError(f"❌ Politique incompatible avec les caractéristiques actuelles : {path}")
+        return cls(data["weights"], data.get("temperature", 1.0), data["features"])
@@ -0,0 +1,124 @@
+"""
+Génération de parties en auto-jeu (sans interface) et extraction des jeux de
+données d'apprentissage :
+- valeur : une ligne par position et par point de vue, étiquetée 1.0 si ce
+  joueur a gagné la partie ;
+- politique : à chaque décision d'un agent MCTS, les caractéristiques des coups
+  légaux et la distribution des visites de la racine.
+"""
+import contextlib
+import io
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.utils.logger import silenced
+from mindbug_ai.interface import AgentInterface
+from mindbug_ai.heuristic.agent import HeuristicAgent
+from mindbug_ai.mcts.agent import MCTSAgent
+from mindbug_ai.learning.features import FEATURE_COUNT, position_features
+from mindbug_ai.learning.policy import move_features
+
+# Garde-fou : une partie d'auto-jeu ne dépasse jamais ce nombre d'actions
+MAX_GAME_STEPS = 500
+
+
+def play_game(seed: int, agents, on_position: Optional[Callable] = None,
+              max_steps: int = MAX_GAME_STEPS) -> MindbugGame:
+    """
+    Joue une partie depuis la position de départ `seed` et la retourne, terminée
+    ou coupée après `max_steps` coups.
+    `agents[i]` joue pour le joueur i (y compris ses sélections pendant le tour
+    adverse) ; `on_position(game)` est appelé avant chaque coup.
+    """
+    game = MindbugGame.start_headless(seed=seed)
+    for _ in range(max_steps):
+        if not game.get_legal_moves():
+            break
+        if on_position:
+            on_position(game)
+        move = agents[game.state.acting_player_idx].get_action(game)
+        game.step(move[0], move[1])
+    return game
+
+
+def generate_dataset(games: int, seed: int = 0, randomness: float = 0.2,
+                     agents_factory: Optional[Callable] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Joue `games` parties et renvoie (X, y) : X (n, FEATURE_COUNT) float32, y (n,) float32.
+    Par défaut, deux HeuristicAgent bruités (diversité des positions).
+    """
+    if agents_factory is None:
+        def agents_factory(game_seed):
+            return [HeuristicAgent(randomness, seed=game_seed * 2 + i) for i in range(2)]
+
+    rows: List[np.ndarray] = []
+    labels: List[float] = []
+    with silenced():
+        for game_seed in range(seed, seed + games):
+            positions: List[np.ndarray] = []
+
+            def record(game):
+                positions.append(position_features(game, 0))
+                positions.append(position_features(game, 1))
+
+            game = play_game(game_seed, agents_factory(game_seed), on_position=record)
+            if game.state.winner is None:
+                continue
+            winner = 0 if game.state.winner is game.state.player1 else 1
+            rows.extend(positions)
+            # Lignes alternées : point de vue du joueur 0, puis du joueur 1
+            labels.extend(float(i % 2 == winner) for i in range(len(positions)))
+
+    if not rows:
+        return np.zeros((0, FEATURE_COUNT), dtype=np.float32), np.zeros(0, dtype=np.float32)
+    return np.stack(rows), np.asarray(labels, dtype=np.float32)
+
+
+class SearchRecorder(AgentInterface):
+    """
+    Enveloppe un MCTSAgent : joue ses coups et enregistre, à chaque recherche,
+    (caractéristiques des coups légaux, visites normalisées de la racine).
+    """
+
+    def __init__(self, agent: MCTSAgent, samples: Optional[List[Tuple[np.ndarray, np.ndarray]]] = None):
+        self.agent = agent
+        self.samples = samples if samples is not None else []
+
+    @property
+    def name(self) -> str:
+        return self.agent.name
+
+    def get_action(self, game):
+        moves = game.get_legal_moves(self.agent.prune_equivalent)
+        if len(moves) < 2:
+            return self.agent.get_action(game)
+
+        features = move_features(game, moves)
+        move = self.agent.get_action(game)
+        root = self.agent.root
+        # Pas d'arbre (solveur exact) : rien à apprendre de cette décision
+        if root is not None and root.children:
+            visits = {child.move: child.visits for child in root.children}
+            target = np.asarray([visits.get(m, 0) for m in moves], dtype=np.float32)
+            if target.sum() > 0:
+                self.samples.append((features, target / target.sum()))
+        return move
+
+
+def generate_policy_dataset(games: int, seed: int = 0, simulation_time: float = 0.05,
+                            agent_kwargs: Optional[dict] = None) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Arène MCTS contre MCTS : renvoie une liste de (features (n_coups, d), visites (n_coups,)).
+    Les parties non conclues sont conservées (les visites restent des cibles valides).
+    """
+    samples: List[Tuple[np.ndarray, np.ndarray]] = []
+    kwargs = dict(agent_kwargs or {})
+    kwargs.setdefault("simulation_time", simulation_time)
+    # Les agents MCTS affichent chaque décision : inutile en génération de masse
+    with silenced(), contextlib.redirect_stdout(io.StringIO()):
+        for game_seed in range(seed, seed + games):
+            agents = [SearchRecorder(MCTSAgent(**kwargs), samples) for _ in range(2)]
+            play_game(game_seed, agents)
+    return samples
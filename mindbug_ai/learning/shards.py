@@ -0,0 +1,330 @@
+"""
+Jeu de données d'auto-jeu en fragments .npy de taille fixe (lus en memmap).
+
+Une ligne par décision : position encodée (vue du joueur qui agit), masque des
+coups légaux, politique cible (visites MCTS, ou le coup joué pour les agents
+sans recherche), joueur, issue finale pour ce joueur (+1 / -1 / 0), graine de
+la partie et numéro du coup.
+
+Organisation du dossier :
+- shard_00000_<champ>.npy ... : un fichier par champ et par fragment de shard_size lignes ;
+- manifest.json : paramètres, lignes remplies par fragment, lots de parties terminés
+  ([lot, première graine, graine de fin exclue]).
+
+La génération répartit des lots de parties (chunk_games graines consécutives)
+sur un pool de processus ; chaque lot est écrit dans les fragments puis inscrit
+au manifeste avec ses graines (écriture atomique). Relancer la même commande
+reprend aux graines manquantes : un lot interrompu est simplement rejoué.
+Augmenter --games prolonge le jeu de données existant, y compris le dernier lot
+s'il était incomplet (seules ses nouvelles graines sont jouées).
+"""
+import contextlib
+import io
+import json
+import math
+import multiprocessing as mp
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.utils.logger import silenced
+from mindbug_ai.heuristic.agent import HeuristicAgent
+from mindbug_ai.interface import AgentInterface
+from mindbug_ai.learning.encoder import ACTION_COUNT, OBSERVATION_SIZE, encode, move_to_action
+from mindbug_ai.learning.selfplay import MAX_GAME_STEPS
+from mindbug_ai.mcts.agent import MCTSAgent
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 2
+
+# Champ -> (forme par ligne, dtype)
+FIELDS = {
+    "obs": ((OBSERVATION_SIZE,), "float32"),
+    "mask": ((ACTION_COUNT,), "bool"),
+    "policy": ((ACTION_COUNT,), "float32"),
+    "player": ((), "int8"),
+    "outcome": ((), "float32"),
+    "game": ((), "int64"),
+    "ply": ((), "int16"),
+}
+
+
+def shard_path(directory: str, shard: int, field: str) -> str:
+    return os.path.join(directory, f"shard_{shard:05d}_{field}.npy")
+
+
+# =============================================================================
+#  AUTO-JEU (côté processus de travail)
+# =============================================================================
+
+def make_agent(kind: str, seed: int, randomness: float = 0.1, simulation_time: float = 0.05) -> AgentInterface:
+    if kind == "heuristic":
+        return HeuristicAgent(randomness, seed=seed)
+    if kind == "mcts":
+        return MCTSAgent(simulation_time=simulation_time)
+    raise ValueError(f"❌ Agent inconnu : {kind}")
+
+
+def _policy_target(agent, search_moves, move) -> np.ndarray:
+    """Visites de la racine MCTS si une recherche a eu lieu, sinon le coup joué."""
+    policy = np.zeros(ACTION_COUNT, dtype=np.float32)
+    root = getattr(agent, "root", None)
+    if len(search_moves) > 1 and root is not None and root.children:
+        for child in root.children:
+            policy[move_to_action(child.move)] = child.visits
+        total = policy.sum()
+        if total > 0:
+            return policy / total
+        policy[:] = 0.0
+    policy[move_to_action(move)] = 1.0
+    return policy
+
+
+def play_recorded_game(seed: int, agents) -> Dict[str, np.ndarray]:
+    """Joue une partie et renvoie ses lignes (un tableau par champ de FIELDS)."""
+    game = MindbugGame.start_headless(seed=seed)
+    rows = {name: [] for name in FIELDS}
+    for ply in range(MAX_GAME_STEPS):
+        moves = game.get_legal_moves()
+        if not moves:
+            break
+        player = game.state.acting_player_idx
+        agent = agents[player]
+        obs, mask = encode(game, player)
+        search_moves = game.get_legal_moves(getattr(agent, "prune_equivalent", False))
+        move = agent.get_action(game)
+
+        rows["obs"].append(obs)
+        rows["mask"].append(mask)
+        rows["policy"].append(_policy_target(agent, search_moves, move))
+        rows["player"].append(player)
+        rows["ply"].append(ply)
+        game.step(move[0], move[1])
+
+    winner = game.state.winner
+    winner_idx = None if winner is None else (0 if winner is game.state.player1 else 1)
+    players = np.asarray(rows["player"], dtype=np.int8)
+    if winner_idx is None:
+        outcome = np.zeros(len(players), dtype=np.float32)
+    else:
+        outcome = np.where(players == winner_idx, 1.0, -1.0).astype(np.float32)
+
+    n = len(players)
+    result = {}
+    for name, (shape, dtype) in FIELDS.items():
+        if name == "outcome":
+            result[name] = outcome
+        elif name == "game":
+            result[name] = np.full(n, seed, dtype=dtype)
+        elif n:
+            result[name] = np.asarray(rows[name], dtype=dtype).reshape((n,) + shape)
+        else:
+            result[name] = np.zeros((0,) + shape, dtype=dtype)
+    return result
+
+
+def _play_chunk(task):
+    chunk, seeds, agent_kind, randomness, simulation_time = task
+    parts = []
+    # Les agents MCTS affichent chaque décision : inutile en génération de masse
+    with silenced(), contextlib.redirect_stdout(io.StringIO()):
+        for seed in seeds:
+            agents = [make_agent(agent_kind, seed * 2 + i, randomness, simulation_time) for i in range(2)]
+            parts.append(play_recorded_game(seed, agents))
+    return chunk, seeds, {name: np.concatenate([p[name] for p in parts]) for name in FIELDS}
+
+
+# =============================================================================
+#  ÉCRITURE
+# =============================================================================
+
+class ShardWriter:
+    """Ajoute des lignes dans les fragments memmap d'un dossier (manifeste compris)."""
+
+    def __init__(self, directory: str, shard_size: int = 65536, params: Optional[dict] = None):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, MANIFEST)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+            if self.manifest.get("version") != FORMAT_VERSION:
+                raise ValueError(f"❌ Version de manifeste non supportée : {path}")
+            if params is not None and self.manifest.get("params") != params:
+                raise ValueError(f"❌ Paramètres différents du manifeste existant : {self.manifest.get('params')}")
+        else:
+            self.manifest = {
+                "version": FORMAT_VERSION,
+                "shard_size": shard_size,
+                "fields": {name: [list(shape), dtype] for name, (shape, dtype) in FIELDS.items()},
+                "params": params or {},
+                "shards": [],
+                "chunks_done": [],
+                "positions": 0,
+                "games": 0,
+            }
+        self.shard_size = self.manifest["shard_size"]
+        self._open = None  # (index du fragment, {champ: memmap})
+
+    @property
+    def seeds_done(self):
+        """Graines des parties déjà écrites, tous lots confondus."""
+        return {s for _, first, end in self.manifest["chunks_done"] for s in range(first, end)}
+
+    def _shard(self, index: int):
+        if self._open is not None and self._open[0] == index:
+            return self._open[1]
+        self._close_shard()
+        shards = self.manifest["shards"]
+        if index == len(shards):
+            shards.append({"rows": 0})
+            mode = "w+"
+        else:
+            mode = "r+"
+        arrays = {}
+        for name, (shape, dtype) in FIELDS.items():
+            path = shard_path(self.directory, index, name)
+            if mode == "w+":
+                arrays[name] = np.lib.format.open_memmap(path, mode="w+", dtype=dtype,
+                                                         shape=(self.shard_size,) + shape)
+            else:
+                arrays[name] = np.load(path, mmap_mode="r+")
+        self._open = (index, arrays)
+        return arrays
+
+    def _close_shard(self):
+        if self._open is not None:
+            for arr in self._open[1].values():
+                arr.flush()
+            self._open = None
+
+    def append(self, rows: Dict[str, np.ndarray]):
+        """Écrit les lignes à la suite (en débordant sur de nouveaux fragments au besoin)."""
+        n = len(rows["player"])
+        done = 0
+        while done < n:
+            shards = self.manifest["shards"]
+            index = len(shards) - 1 if shards and shards[-1]["rows"] < self.shard_size else len(shards)
+            arrays = self._shard(index)
+            start = self.manifest["shards"][index]["rows"]
+            take = min(n - done, self.shard_size - start)
+            for name in FIELDS:
+                arrays[name][start:start + take] = rows[name][done:done + take]
+            self.manifest["shards"][index]["rows"] = start + take
+            done += take
+        self.manifest["positions"] += n
+
+    def commit_chunk(self, chunk: int, seeds):
+        """Vide les fragments sur disque puis inscrit le lot et ses graines (consécutives) au manifeste (atomique)."""
+        if self._open is not None:
+            for arr in self._open[1].values():
+                arr.flush()
+        self.manifest["chunks_done"].append([chunk, seeds[0], seeds[-1] + 1])
+        self.manifest["games"] += len(seeds)
+        path = os.path.join(self.directory, MANIFEST)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1)
+        os.replace(tmp, path)
+
+    def close(self):
+        self._close_shard()
+
+
+def generate_shards(directory: str, games: int, seed: int = 0, agent: str = "heuristic",
+                    workers: int = 0, chunk_games: int = 16, shard_size: int = 65536,
+                    randomness: float = 0.1, simulation_time: float = 0.05,
+                    progress=None) -> dict:
+    """
+    Génère (ou complète) le jeu de données de `games` parties dans `directory`.
+    workers=0 : dans le processus courant. Retourne le manifeste.
+    """
+    # Le nombre de parties n'en fait pas partie : on peut prolonger un jeu de données
+    params = {"seed": seed, "agent": agent, "chunk_games": chunk_games,
+              "randomness": randomness, "simulation_time": simulation_time}
+    writer = ShardWriter(directory, shard_size, params)
+    done = writer.seeds_done
+    tasks = []
+    for chunk in range(math.ceil(games / chunk_games)):
+        first = seed + chunk * chunk_games
+        # Lot déjà écrit : seules les graines ajoutées depuis (dernier lot agrandi) restent à jouer
+        seeds = [s for s in range(first, min(first + chunk_games, seed + games)) if s not in done]
+        if seeds:
+            tasks.append((chunk, seeds, agent, randomness, simulation_time))
+
+    try:
+        if workers:
+            with mp.get_context().Pool(workers) as pool:
+                for chunk, seeds, rows in pool.imap_unordered(_play_chunk, tasks):
+                    writer.append(rows)
+                    writer.commit_chunk(chunk, seeds)
+                    if progress:
+                        progress(writer.manifest)
+        else:
+            for task in tasks:
+                chunk, seeds, rows = _play_chunk(task)
+                writer.append(rows)
+                writer.commit_chunk(chunk, seeds)
+                if progress:
+                    progress(writer.manifest)
+    finally:
+        writer.close()
+    return writer.manifest
+
+
+# =============================================================================
+#  LECTURE
+# =============================================================================
+
+class ShardDataset:
+    """
+    Accès aléatoire sans copie aux lignes d'un dossier de fragments.
+    dataset[i] -> {champ: vue memmap} ; dataset.batch(indices) -> {champ: tableau}.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.shard_size = self.manifest["shard_size"]
+        self._rows = [s["rows"] for s in self.manifest["shards"]]
+        self._offsets = np.cumsum([0] + self._rows)
+        self._arrays = {}
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def field(self, shard: int, name: str) -> np.ndarray:
+        """Fragment `shard` du champ `name`, ouvert en memmap (lignes remplies uniquement)."""
+        key = (shard, name)
+        if key not in self._arrays:
+            array = np.load(shard_path(self.directory, shard, name), mmap_mode="r")
+            self._arrays[key] = array[:self._rows[shard]]
+        return self._arrays[key]
+
+    def _locate(self, indices: np.ndarray):
+        indices = np.asarray(indices, dtype=np.int64)
+        if indices.size and (indices.min() < 0 or indices.max() >= len(self)):
+            raise IndexError("❌ Index de position hors du jeu de données")
+        shards = np.searchsorted(self._offsets, indices, side="right") - 1
+        return shards, indices - self._offsets[shards]
+
+    def __getitem__(self, index: int) -> Dict[str, np.ndarray]:
+        shards, rows = self._locate([index])
+        return {name: self.field(int(shards[0]), name)[rows[0]] for name in FIELDS}
+
+    def batch(self, indices) -> Dict[str, np.ndarray]:
+        shards, rows = self._locate(indices)
+        out = {name: np.empty((len(rows),) + tuple(shape), dtype=dtype)
+               for name, (shape, dtype) in FIELDS.items()}
+        for shard in np.unique(shards):
+            sel = shards == shard
+            for name in FIELDS:
+                out[name][sel] = self.field(int(shard), name)[rows[sel]]
+        return out
+
+    def sample(self, size: int, rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+        rng = rng or np.random.default_rng()
+        return self.batch(rng.integers(0, len(self), size))
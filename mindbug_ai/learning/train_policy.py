@@ -0,0 +1,46 @@
+"""
+Ajuste la politique de rollout softmax sur les visites MCTS d'une arène d'auto-jeu.
+
+    python -m mindbug_ai.learning.train_policy --games 200 --output data/rollout_policy.json
+"""
+import argparse
+import time
+
+import numpy as np
+
+from constants import PATH_ROLLOUT_POLICY
+from mindbug_ai.learning.policy import SoftmaxPolicy
+from mindbug_ai.learning.selfplay import generate_policy_dataset
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Entraînement de la politique de rollout Mindbug")
+    parser.add_argument("--games", type=int, default=200, help="Parties MCTS contre MCTS")
+    parser.add_argument("--seed", type=int, default=0, help="Graine de la première partie")
+    parser.add_argument("--time", type=float, default=0.05, help="Temps de recherche par coup (s)")
+    parser.add_argument("--epochs", type=int, default=500)
+    parser.add_argument("--lr", type=float, default=0.5)
+    parser.add_argument("--l2", type=float, default=1e-3)
+    parser.add_argument("--holdout", type=float, default=0.2, help="Part des décisions gardée pour la validation")
+    parser.add_argument("--output", default=PATH_ROLLOUT_POLICY)
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    samples = generate_policy_dataset(args.games, seed=args.seed, simulation_time=args.time)
+    print(f"🎲 {len(samples)} décisions en {time.perf_counter() - t0:.1f}s ({args.games} parties)")
+
+    split = int(len(samples) * (1 - args.holdout))
+    policy = SoftmaxPolicy.fit(samples[:split], epochs=args.epochs, lr=args.lr, l2=args.l2)
+    for label, subset in (("train", samples[:split]), ("valid", samples[split:])):
+        if subset:
+            print(f"   {label}: entropie croisée {policy.cross_entropy(subset):.4f}, "
+                  f"accord coup principal {policy.agreement(subset):.1%}")
+
+    policy.save(args.output)
+    top = np.argsort(-np.abs(policy.weights))[:5]
+    print("📈 Poids dominants : " + ", ".join(f"{policy.feature_names[i]}={policy.weights[i]:+.3f}" for i in top))
+    print(f"💾 Politique écrite dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
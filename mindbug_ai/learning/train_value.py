@@ -0,0 +1,47 @@
+"""
+Entraîne le modèle de valeur linéaire sur des parties d'auto-jeu.
+
+    python -m mindbug_ai.learning.train_value --games 2000 --output data/value_model.json
+"""
+import argparse
+import time
+
+import numpy as np
+
+from constants import PATH_VALUE_MODEL
+from mindbug_ai.learning.selfplay import generate_dataset
+from mindbug_ai.learning.value_model import LinearValueModel
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Entraînement du modèle de valeur Mindbug")
+    parser.add_argument("--games", type=int, default=2000, help="Parties d'auto-jeu")
+    parser.add_argument("--seed", type=int, default=0, help="Graine de la première partie")
+    parser.add_argument("--randomness", type=float, default=0.2,
+                        help="Part de coups aléatoires des agents (diversité)")
+    parser.add_argument("--epochs", type=int, default=300)
+    parser.add_argument("--lr", type=float, default=0.5)
+    parser.add_argument("--l2", type=float, default=1e-3)
+    parser.add_argument("--holdout", type=float, default=0.2, help="Part des positions gardée pour la validation")
+    parser.add_argument("--output", default=PATH_VALUE_MODEL)
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    X, y = generate_dataset(args.games, seed=args.seed, randomness=args.randomness)
+    print(f"🎲 {len(X)} positions en {time.perf_counter() - t0:.1f}s ({args.games} parties)")
+
+    # Découpage par ordre de génération : les dernières parties servent à la validation
+    split = int(len(X) * (1 - args.holdout))
+    model = LinearValueModel.fit(X[:split], y[:split], epochs=args.epochs, lr=args.lr, l2=args.l2)
+    for label, (Xs, ys) in (("train", (X[:split], y[:split])), ("valid", (X[split:], y[split:]))):
+        if len(Xs):
+            print(f"   {label}: log-loss {model.log_loss(Xs, ys):.4f}, précision {model.accuracy(Xs, ys):.1%}")
+
+    model.save(args.output)
+    top = np.argsort(-np.abs(model.weights))[:5]
+    print("📈 Poids dominants : " + ", ".join(f"{model.feature_names[i]}={model.weights[i]:+.3f}" for i in top))
+    print(f"💾 Modèle écrit dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
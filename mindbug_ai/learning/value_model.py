@@ -0,0 +1,97 @@
+"""
+Modèle de valeur logistique : P(victoire) = sigmoid(w . x + b).
+
+Entraîné en NumPy pur (descente de gradient sur la log-vraisemblance, L2).
+Les caractéristiques sont standardisées pendant l'entraînement, puis la
+standardisation est repliée dans w et b : la prédiction reste un seul produit
+scalaire.
+"""
+import json
+from typing import List, Optional
+
+import numpy as np
+
+from mindbug_ai.learning.features import FEATURE_NAMES, position_features
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+class LinearValueModel:
+
+    def __init__(self, weights, bias: float = 0.0, feature_names: Optional[List[str]] = None):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self.feature_names = list(feature_names or FEATURE_NAMES)
+        if len(self.weights) != len(self.feature_names):
+            raise ValueError(f"❌ {len(self.weights)} poids pour {len(self.feature_names)} caractéristiques")
+
+    # =========================================================================
+    #  PRÉDICTION
+    # =========================================================================
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        """P(victoire) pour un vecteur (n,) ou une matrice (batch, n)."""
+        return _sigmoid(features @ self.weights + self.bias)
+
+    def win_probability(self, game, player_idx: int) -> float:
+        return float(self.predict(position_features(game, player_idx)))
+
+    # =========================================================================
+    #  ENTRAÎNEMENT
+    # =========================================================================
+
+    @classmethod
+    def fit(cls, X: np.ndarray, y: np.ndarray, epochs: int = 300, lr: float = 0.5,
+            l2: float = 1e-3) -> 'LinearValueModel':
+        """Régression logistique par descente de gradient (batch complet)."""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if len(X) == 0:
+            raise ValueError("❌ Jeu de données vide.")
+
+        mean = X.mean(axis=0)
+        std = X.std(axis=0)
+        std[std == 0] = 1.0
+        Z = (X - mean) / std
+
+        n, d = Z.shape
+        w = np.zeros(d)
+        b = 0.0
+        for _ in range(epochs):
+            error = _sigmoid(Z @ w + b) - y
+            w -= lr * (Z.T @ error / n + l2 * w)
+            b -= lr * error.mean()
+
+        # Repli de la standardisation : w.(x - mean)/std + b = (w/std).x + b'
+        weights = w / std
+        return cls(weights, b - float(weights @ mean))
+
+    def log_loss(self, X: np.ndarray, y: np.ndarray) -> float:
+        p = np.clip(self.predict(np.asarray(X, dtype=np.float64)), 1e-7, 1 - 1e-7)
+        return float(-np.mean(y * np.log(p) + (1 - y) * np.log(1 - p)))
+
+    def accuracy(self, X: np.ndarray, y: np.ndarray) -> float:
+        return float(np.mean((self.predict(np.asarray(X, dtype=np.float64)) >= 0.5) == (y >= 0.5)))
+
+    # =========================================================================
+    #  PERSISTANCE (JSON)
+    # =========================================================================
+
+    def to_dict(self) -> dict:
+        return {"features": self.feature_names,
+                "weights": [float(w) for w in self.weights],
+                "bias": self.bias}
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'LinearValueModel':
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("features") != FEATURE_NAMES:
+            raise ValueError(f"❌ Modèle incompatible avec les caractéristiques actuelles : {path}")
+        return cls(data["weights"], data.get("bias", 0.0), data["features"])
@@ -1,3 +1,5 @@
 from .agent import MCTSAgent
 from .node import MCTSNode
 from .determinizer import Determinizer
+from .priors import HeuristicPrior, UniformPrior
+from .solver import EndgameSolver, SolverResult
@@ -3,8 +3,19 @@ import random
 import logging
 from mindbug_ai.interface import AgentInterface
 from mindbug_ai.mcts.node import MCTSNode
+from mindbug_ai.mcts.priors import HeuristicPrior
 from mindbug_ai.mcts.determinizer import Determinizer
+from mindbug_ai.mcts.solver import EndgameSolver
 from mindbug_engine.core.consts import Phase, Keyword
+from mindbug_engine.core.models import has_keyword
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.utils.logger import log_info, silenced
+from mindbug_engine.utils.combat_oracle import CombatOracle
+from mindbug_ai.tactics import TacticalAnalyzer
+
+
+# Prior sans état : partagé par tous les agents
+DEFAULT_PRIOR = HeuristicPrior()
 
 
 class MCTSAgent(AgentInterface):
@@ -13,11 +24,46 @@ class MCTSAgent(AgentInterface):
     Version v4 : Gestion dynamique des Mindbugs selon le stade de la partie.
     """
 
-    def __init__(self, simulation_time=2.0):
+    def __init__(self, simulation_time=2.0, use_solver=True, prune_equivalent=True,
+                 move_prior=DEFAULT_PRIOR, c_puct=1.5, widening=None, rave_k=None,
+                 value_model=None, rollout_depth=50, value_prior_visits=0, rollout_policy=None):
         self.simulation_time = simulation_time
+
+        # Politique de rollout apprise (ex: SoftmaxPolicy) : échantillonne les coups
+        # des simulations. None : politique experte à base de règles.
+        self.rollout_policy = rollout_policy
+
+        # Modèle de valeur (ex: LinearValueModel) : évalue la position quand le
+        # rollout est coupé à rollout_depth coups, et initialise chaque nouveau
+        # nœud avec value_prior_visits visites virtuelles à sa valeur estimée.
+        self.value_model = value_model
+        self.rollout_depth = rollout_depth
+        self.value_prior_visits = value_prior_visits
+
+        # RAVE / AMAF : chaque simulation crédite tous les coups qu'elle contient.
+        # rave_k = nombre de visites où AMAF et statistiques réelles pèsent autant
+        # (None : désactivé).
+        self.rave_k = rave_k
+
+        # Priors heuristiques : expansion ordonnée et sélection PUCT.
+        # widening=(k, alpha) active l'élargissement progressif (ex: (1.0, 0.5)).
+        # move_prior=None : expansion aléatoire + UCB1 (comportement historique).
+        self.move_prior = move_prior
+        self.c_puct = c_puct
+        self.widening = widening if move_prior is not None else None
+        # Un seul enfant par groupe de coups équivalents (copies identiques d'une carte)
+        self.prune_equivalent = prune_equivalent
         self.determinizer = Determinizer()
         self.root = None
 
+        # Mode solveur : fin de partie à information parfaite (pioches vides)
+        self.use_solver = use_solver
+        self.solver = EndgameSolver()
+        self.last_solver_result = None
+
+        # Nombre de simulations MCTS de la dernière décision (stats / benchmarks)
+        self.last_iterations = 0
+
     @property
     def name(self) -> str:
         return "MindBot (MCTS v4)"
@@ -27,62 +73,94 @@ class MCTSAgent(AgentInterface):
         # Je remets le code standard pour ne pas alourdir la réponse
         # L'important est la méthode _heuristic_rollout_policy plus bas
 
-        legal_moves = game.get_legal_moves()
+        legal_moves = game.get_legal_moves(self.prune_equivalent)
         if not legal_moves:
             return None
         if len(legal_moves) == 1:
             return legal_moves[0]
 
-        self.root = MCTSNode(parent=None, state=game)
+        self.root = MCTSNode(parent=None, state=game, collapse_equivalent=self.prune_equivalent,
+                             move_prior=self.move_prior)
         self.root.player_just_moved = 1 - game.state.active_player_idx
         ai_player_idx = game.state.active_player_idx
 
+        start_time = time.time()
+
+        # Fin de partie sans information cachée : recherche exacte d'abord
+        self.last_solver_result = None
+        if self.use_solver and EndgameSolver.is_applicable(game):
+            with silenced():
+                result = self.solver.solve(game, time_limit=self.simulation_time / 2)
+            self.last_solver_result = result
+            if result.proven:
+                outcome = "WIN" if result.value == EndgameSolver.WIN else "LOSS"
+                log_info(f"🤖 Solver: {outcome} prouvé en {result.nodes} noeuds. Choix: {result.move}")
+                return result.move
+
         logger = logging.getLogger("MindbugLogger")
         original_level = logger.level
         logger.setLevel(logging.CRITICAL)
 
         try:
-            end_time = time.time() + self.simulation_time
+            # Le temps éventuellement consommé par le solveur est déduit du budget
+            end_time = start_time + self.simulation_time
             iterations = 0
+            self.last_iterations = 0
+            observation = self._observation(game, ai_player_idx)
+
+            # Au moins une simulation : un budget déjà écoulé (machine chargée)
+            # ne doit pas réduire la décision à un coup au hasard
+            while iterations == 0 or time.time() < end_time:
+                sim_game = self._sample_game(game, observation, ai_player_idx)
 
-            while time.time() < end_time:
-                sim_game = game.clone()
-                if not sim_game.state.active_request:
-                    self.determinizer.determinize(
-                        sim_game.state, observer_idx=ai_player_idx)
+                # Coups joués (joueur, clé AMAF), arbre puis rollout : uniquement avec RAVE
+                trajectory = [] if self.rave_k is not None else None
 
                 node = self.root
-                while node.untried_moves == [] and node.children:
-                    node = node.uct_select_child()
+                while node.children and not node.can_expand(self.widening):
+                    node = self._select_child(node)
+                    if trajectory is not None:
+                        trajectory.append((node.player_just_moved, node.amaf_key))
                     sim_game.step(node.move[0], node.move[1])
 
                 if node.untried_moves:
-                    move = random.choice(node.untried_moves)
+                    move = node.next_untried_move()
                     player_who_moves = sim_game.state.active_player_idx
+                    amaf_key = None
+                    if trajectory is not None:
+                        amaf_key = self._amaf_key(sim_game, move)
+                        trajectory.append((player_who_moves, amaf_key))
                     sim_game.step(move[0], move[1])
-                    node = node.add_child(move, sim_game, player_who_moves)
+                    node = node.add_child(move, sim_game, player_who_moves, amaf_key)
                     if move in node.parent.untried_moves:
                         node.parent.untried_moves.remove(move)
+                    if self.value_model is not None and self.value_prior_visits:
+                        p = self.value_model.win_probability(sim_game, player_who_moves)
+                        node.visits += self.value_prior_visits
+                        node.wins += p * self.value_prior_visits
 
+                tree_depth = len(trajectory) if trajectory is not None else 0
                 depth = 0
-                while sim_game.state.winner is None and depth < 50:
-                    move = self._heuristic_rollout_policy(sim_game)
+                while sim_game.state.winner is None and depth < self.rollout_depth:
+                    move = self._rollout_move(sim_game)
                     if not move:
                         break
+                    if trajectory is not None:
+                        trajectory.append((sim_game.state.active_player_idx,
+                                           self._amaf_key(sim_game, move)))
                     sim_game.step(move[0], move[1])
                     depth += 1
 
-                winner = sim_game.state.winner
+                results = self._simulation_results(sim_game)
+                if trajectory is not None:
+                    self._update_amaf(node, trajectory, tree_depth, results)
+
                 while node is not None:
-                    win_score = 0.0
-                    if winner:
-                        winner_idx = 0 if winner == sim_game.state.player1 else 1
-                        if node.player_just_moved == winner_idx:
-                            win_score = 1.0
-                    node.update(win_score)
+                    node.update(results[node.player_just_moved] if node.player_just_moved in (0, 1) else 0.0)
                     node = node.parent
 
                 iterations += 1
+                self.last_iterations = iterations
 
         finally:
             logger.setLevel(original_level)
@@ -94,6 +172,99 @@ class MCTSAgent(AgentInterface):
         print(f"🤖 MCTS: {iterations} sims. Choix: {best_node.move} (Win: {best_node.wins}/{best_node.visits} = {best_node.wins/best_node.visits:.1%})")
         return best_node.move
 
+    @staticmethod
+    def _observation(game, observer_idx):
+        """
+        Ensemble d'information de l'IA, ou None si from_observation() ne sait pas
+        reconstruire la position : sélection en cours (callback), attaquant ou
+        candidat Frenzy déjà sorti du plateau.
+        """
+        state = game.state
+        if state.active_request:
+            return None
+        obs = game.observe(observer_idx)
+        if (state.pending_attacker is None) != (obs.pending_attacker is None):
+            return None
+        if (state.frenzy_candidate is None) != (obs.frenzy_candidate is None):
+            return None
+        return obs
+
+    def _sample_game(self, game, observation, observer_idx):
+        """
+        Jeu de simulation : complétion tirée de l'observation (les vraies zones
+        cachées ne sont jamais copiées), sinon copie complète re-mélangée.
+        """
+        if observation is not None:
+            sim_game = MindbugGame.from_observation(
+                observation, self.determinizer.sample_completion(observation), config=game.config)
+            sim_game.stats = game.stats
+            return sim_game
+
+        sim_game = game.clone()
+        if not sim_game.state.active_request:
+            self.determinizer.determinize(sim_game.state, observer_idx=observer_idx)
+        return sim_game
+
+    def _select_child(self, node):
+        if self.move_prior is not None:
+            return node.puct_select_child(self.c_puct, self.rave_k)
+        return node.uct_select_child(rave_k=self.rave_k)
+
+    @staticmethod
+    def _amaf_key(game, move):
+        """
+        Identité d'un coup indépendante de la position : la carte concernée
+        (id) plutôt que son index, qui varie d'une position à l'autre.
+        """
+        action, idx = move
+        state = game.state
+        if action == "PLAY":
+            zone = state.active_player.hand
+        elif action in ("ATTACK", "BLOCK"):
+            zone = state.active_player.board
+        elif action == "MINDBUG" and state.pending_card:
+            return action, state.pending_card.id
+        else:
+            return move
+        return (action, zone[idx].id) if 0 <= idx < len(zone) else move
+
+    def _simulation_results(self, sim_game):
+        """
+        Score de la simulation pour chaque joueur (index 0 / 1) :
+        1 / 0 si la partie est finie, sinon l'estimation du modèle de valeur
+        (0 / 0 sans modèle, comme une partie non conclue).
+        """
+        winner = sim_game.state.winner
+        if winner:
+            return (1.0, 0.0) if winner == sim_game.state.player1 else (0.0, 1.0)
+        if self.value_model is not None:
+            p0 = self.value_model.win_probability(sim_game, 0)
+            return p0, 1.0 - p0
+        return 0.0, 0.0
+
+    @staticmethod
+    def _update_amaf(leaf, trajectory, tree_depth, results):
+        """
+        Remonte de la feuille à la racine : chaque enfant d'un nœud du chemin dont
+        le coup apparaît plus loin dans la simulation (même joueur) est crédité.
+        """
+        seen = set(trajectory[tree_depth:])
+        node, depth = leaf, tree_depth
+        while node is not None:
+            for child in node.children:
+                player = child.player_just_moved
+                if (player, child.amaf_key) in seen:
+                    child.update_amaf(results[player])
+            if depth > 0:
+                depth -= 1
+                seen.add(trajectory[depth])
+            node = node.parent
+
+    def _rollout_move(self, game):
+        if self.rollout_policy is None:
+            return self._heuristic_rollout_policy(game)
+        return self.rollout_policy.sample(game, game.get_legal_moves())
+
     def _heuristic_rollout_policy(self, game):
         """
         Politique de simulation "Experte" (Playout Policy).
@@ -121,20 +292,8 @@ class MCTSAgent(AgentInterface):
                 if card.name == "Giraffodile" and len(ap.discard) == 0:
                     return ("PASS", -1)
 
-                # B. Calcul du Score de Menace de la carte
-                # Base = Puissance
-                threat_score = card.power
-
-                # Bonus Mots-clés
-                keywords = card.keywords
-                if Keyword.POISON in keywords:
-                    threat_score += 3  # Tueur de géants
-                if Keyword.HUNTER in keywords:
-                    threat_score += 2  # Contrôle
-                if Keyword.FRENZY in keywords:
-                    threat_score += 2  # Double attaque
-                if Keyword.TOUGH in keywords:
-                    threat_score += 1   # Résistance
+                # B. Calcul du Score de Menace de la carte (Puissance + bonus Mots-clés)
+                threat_score = TacticalAnalyzer.threat(card)
 
                 # C. Définition du Seuil d'Exigence (Threshold)
                 # Plus l'adversaire a de cartes en main, plus on est exigeant (on attend mieux).
@@ -176,35 +335,35 @@ class MCTSAgent(AgentInterface):
             if not attacker:
                 return random.choice(legal_moves)
 
-            if Keyword.POISON in attacker.keywords:
+            if has_keyword(attacker, Keyword.POISON):
                 # Bloquer le poison avec le plus faible
                 return min(block_moves, key=lambda m: ap.board[m[1]].power)
 
-            # Utiliser TOUGH si possible
-            for m in block_moves:
-                blocker = ap.board[m[1]]
-                if Keyword.TOUGH in blocker.keywords and not blocker.is_damaged:
-                    return m
+            # Issues de tous les blocages possibles (une ligne de l'oracle)
+            outcomes = CombatOracle.matrix([attacker], [ap.board[m[1]] for m in block_moves])[0]
+
+            # Bloquer sans perdre le bloqueur (plus fort, ou Tenace), en tuant si possible
+            safe = [(o.att_dies, m) for m, o in zip(block_moves, outcomes) if not o.blk_dies]
+            if safe:
+                return max(safe, key=lambda x: x[0])[1]
 
             if random.random() < 0.8:  # On bloque souvent
                 return random.choice(block_moves)
             return ("NO_BLOCK", -1)
 
         # --- 4. PHASE D'ATTAQUE ---
+        # Tactique à un coup : issue de chaque attaque face au meilleur blocage adverse
         attack_moves = [m for m in legal_moves if m[0] == "ATTACK"]
-        for m in attack_moves:
-            attacker = ap.board[m[1]]
-            # Attaque gratuite SNEAKY
-            if Keyword.SNEAKY in attacker.keywords:
-                has_sneaky_blocker = any(
-                    Keyword.SNEAKY in c.keywords for c in opp.board)
-                if not has_sneaky_blocker:
+        if attack_moves:
+            options = TacticalAnalyzer.attack_options(game)
+            scored = [(options[m[1]], m) for m in attack_moves if m[1] < len(options)]
+            for option, m in scored:
+                if option.lethal:
                     return m
-
-            # Attaque gratuite POISON (si l'autre n'a pas de petite créature pour absorber)
-            if Keyword.POISON in attacker.keywords:
-                # Si l'adversaire n'a que des grosses créatures (>4), c'est rentable
-                if all(c.power > 4 for c in opp.board):
+            if scored:
+                option, m = max(scored, key=lambda x: (x[0].score, x[0].trade))
+                # Attaque gratuite (Furtif, non bloquable) ou échange gagnant (Poison...)
+                if option.score > 0 or (option.score == 0 and option.trade > 0):
                     return m
 
         return random.choice(legal_moves)
@@ -1,6 +1,8 @@
 import random
 from copy import deepcopy
 
+from mindbug_engine.core.observation import Observation, Completion
+
 
 class Determinizer:
     """
@@ -46,3 +48,23 @@ class Determinizer:
         game_state.deck = hidden_pool  # Le reste retourne dans la pioche
 
         return game_state
+
+    def sample_completion(self, obs: Observation) -> Completion:
+        """
+        Tire une répartition possible des cartes cachées d'une Observation.
+        À combiner avec MindbugGame.from_observation() : l'agent n'a jamais
+        accès aux vraies zones privées.
+        """
+        pool = list(obs.hidden_pool)
+        random.shuffle(pool)
+
+        def deal(n):
+            dealt = tuple(pool[-n:]) if n else ()
+            del pool[len(pool) - n:]
+            return dealt
+
+        opp_idx = 1 - obs.observer_idx
+        opponent_hand = deal(obs.players[opp_idx].hand_size)
+        decks = (deal(obs.players[0].deck_size), deal(obs.players[1].deck_size))
+        deck = deal(obs.deck_size)
+        return Completion(opponent_hand=opponent_hand, decks=decks, deck=deck)
@@ -8,29 +8,77 @@ class MCTSNode:
     Représente un état du jeu atteint après une séquence d'actions.
     """
 
-    def __init__(self, move=None, parent=None, state=None):
+    def __init__(self, move=None, parent=None, state=None, collapse_equivalent=False, move_prior=None):
         """
         :param move: Le coup (Action, Index) qui a mené à ce nœud.
         :param parent: Le nœud parent.
         :param state: L'état du jeu (GameState) à ce nœud. 
                       Sert uniquement à l'initialisation des coups possibles (untried_moves).
+        :param collapse_equivalent: Ignore les coups équivalents (copies identiques d'une carte).
+        :param move_prior: Prior des coups (cf. mcts.priors) : ordre d'expansion et PUCT.
         """
         self.move = move
         self.parent = parent
         self.children = []
+        self.collapse_equivalent = collapse_equivalent
+        self.move_prior = move_prior
+        # Probabilité a priori du coup menant à ce nœud (donnée par le parent)
+        self.prior = 1.0
 
         self.wins = 0.0
         self.visits = 0
 
+        # Statistiques RAVE / AMAF : résultats des simulations où ce coup a été
+        # joué plus tard par le même joueur (clé : cf. MCTSAgent._amaf_key)
+        self.amaf_key = move
+        self.amaf_wins = 0.0
+        self.amaf_visits = 0
+
         # Qui a joué pour arriver ici ? (Indispensable pour savoir à qui attribuer la victoire)
         # Si state est None (Racine), on l'initialisera manuellement dans l'agent
         self.player_just_moved = state.state.active_player_idx if state else -1
 
         # Liste des coups légaux possibles depuis cet état
         # On les stocke pour l'étape d'Expansion
-        self.untried_moves = state.get_legal_moves() if state else []
+        self.untried_moves = state.get_legal_moves(collapse_equivalent) if state else []
+
+        # Priors des coups : expansion du plus probable au moins probable (fin de liste)
+        self.priors = {}
+        if move_prior is not None and self.untried_moves:
+            self.priors = dict(zip(self.untried_moves, move_prior.evaluate(state, self.untried_moves)))
+            self.untried_moves.sort(key=self.priors.get)
 
-    def uct_select_child(self, exploration_weight=1.41):
+    def next_untried_move(self):
+        """Coup à développer : le meilleur prior, ou un coup au hasard sans prior."""
+        if self.priors:
+            return self.untried_moves[-1]
+        return random.choice(self.untried_moves)
+
+    def can_expand(self, widening=None) -> bool:
+        """
+        Élargissement progressif : `widening` = (k, alpha) limite le nombre d'enfants
+        à max(1, ceil(k * visits^alpha)). None : expansion dès qu'un coup reste à essayer.
+        """
+        if not self.untried_moves:
+            return False
+        if widening is None:
+            return True
+        k, alpha = widening
+        return len(self.children) < max(1, math.ceil(k * self.visits ** alpha))
+
+    def value(self, rave_k=None):
+        """
+        Taux de victoire, mélangé aux statistiques AMAF si rave_k est fourni :
+        (1 - beta) * WinRate + beta * AmafRate, beta = sqrt(k / (3 * visits + k)).
+        beta tend vers 0 quand les visites réelles s'accumulent.
+        """
+        q = self.wins / self.visits
+        if rave_k is None or self.amaf_visits == 0:
+            return q
+        beta = math.sqrt(rave_k / (3 * self.visits + rave_k))
+        return (1 - beta) * q + beta * (self.amaf_wins / self.amaf_visits)
+
+    def uct_select_child(self, exploration_weight=1.41, rave_k=None):
         """
         Sélectionne l'enfant le plus prometteur selon la formule UCB1.
         Maximise : (WinRate) + C * sqrt(ln(ParentVisits) / ChildVisits)
@@ -38,19 +86,33 @@ class MCTSNode:
         # Pour éviter la division par zéro, on peut ajouter un petit epsilon ou s'assurer que c.visits > 0
         # (Dans notre algo, un enfant n'est ajouté que s'il a été visité au moins une fois lors de sa création)
         selected = max(self.children, key=lambda c:
-                       (c.wins / c.visits) + exploration_weight *
+                       c.value(rave_k) + exploration_weight *
                        math.sqrt(math.log(self.visits) / c.visits)
                        )
         return selected
 
-    def add_child(self, move, state, player_index):
+    def puct_select_child(self, c_puct=1.5, rave_k=None):
+        """
+        Sélection PUCT (AlphaZero) : WinRate + c * P * sqrt(ParentVisits) / (1 + ChildVisits).
+        """
+        sqrt_visits = math.sqrt(self.visits)
+        return max(self.children, key=lambda c:
+                   c.value(rave_k) + c_puct * c.prior * sqrt_visits / (1 + c.visits))
+
+    def add_child(self, move, state, player_index, amaf_key=None):
         """
         Ajoute un enfant correspondant au coup `move`.
         :param state: L'état du jeu APRES avoir joué le coup.
         :param player_index: L'index du joueur QUI A FAIT ce coup.
+        :param amaf_key: Identité du coup pour RAVE (défaut : le coup lui-même).
         """
-        child = MCTSNode(move=move, parent=self, state=state)
+        child = MCTSNode(move=move, parent=self, state=state,
+                         collapse_equivalent=self.collapse_equivalent,
+                         move_prior=self.move_prior)
         child.player_just_moved = player_index
+        child.prior = self.priors.get(move, 1.0)
+        if amaf_key is not None:
+            child.amaf_key = amaf_key
         self.children.append(child)
         return child
 
@@ -62,5 +124,9 @@ class MCTSNode:
         self.visits += 1
         self.wins += result
 
+    def update_amaf(self, result):
+        self.amaf_visits += 1
+        self.amaf_wins += result
+
     def __repr__(self):
         return f"<Node mv={self.move} w/v={self.wins}/{self.visits} children={len(self.children)}>"
@@ -0,0 +1,67 @@
+"""
+Priors de coups pour le MCTS (ordre d'expansion, PUCT, élargissement progressif).
+
+Un prior est un objet exposant evaluate(game, moves) -> probabilités (même ordre
+que `moves`, somme = 1). HeuristicPrior reprend la logique de la politique de
+rollout : tactique à un coup pour ATTACK / BLOCK, score de menace pour PLAY et
+MINDBUG.
+"""
+import math
+from typing import List, Tuple
+
+from mindbug_engine.core.consts import Phase
+from mindbug_ai.tactics import TacticalAnalyzer, HP_VALUE
+
+
+class UniformPrior:
+    """Aucune préférence : équivalent à l'expansion aléatoire d'origine."""
+
+    def evaluate(self, game, moves: List[Tuple[str, int]]) -> List[float]:
+        return [1.0 / len(moves)] * len(moves) if moves else []
+
+
+class HeuristicPrior:
+
+    def __init__(self, temperature: float = 1.0):
+        # Plus la température est basse, plus le prior se concentre sur le meilleur coup
+        self.temperature = temperature
+
+    def evaluate(self, game, moves: List[Tuple[str, int]]) -> List[float]:
+        if not moves:
+            return []
+        raw = self.scores(game, moves)
+        top = max(raw)
+        weights = [math.exp((r - top) / self.temperature) for r in raw]
+        total = sum(weights)
+        return [w / total for w in weights]
+
+    def scores(self, game, moves: List[Tuple[str, int]]) -> List[float]:
+        """Scores bruts (échelle : ~1 point = une créature gagnée)."""
+        state = game.state
+        ap = state.active_player
+
+        attacks = {}
+        if any(m[0] == "ATTACK" for m in moves):
+            attacks = {o.attacker_index: o for o in TacticalAnalyzer.attack_options(game)}
+        blocks = {}
+        if state.phase == Phase.BLOCK_DECISION:
+            blocks = {b.blocker_index: b for b in TacticalAnalyzer.pending_blocks(game)}
+
+        result = []
+        for action, idx in moves:
+            score = 0.0
+            if action == "ATTACK" and idx in attacks:
+                option = attacks[idx]
+                score = 5.0 if option.lethal else option.score + 0.1 * option.trade
+            elif action == "BLOCK" and idx in blocks:
+                option = blocks[idx]
+                score = -option.outcome.score - 0.1 * option.trade
+            elif action == "NO_BLOCK":
+                score = -5.0 if ap.hp <= 1 else -HP_VALUE
+            elif action == "PLAY" and 0 <= idx < len(ap.hand):
+                score = TacticalAnalyzer.threat(ap.hand[idx]) / 4.0
+            elif action == "MINDBUG" and state.pending_card:
+                # Un Mindbug vaut environ une carte moyenne : seules les menaces fortes le justifient
+                score = (TacticalAnalyzer.threat(state.pending_card) - 7) / 4.0
+            result.append(score)
+        return result
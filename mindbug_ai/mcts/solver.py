@@ -0,0 +1,247 @@
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, Optional, Tuple
+
+from mindbug_engine.core.consts import Phase
+from mindbug_engine.core.models import mask_of
+from mindbug_engine.utils.combat_oracle import CombatOracle
+from mindbug_ai.tactics import TacticalAnalyzer
+
+
+class _SearchAborted(Exception):
+    """Budget (noeuds ou temps) épuisé pendant une itération."""
+
+
+@dataclass
+class SolverResult:
+    """
+    Résultat d'une recherche exacte, du point de vue du joueur qui décide.
+    value : +1 victoire prouvée, -1 défaite prouvée, 0 inconnu (budget ou profondeur).
+    """
+    move: Optional[Tuple[str, int]]
+    value: int
+    nodes: int
+    depth: int
+
+    @property
+    def proven(self) -> bool:
+        return self.value != 0
+
+
+class EndgameSolver:
+    """
+    Solveur exact de fin de partie (Alpha-Beta + table de transposition).
+
+    Quand la pioche globale et les deux pioches personnelles sont vides, plus aucune
+    carte n'entre en jeu : la déterminisation ne fait que permuter la main adverse et
+    la partie est à information parfaite. On explore alors get_legal_moves() par
+    approfondissement itératif jusqu'à prouver une victoire ou une défaite.
+
+    Note : les rares effets RANDOM (ex: Baril étrange) sont traités comme
+    l'échantillon tiré lors de l'expansion du noeud.
+    """
+
+    WIN = 1
+    LOSS = -1
+    UNKNOWN = 0
+
+    def __init__(self, max_nodes: int = 50_000, max_depth: int = 40):
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+        self.table: Dict[tuple, Tuple[int, int, int, Optional[Tuple[str, int]]]] = {}
+        self.nodes = 0
+        self._deadline = None
+
+    # Flags de la table de transposition
+    _EXACT, _LOWER, _UPPER = 0, 1, 2
+
+    @staticmethod
+    def is_applicable(game) -> bool:
+        """Vrai si plus aucune information n'est cachée dans les pioches."""
+        state = game.state
+        if state.winner is not None or state.phase == Phase.INITIATIVE_BATTLE:
+            return False
+        return not state.deck and not state.player1.deck and not state.player2.deck
+
+    def solve(self, game, time_limit: Optional[float] = None) -> SolverResult:
+        """
+        Cherche le meilleur coup par approfondissement itératif.
+        S'arrête dès qu'un résultat est prouvé ou que le budget est épuisé.
+        """
+        self.table.clear()
+        self.nodes = 0
+        self._deadline = time.time() + time_limit if time_limit else None
+
+        best = SolverResult(move=None, value=self.UNKNOWN, nodes=0, depth=0)
+        moves = game.get_legal_moves()
+        if not moves:
+            return best
+        best.move = moves[0]
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                value, move = self._search_root(game, depth)
+            except _SearchAborted:
+                break
+            best = SolverResult(move=move, value=value, nodes=self.nodes, depth=depth)
+            if value != self.UNKNOWN:
+                break
+
+        best.nodes = self.nodes
+        return best
+
+    def _search_root(self, game, depth):
+        me = game.state.acting_player_idx
+        best_value, best_move = self.LOSS - 1, None
+        alpha, beta = self.LOSS, self.WIN
+
+        for move in self._ordered_moves(game, self._state_key(game)):
+            value = self._child_value(game, move, me, depth - 1, alpha, beta)
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+        return best_value, best_move
+
+    def _child_value(self, game, move, me, depth, alpha, beta) -> int:
+        """Valeur (pour `me`) de l'état obtenu en jouant `move`."""
+        child = game.clone()
+        child.step(move[0], move[1])
+        if child.state.acting_player_idx == me or child.state.winner is not None:
+            return self._alphabeta(child, depth, alpha, beta, me)
+        return -self._alphabeta(child, depth, -beta, -alpha, 1 - me)
+
+    def _alphabeta(self, game, depth, alpha, beta, me) -> int:
+        """Negamax alpha-beta ; `me` est le joueur pour qui la valeur est calculée."""
+        self.nodes += 1
+        if self.nodes > self.max_nodes or (self._deadline and time.time() > self._deadline):
+            raise _SearchAborted()
+
+        winner = game.state.winner
+        if winner is not None:
+            winner_idx = 0 if winner is game.state.player1 else 1
+            return self.WIN if winner_idx == me else self.LOSS
+        if depth <= 0:
+            return self.UNKNOWN
+
+        key = self._state_key(game)
+        entry = self.table.get(key)
+        if entry is not None:
+            e_depth, e_value, e_flag, _ = entry
+            if e_value != self.UNKNOWN or e_depth >= depth:
+                if e_flag == self._EXACT:
+                    return e_value
+                if e_flag == self._LOWER:
+                    alpha = max(alpha, e_value)
+                elif e_flag == self._UPPER:
+                    beta = min(beta, e_value)
+                if alpha >= beta:
+                    return e_value
+
+        moves = self._ordered_moves(game, key)
+        if not moves:
+            # Position bloquée (plus aucune action possible) : ni gain ni perte
+            return self.UNKNOWN
+
+        alpha_orig = alpha
+        best_value, best_move = self.LOSS - 1, None
+        for move in moves:
+            value = self._child_value(game, move, me, depth - 1, alpha, beta)
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= alpha_orig:
+            flag = self._UPPER
+        elif best_value >= beta:
+            flag = self._LOWER
+        else:
+            flag = self._EXACT
+        self.table[key] = (depth, best_value, flag, best_move)
+        return best_value
+
+    def _ordered_moves(self, game, key):
+        """Coups légaux distincts, le meilleur coup connu (TT) puis les attaques en premier."""
+        moves = game.get_legal_moves(collapse_equivalent=True)
+        moves.sort(key=lambda m: m[0] != "ATTACK")
+        if game.state.phase == Phase.BLOCK_DECISION and game.state.pending_attacker:
+            self._order_blocks(game, moves)
+        elif moves and moves[0][0] == "ATTACK":
+            self._order_attacks(game, moves)
+        entry = self.table.get(key)
+        if entry is not None and entry[3] in moves:
+            moves.remove(entry[3])
+            moves.insert(0, entry[3])
+        return moves
+
+    @staticmethod
+    def _order_blocks(game, moves):
+        """Blocages triés par bilan de l'échange (oracle), le meilleur en tête."""
+        board = game.state.active_player.board
+        blocks = [m for m in moves if m[0] == "BLOCK"]
+        if not blocks:
+            return
+        outcomes = CombatOracle.matrix([game.state.pending_attacker],
+                                       [board[m[1]] for m in blocks])[0]
+        # Score côté bloqueur = opposé du bilan de l'attaquant (tri stable)
+        ranked = [m for _, m in sorted(zip(outcomes, blocks), key=lambda x: x[0].score)]
+        others = [m for m in moves if m[0] != "BLOCK"]
+        moves[:] = ranked + others
+
+    @staticmethod
+    def _order_attacks(game, moves):
+        """Attaques triées par tactique à un coup (létale, puis meilleur bilan)."""
+        options = TacticalAnalyzer.attack_options(game)
+        if not options:
+            return
+
+        def rank(m):
+            if m[0] != "ATTACK" or m[1] >= len(options):
+                return (1, 0.0, 0)
+            o = options[m[1]]
+            return (0, -(o.score + (10 if o.lethal else 0)), -o.trade)
+
+        moves.sort(key=rank)
+
+    # =========================================================================
+    #  CLÉ DE TRANSPOSITION
+    # =========================================================================
+
+    @staticmethod
+    def _card_key(card):
+        return card.id, card.power, card.is_damaged, mask_of(card)
+
+    @classmethod
+    def _state_key(cls, game) -> tuple:
+        s = game.state
+        card_key = cls._card_key
+
+        def player_key(p):
+            return (p.hp, p.mindbugs,
+                    tuple(sorted(card_key(c) for c in p.board)),
+                    tuple(sorted(c.id for c in p.hand)),
+                    tuple(sorted(c.id for c in p.discard)))
+
+        def ref(card):
+            return card_key(card) if card is not None else None
+
+        req = s.active_request
+        req_key = None
+        if req is not None:
+            cb = req.callback
+            cb_key = None
+            if isinstance(cb, partial):
+                cb_key = (getattr(cb.func, "__name__", None),
+                          tuple(getattr(a, "id", None) for a in cb.args))
+            req_key = (req.selector is s.player1, str(req.reason), req.count, cb_key,
+                       tuple(ref(c) if hasattr(c, "id") else c for c in req.candidates),
+                       len(req.current_selection))
+
+        return (s.phase, s.active_player_idx,
+                player_key(s.player1), player_key(s.player2),
+                ref(s.pending_card), ref(s.pending_attacker), ref(s.frenzy_candidate),
+                s.mindbug_replay_pending, s.end_turn_pending, req_key)
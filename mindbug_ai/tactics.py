@@ -0,0 +1,139 @@
+"""
+Analyse tactique à un coup : issue immédiate de chaque attaque possible,
+face à la meilleure réponse de blocage de l'adversaire.
+
+Aucun clone ni step : on lit le plateau courant et la table de l'oracle de
+combat. Les effets déclenchés (ON_ATTACK, ON_BLOCK, ON_DEATH...) ne sont pas
+simulés : c'est une estimation rapide pour les rollouts et le tri des coups.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from mindbug_engine.core.consts import Keyword, KEYWORD_BITS, Phase
+from mindbug_engine.core.models import Card, has_keyword, mask_of
+from mindbug_engine.utils.combat_oracle import CombatOracle, DuelOutcome
+from mindbug_engine.utils.combat_utils import CombatUtils
+
+# Valeur d'un PV adverse, en "créatures" (échelle de DuelOutcome.score)
+HP_VALUE = 0.5
+
+# Bonus de menace par mot-clé, puis précalculé pour chacun des 32 masques
+THREAT_BONUS = {
+    Keyword.POISON: 3,  # Tueur de géants
+    Keyword.HUNTER: 2,  # Contrôle
+    Keyword.FRENZY: 2,  # Double attaque
+    Keyword.TOUGH: 1,   # Résistance
+}
+_THREAT_BONUS = [sum(bonus for kw, bonus in THREAT_BONUS.items() if mask & KEYWORD_BITS[kw.value])
+                 for mask in range(1 << len(Keyword))]
+
+
+@dataclass(frozen=True)
+class BlockOption:
+    blocker_index: int
+    outcome: DuelOutcome
+    # Puissance détruite chez le défenseur - puissance perdue par l'attaquant
+    trade: int = 0
+
+
+@dataclass(frozen=True)
+class AttackOption:
+    attacker_index: int
+    # Blocages autorisés (Furtif, interdictions BAN) et leur issue
+    blocks: Tuple[BlockOption, ...]
+    # Réponse retenue (None : attaque non bloquée)
+    response: Optional[BlockOption]
+    # Le défenseur perd son dernier PV si l'attaque passe
+    lethal: bool
+
+    @property
+    def score(self) -> float:
+        """Bilan de l'attaque après la réponse adverse (côté attaquant)."""
+        if self.response is None:
+            return HP_VALUE
+        return float(self.response.outcome.score)
+
+    @property
+    def trade(self) -> int:
+        return self.response.trade if self.response else 0
+
+
+class TacticalAnalyzer:
+
+    @staticmethod
+    def threat(card: Card) -> int:
+        """Score de menace d'une carte : puissance + bonus de mots-clés."""
+        return card.power + _THREAT_BONUS[mask_of(card)]
+
+    @staticmethod
+    def block_options(game, attacker: Card, defender) -> List[BlockOption]:
+        """Blocages légaux du défenseur contre `attacker`, avec leur issue."""
+        return TacticalAnalyzer._blocks(attacker, defender.board, game.state.restrictions("BLOCK", defender))
+
+    @staticmethod
+    def _blocks(attacker: Card, blockers, bans, profiles=None) -> List[BlockOption]:
+        """profiles : (puissance, masque, blessée) de chaque bloqueur, s'ils sont déjà calculés."""
+        att_profile = (attacker.power, mask_of(attacker), attacker.is_damaged)
+        options = []
+        for i, b in enumerate(blockers):
+            if not CombatUtils.can_block(attacker, b, bans):
+                continue
+            profile = profiles[i] if profiles is not None else (b.power, mask_of(b), b.is_damaged)
+            o = CombatOracle.lookup(att_profile + profile)
+            options.append(BlockOption(i, o, (b.power if o.blk_dies else 0) - (attacker.power if o.att_dies else 0)))
+        return options
+
+    @staticmethod
+    def best_response(attacker: Card, blocks: List[BlockOption], defender_hp: int) -> Optional[BlockOption]:
+        """
+        Réponse de blocage jugée la meilleure :
+        - Chasseur : l'attaquant choisit le bloqueur (meilleur bilan pour lui).
+        - Sinon le défenseur prend le bloqueur au pire bilan pour l'attaquant,
+          et préfère encaisser si ce blocage lui coûte plus qu'un PV (sauf PV létal).
+        """
+        if not blocks:
+            return None
+        if has_keyword(attacker, Keyword.HUNTER):
+            return max(blocks, key=lambda b: (b.outcome.score, b.trade))
+        return TacticalAnalyzer.defender_choice(blocks, defender_hp)
+
+    @staticmethod
+    def defender_choice(blocks: List[BlockOption], defender_hp: int) -> Optional[BlockOption]:
+        """Choix du défenseur : pire bilan pour l'attaquant, ou None (encaisser)."""
+        if not blocks:
+            return None
+        best = min(blocks, key=lambda b: (b.outcome.score, b.trade))
+        if defender_hp <= 1 or best.outcome.score < HP_VALUE:
+            return best
+        return None
+
+    @classmethod
+    def attack_options(cls, game) -> List[AttackOption]:
+        """
+        Une entrée par créature de l'attaquant (joueur actif en phase principale),
+        dans l'ordre du plateau. Vide hors phase principale.
+        """
+        state = game.state
+        if state.phase not in (Phase.P1_MAIN, Phase.P2_MAIN):
+            return []
+        ap = state.active_player
+        opp = state.player2 if ap is state.player1 else state.player1
+
+        # Interdictions et profils des bloqueurs : communs à tous les attaquants
+        bans = state.restrictions("BLOCK", opp)
+        profiles = [(b.power, mask_of(b), b.is_damaged) for b in opp.board]
+        options = []
+        for i, attacker in enumerate(ap.board):
+            blocks = cls._blocks(attacker, opp.board, bans, profiles)
+            response = cls.best_response(attacker, blocks, opp.hp)
+            options.append(AttackOption(i, tuple(blocks), response,
+                                        lethal=response is None and opp.hp <= 1))
+        return options
+
+    @classmethod
+    def pending_blocks(cls, game) -> List[BlockOption]:
+        """Options du joueur qui doit bloquer (phase BLOCK_DECISION)."""
+        state = game.state
+        if state.phase != Phase.BLOCK_DECISION or not state.pending_attacker:
+            return []
+        return cls.block_options(game, state.pending_attacker, state.active_player)
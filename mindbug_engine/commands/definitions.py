@@ -3,6 +3,8 @@ from typing import Any
 from functools import partial
 from mindbug_engine.commands.command import Command
 from mindbug_engine.core.consts import Phase, Trigger, Keyword
+from mindbug_engine.managers.event_manager import EventManager
+from mindbug_engine.utils.events import GameEventType
 from mindbug_engine.utils.logger import log_info, log_error
 
 
@@ -38,6 +40,9 @@ class PlayCardCommand(Command):
         game.state.pending_card = card
 
         log_info(f"> {player.name} plays {card.name}. Mindbug check...")
+        events = getattr(game, "events", None)
+        if events is not None:
+            events.emit(game, GameEventType.CARD_PLAYED, player, card)
 
         # Reset états
         game.state.frenzy_candidate = None
@@ -70,17 +75,18 @@ class AttackCommand(Command):
         game.state.pending_attacker = attacker
 
         log_info(f"> ⚔️ {ap.name} declares attack with {attacker.name} !")
+        events = getattr(game, "events", None)
+        if events is not None:
+            events.emit(game, GameEventType.ATTACK, ap, attacker)
 
         # 2. Trigger ON_ATTACK
-        if attacker.trigger == Trigger.ON_ATTACK:
-            log_info(f"⚡ Trigger ON_ATTACK activated for {attacker.name}")
-            game.effect_manager.apply_effect(attacker, ap, opp)
+        if EventManager.emit(Trigger.ON_ATTACK, attacker, ap, opp, game.effect_manager):
             if game.state.phase == Phase.RESOLUTION_CHOICE:
                 return
 
         # 3. Gestion HUNTER (Chasseur)
         has_targets = len(opp.board) > 0
-        if Keyword.HUNTER in attacker.keywords and has_targets:
+        if attacker.has_keyword(Keyword.HUNTER) and has_targets:
             log_info(f"> 🏹 HUNTER triggers : {ap.name} chooses the blocker.")
 
             # Utilisation de partial et méthode statique pour être "Picklable"
@@ -175,6 +181,9 @@ class MindbugCommand(Command):
             card = game.state.pending_card
 
             log_info(f"> MINDBUG ! {thief.name} steals {card.name} !")
+            events = getattr(game, "events", None)
+            if events is not None:
+                events.emit(game, GameEventType.MINDBUG_USED, thief, card)
 
             # 1. Le voleur pose la carte chez lui (Trigger ON_PLAY activés pour le voleur)
             game.put_card_on_board(thief, card)
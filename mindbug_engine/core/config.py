@@ -10,10 +10,19 @@ class ConfigurationService:
     Service unique gérant la persistance et la validation des paramètres.
     """
     FILE_PATH = "settings.json"
+    # Stratégies d'IA proposées dans les paramètres (liste de référence d'AgentFactory)
+    AI_STRATEGIES = ("MCTS", "HEURISTIC")
 
-    def __init__(self):
+    def __init__(self, load_from_disk: bool = True):
+        """
+        Args:
+            load_from_disk: False pour un usage sans interface (outils, benchmarks,
+                            entraînement) : valeurs par défaut, settings.json ignoré.
+        """
         # Valeurs par défaut
         self.ai_difficulty: Difficulty = Difficulty.MEDIUM
+        # Stratégie de l'IA (cf. AgentFactory) : "MCTS" ou "HEURISTIC"
+        self.ai_strategy: str = "MCTS"
         self.debug_mode: bool = False
         self.game_mode: str = "HOTSEAT"
         self.active_sets: List[str] = ["FIRST_CONTACT"]
@@ -22,8 +31,9 @@ class ConfigurationService:
         
         # Données runtime (non sauvegardées)
         self.available_sets_in_db: List[str] = []
-        
-        self.load()
+
+        if load_from_disk:
+            self.load()
 
     def load(self):
         """Charge et valide les paramètres depuis le disque."""
@@ -46,6 +56,9 @@ class ConfigurationService:
                 except ValueError:
                     self.ai_difficulty = Difficulty.MEDIUM
 
+                raw_strategy = data.get("ai_strategy", "MCTS")
+                self.ai_strategy = raw_strategy if raw_strategy in self.AI_STRATEGIES else "MCTS"
+
                 # Validation des sets
                 saved_sets = data.get("active_sets", ["FIRST_CONTACT"])
                 if saved_sets:
@@ -59,6 +72,7 @@ class ConfigurationService:
             "debug_mode": self.debug_mode,
             "game_mode": self.game_mode,
             "ai_difficulty": self.ai_difficulty.value,
+            "ai_strategy": self.ai_strategy,
             "active_sets": self.active_sets,
             "resolution": self.resolution,
             "fullscreen": self.fullscreen
@@ -1,4 +1,5 @@
-from enum import Enum
+from enum import Enum, IntFlag
+from typing import Dict, Iterable, Tuple
 
 
 class Phase(str, Enum):
@@ -65,6 +66,44 @@ class Keyword(str, Enum):
     SNEAKY = "SNEAKY"   # Furtif : Ne peut être bloqué que par une créature Furtive
 
 
+class KeywordFlag(IntFlag):
+    """
+    Un bit par Keyword : les mots-clés d'une carte tiennent dans un entier
+    (Card.keyword_mask). Appartenance = ET binaire, rafraîchissement = affectation.
+    """
+    NONE = 0
+    FRENZY = 1
+    TOUGH = 2
+    POISON = 4
+    HUNTER = 8
+    SNEAKY = 16
+
+
+# Bits bruts (int) : les opérations sur int sont plus rapides que sur IntFlag.
+# Les clés acceptent indifféremment Keyword.X ou "X" (str Enum : même hash).
+KEYWORD_BITS: Dict[str, int] = {kw.value: int(KeywordFlag[kw.name]) for kw in Keyword}
+
+# Masque -> mots-clés (ordre canonique de l'Enum), précalculé pour les 32 masques
+_KEYWORDS_BY_MASK = [tuple(kw for kw in Keyword if mask & KEYWORD_BITS[kw.value])
+                     for mask in range(1 << len(Keyword))]
+
+
+def keyword_mask(keywords: Iterable[str]) -> int:
+    """Convertit une liste de mots-clés (Keyword ou str) en masque."""
+    mask = 0
+    for kw in keywords:
+        bit = KEYWORD_BITS.get(kw)
+        if bit is None:
+            raise ValueError(f"Mot-clé inconnu : {kw}")
+        mask |= bit
+    return mask
+
+
+def keywords_of(mask: int) -> Tuple[Keyword, ...]:
+    """Mots-clés présents dans un masque."""
+    return _KEYWORDS_BY_MASK[mask]
+
+
 class Difficulty(str, Enum):
     """Niveaux de difficulté officiels."""
     EASY = "EASY"
@@ -1,6 +1,9 @@
 from __future__ import annotations
-from typing import List, Optional, Dict, Any, Callable
+from typing import List, Optional, Dict, Any, Callable, Set, Tuple
 from dataclasses import dataclass, field
+from mindbug_engine.core.consts import Keyword, KEYWORD_BITS, keyword_mask, keywords_of
+
+_TOUGH_BIT = KEYWORD_BITS[Keyword.TOUGH.value]
 
 # =============================================================================
 #  OBJETS DE DONNÉES (MODELS)
@@ -43,14 +46,19 @@ class Card:
     """Objet de données représentant une carte."""
     def __init__(self, id: str, name: str, power: int, keywords: List[str] = None,
                  trigger: str = None, effects: List[CardEffect] = None,
-                 image_path: str = None, set_id: str = "FIRST_CONTACT"):
+                 image_path: str = None, set_id: str = "FIRST_CONTACT",
+                 trigger_scope: str = "SELF"):
         self.id = id
         self.name = name
         self.base_power = power
         self.power = power
-        self.base_keywords = list(keywords) if keywords else []
-        self.keywords = list(self.base_keywords)
+        # Mots-clés stockés en masques de bits (cf. KeywordFlag)
+        self.base_keyword_mask = keyword_mask(keywords) if keywords else 0
+        self.keyword_mask = self.base_keyword_mask
         self.trigger = trigger
+        # Cartes dont l'événement déclenche l'effet : SELF (la carte elle-même),
+        # ALLIES / ENEMIES / ANY (écoute les autres cartes tant qu'elle est en jeu)
+        self.trigger_scope = trigger_scope
         self.effects = effects if effects else []
         self.image_path = image_path
         self.set = set_id
@@ -72,33 +80,60 @@ class Card:
             trigger=data.get("trigger"),
             effects=parsed_effects,
             image_path=img_file,
-            set_id=data.get("set", "FIRST_CONTACT")
+            set_id=data.get("set", "FIRST_CONTACT"),
+            trigger_scope=data.get("trigger_scope", "SELF")
         )
 
+    @property
+    def keywords(self) -> 'KeywordSet':
+        """Vue 'liste' du masque courant (in, itération, append, remove)."""
+        return KeywordSet(self)
+
+    @keywords.setter
+    def keywords(self, values):
+        self.keyword_mask = keyword_mask(values)
+
+    @property
+    def base_keywords(self) -> List[Keyword]:
+        return list(keywords_of(self.base_keyword_mask))
+
+    @base_keywords.setter
+    def base_keywords(self, values):
+        self.base_keyword_mask = keyword_mask(values)
+
+    def has_keyword(self, kw: str) -> bool:
+        return bool(self.keyword_mask & KEYWORD_BITS[kw])
+
+    def signature(self) -> tuple:
+        """Deux cartes de même signature sont interchangeables en jeu."""
+        return self.id, self.power, self.is_damaged, self.keyword_mask
+
     def reset(self):
         self.is_damaged = False
         self.power = self.base_power
-        self.keywords = list(self.base_keywords)
+        self.keyword_mask = self.base_keyword_mask
 
     def refresh_state(self):
         self.power = self.base_power
-        self.keywords = list(self.base_keywords)
-        if self.is_damaged and "TOUGH" in self.keywords:
-            self.keywords.remove("TOUGH")
+        if self.is_damaged:
+            self.keyword_mask = self.base_keyword_mask & ~_TOUGH_BIT
+        else:
+            self.keyword_mask = self.base_keyword_mask
 
     def copy(self):
         new_c = Card(
             id=self.id,
             name=self.name,
             power=self.base_power,
-            keywords=list(self.base_keywords),
             trigger=self.trigger,
             effects=[e.copy() for e in self.effects],
             image_path=self.image_path,
-            set_id=self.set
+            set_id=self.set,
+            trigger_scope=self.trigger_scope
         )
         new_c.power = self.power
-        new_c.keywords = list(self.keywords)
+        new_c.base_keyword_mask = self.base_keyword_mask
+        new_c.keyword_mask = self.keyword_mask
         new_c.is_damaged = self.is_damaged
         return new_c
 
@@ -107,16 +142,352 @@ class Card:
         return f"[{self.name}{dmg} ({self.power})]"
 
 
+class KeywordSet:
+    """
+    Vue compatible 'liste' sur Card.keyword_mask.
+    Les modifications (append / remove) écrivent directement dans le masque.
+    """
+    __slots__ = ("card",)
+
+    def __init__(self, card: Card):
+        self.card = card
+
+    def __contains__(self, kw) -> bool:
+        bit = KEYWORD_BITS.get(kw)
+        return bit is not None and bool(self.card.keyword_mask & bit)
+
+    def __iter__(self):
+        return iter(keywords_of(self.card.keyword_mask))
+
+    def __len__(self) -> int:
+        return len(keywords_of(self.card.keyword_mask))
+
+    def __bool__(self) -> bool:
+        return self.card.keyword_mask != 0
+
+    def __eq__(self, other) -> bool:
+        try:
+            return self.card.keyword_mask == keyword_mask(other)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    __hash__ = None
+
+    def append(self, kw: str):
+        self.card.keyword_mask |= keyword_mask((kw,))
+
+    def remove(self, kw: str):
+        if kw not in self:
+            raise ValueError(f"{kw} absent de {self.card.name}")
+        self.card.keyword_mask &= ~KEYWORD_BITS[kw]
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def mask_of(card: Any) -> int:
+    """Masque de mots-clés d'une carte (ou de tout objet exposant une liste `keywords`)."""
+    mask = getattr(card, "keyword_mask", None)
+    return keyword_mask(card.keywords) if mask is None else mask
+
+
+def has_keyword(card: Any, kw: str) -> bool:
+    """Test d'appartenance par ET binaire (repli sur la liste hors Card)."""
+    mask = getattr(card, "keyword_mask", None)
+    if mask is None:
+        return kw in card.keywords
+    return bool(mask & KEYWORD_BITS[kw])
+
+
+def grant_keywords(card: Any, mask: int) -> int:
+    """Ajoute les mots-clés de `mask` à la carte. Retourne les bits réellement gagnés."""
+    current = getattr(card, "keyword_mask", None)
+    if current is None:
+        gained = mask & ~keyword_mask(card.keywords)
+        card.keywords.extend(keywords_of(gained))
+        return gained
+    card.keyword_mask = current | mask
+    return mask & ~current
+
+
+def _detached_zone(name: str, cards: list) -> 'Zone':
+    """Reconstruction pickle : le Player propriétaire se rattache ensuite."""
+    return Zone(None, name, cards)
+
+
+class Zone(list):
+    """
+    Zone de cartes d'un joueur (pioche, main, plateau, défausse).
+
+    Liste standard qui prévient son propriétaire après chaque mutation, pour
+    que ses index (zone de chaque carte, abonnés aux triggers, interdictions)
+    restent à jour sans rescanner le joueur. append / pop / remove ne touchent
+    que la carte concernée ; les autres mutations (plus rares) réindexent la
+    seule zone modifiée (à la prochaine recherche, hors plateau).
+    """
+    __slots__ = ("owner", "name")
+
+    def __init__(self, owner: Optional['Player'], name: str, cards=()):
+        super().__init__(cards)
+        self.owner = owner
+        self.name = name
+
+    def _changed(self, old: list):
+        if self.owner is not None:
+            self.owner._zone_changed(self, old)
+
+    def replace(self, cards):
+        """Remplace le contenu sur place (la Zone reste le même objet)."""
+        if self.owner is None:
+            list.__setitem__(self, slice(None), cards)
+        else:
+            self.owner._replace_zone(self, cards)
+
+    def append(self, card):
+        super().append(card)
+        if self.owner is not None:
+            self.owner._card_added(self, card)
+
+    def pop(self, index=-1):
+        card = super().pop(index)
+        if self.owner is not None:
+            self.owner._card_removed(self, card)
+        return card
+
+    def remove(self, card):
+        super().remove(card)
+        if self.owner is not None:
+            self.owner._card_removed(self, card)
+
+    def extend(self, cards):
+        old = list(self)
+        super().extend(cards)
+        self._changed(old)
+
+    def insert(self, index, card):
+        old = list(self)
+        super().insert(index, card)
+        self._changed(old)
+
+    def clear(self):
+        old = list(self)
+        super().clear()
+        self._changed(old)
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed(self)
+
+    def reverse(self):
+        super().reverse()
+        self._changed(self)
+
+    def __setitem__(self, index, value):
+        old = list(self)
+        super().__setitem__(index, value)
+        self._changed(old)
+
+    def __delitem__(self, index):
+        old = list(self)
+        super().__delitem__(index)
+        self._changed(old)
+
+    def __iadd__(self, cards):
+        old = list(self)
+        super().__iadd__(cards)
+        self._changed(old)
+        return self
+
+    def __reduce_ex__(self, protocol):
+        return _detached_zone, (self.name, list(self))
+
+
+class _ZoneSlot:
+    """
+    Attribut de zone d'un Player. Seule l'affectation est interceptée :
+    `p.hand = cards` remplace le contenu de la Zone existante (cards est copiée,
+    p.hand reste le même objet). Sans __get__, la lecture `p.hand` va
+    directement au __dict__ de l'instance, sans appel Python.
+    """
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __set__(self, player: 'Player', cards):
+        zone = player.__dict__[self.name]
+        if cards is not zone:
+            player._replace_zone(zone, cards)
+
+
 class Player:
     """Représente l'état d'un joueur."""
+
+    ZONES = ("deck", "hand", "board", "discard")
+    # Groupes cibles d'un BAN qui restreignent le joueur lui-même (sinon : l'adversaire)
+    OWNER_GROUPS = ("OWNER", "SELF", "ALLIES", "ALL_ALLIES", "ALL_OTHER_ALLIES")
+
     def __init__(self, name: str):
+        # Index dérivés des zones (reconstruits, jamais sérialisés)
+        # Carte -> nom de sa zone (la position se lit à la demande : cf. locate)
+        self._locations: Dict[Card, str] = {}
+        # Zones réaffectées depuis la dernière recherche (réindexées à la demande)
+        self._stale: Set[str] = set()
+        self._triggers: Dict[str, List[Card]] = {}
+        self._bans: Dict[Tuple[str, str], List[Tuple[Card, CardEffect]]] = {}
+
         self.name = name
         self.hp = 3
         self.mindbugs = 2
-        self.deck: List[Card] = []
-        self.hand: List[Card] = []
-        self.board: List[Card] = []
-        self.discard: List[Card] = []
+        # Zones créées une fois pour toutes : les affectations en remplacent le contenu
+        for zone in Player.ZONES:
+            self.__dict__[zone] = Zone(self, zone)
+
+    deck: List[Card] = _ZoneSlot()
+    hand: List[Card] = _ZoneSlot()
+    board: List[Card] = _ZoneSlot()
+    discard: List[Card] = _ZoneSlot()
+
+    # =========================================================================
+    #  HOOKS DES ZONES (maintien des index)
+    # =========================================================================
+
+    def _card_added(self, zone: Zone, card: Card):
+        self._locations[card] = zone.name
+        if zone.name == "board":
+            self._board_entered(card)
+
+    def _card_removed(self, zone: Zone, card: Card):
+        name = zone.name
+        # La carte a pu être indexée entre-temps dans une autre zone
+        if self._locations.get(card) == name:
+            del self._locations[card]
+        if name == "board":
+            self._board_left(card)
+
+    def _replace_zone(self, zone: Zone, cards):
+        """
+        Affectation d'une zone (p.hand = cards). Hors plateau, la zone est seulement
+        marquée périmée : elle sera réindexée à la prochaine recherche (cf. _refresh),
+        une seule fois même si elle est réaffectée plusieurs fois d'ici là (déterminisation).
+        """
+        if zone.name == "board":
+            old = list(zone)
+            list.__setitem__(zone, slice(None), cards)
+            self._zone_changed(zone, old)
+        else:
+            list.__setitem__(zone, slice(None), cards)
+            self._stale.add(zone.name)
+
+    def _zone_changed(self, zone: Zone, old: list):
+        """Mutations globales d'une zone (affectation du plateau, insert, sort, del...)."""
+        name = zone.name
+        if name != "board":
+            self._stale.add(name)
+            return
+        locations = self._locations
+        for card in old:
+            if locations.get(card) == name:
+                del locations[card]
+        for card in zone:
+            locations[card] = name
+        self._index_board()
+
+    def _refresh(self):
+        """Réindexe les zones périmées : leurs seules entrées sont remplacées."""
+        stale = self._stale
+        locations = self._locations
+        for card in [c for c, name in locations.items() if name in stale]:
+            del locations[card]
+        for name in stale:
+            for card in self.__dict__[name]:
+                locations[card] = name
+        stale.clear()
+
+    @staticmethod
+    def _ban_keys(card: Card):
+        """(clé (action, côté), effet) de chaque interdiction (BAN) portée par la carte."""
+        for effect in card.effects:
+            if effect.type == "BAN":
+                group = (getattr(effect, "target", None) or {}).get("group")
+                side = "OWNER" if group in Player.OWNER_GROUPS else "OPPONENT"
+                yield (effect.params.get("action"), side), effect
+
+    def _board_entered(self, card: Card):
+        """Ajoute les abonnements et interdictions de la carte qui arrive en jeu."""
+        if card.trigger:
+            self._triggers.setdefault(card.trigger, []).append(card)
+        for key, effect in Player._ban_keys(card):
+            self._bans.setdefault(key, []).append((card, effect))
+
+    def _board_left(self, card: Card):
+        """Retire les abonnements et interdictions de la carte qui quitte le jeu."""
+        if card.trigger:
+            listeners = self._triggers.get(card.trigger)
+            if listeners and card in listeners:
+                listeners.remove(card)
+                if not listeners:
+                    del self._triggers[card.trigger]
+        for key, effect in Player._ban_keys(card):
+            entries = self._bans.get(key)
+            if entries and (card, effect) in entries:
+                entries.remove((card, effect))
+                if not entries:
+                    del self._bans[key]
+
+    def _index_board(self):
+        """
+        Reconstruction complète (affectation du plateau, insert / sort... et
+        dépicklage) : l'ordre des abonnés suit alors celui du plateau.
+        """
+        self._triggers = {}
+        self._bans = {}
+        for card in self.board:
+            self._board_entered(card)
+
+    # =========================================================================
+    #  REQUÊTES O(1)
+    # =========================================================================
+
+    def locate(self, card: Card) -> Optional[Tuple[str, int]]:
+        """(zone, position) de `card` chez ce joueur, ou None. Zone en O(1), position par zone.index()."""
+        if self._stale:
+            self._refresh()
+        name = self._locations.get(card)
+        if name is None:
+            return None
+        return name, self.__dict__[name].index(card)
+
+    def subscribers(self, trigger: str) -> List[Card]:
+        """Cartes en jeu (plateau) abonnées à `trigger`, dans l'ordre du plateau."""
+        return self._triggers.get(trigger, [])
+
+    def bans(self, action: str, side: str) -> List[Tuple[Card, CardEffect]]:
+        """
+        Interdictions (BAN) imposées par les cartes en jeu de ce joueur.
+        side : "OPPONENT" (restreint l'adversaire) ou "OWNER" (se restreint lui-même).
+        """
+        return self._bans.get((action, side), [])
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_locations"]
+        del state["_stale"]
+        del state["_triggers"]
+        del state["_bans"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        locations = {}
+        for name in Player.ZONES:
+            zone = state[name]
+            zone.owner = self
+            for card in zone:
+                locations[card] = name
+        self._locations = locations
+        self._stale = set()
+        self._index_board()
 
     def __repr__(self):
         return f"Player({self.name})"
@@ -130,3 +501,18 @@ class Player:
         p.board = [c.copy() for c in self.board]
         p.discard = [c.copy() for c in self.discard]
         return p
+
+
+def zone_of(player: Any, card: Any) -> Optional[str]:
+    """
+    Nom de la zone contenant `card` chez `player` ("hand", "board", ...), ou None.
+    O(1) via l'index d'un Player ; parcours des zones pour tout autre objet.
+    """
+    if isinstance(player, Player):
+        if player._stale:
+            player._refresh()
+        return player._locations.get(card)
+    for name in Player.ZONES:
+        if card in getattr(player, name, ()):
+            return name
+    return None
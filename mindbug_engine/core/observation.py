@@ -0,0 +1,157 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
+
+from mindbug_engine.core.consts import Phase
+
+if TYPE_CHECKING:
+    from mindbug_engine.core.models import Card, Player
+    from mindbug_engine.core.state import GameState
+
+
+class CardView(NamedTuple):
+    """Vue publique d'une carte en jeu (plateau)."""
+    id: str
+    power: int
+    keywords: Tuple[str, ...]
+    is_damaged: bool
+
+    @classmethod
+    def of(cls, card: 'Card') -> 'CardView':
+        return cls(card.id, card.power, tuple(getattr(k, "value", k) for k in card.keywords),
+                   card.is_damaged)
+
+
+@dataclass(frozen=True)
+class PlayerView:
+    """Ce qu'un observateur sait d'un joueur."""
+    hp: int
+    mindbugs: int
+    board: Tuple[CardView, ...]
+    discard: Tuple[str, ...]
+    # None si la main est cachée pour l'observateur (seule la taille est connue)
+    hand: Optional[Tuple[str, ...]]
+    hand_size: int
+    deck_size: int
+
+
+@dataclass(frozen=True)
+class RequestView:
+    """Résumé public d'une SelectionRequest en cours."""
+    selector_idx: int
+    reason: str
+    count: int
+
+
+@dataclass(frozen=True)
+class Observation:
+    """
+    Ensemble d'information (Information Set) d'un joueur : exactement ce qu'il voit.
+
+    Les zones cachées (main adverse, pioches personnelles, pioche globale) ne sont
+    exposées que par leur taille. `hidden_pool` liste (triés) les IDs des cartes
+    invisibles : comme le Determinizer, on considère la composition de la partie
+    comme connue, seule leur répartition est cachée.
+    """
+    observer_idx: int
+    active_player_idx: int
+    phase: Phase
+    turn_count: int
+    winner_idx: Optional[int]
+    players: Tuple[PlayerView, PlayerView]
+    deck_size: int
+    hidden_pool: Tuple[str, ...]
+
+    # Cartes publiques hors zones
+    pending_card: Optional[str] = None
+    initiative_duel: Optional[Tuple[str, str]] = None
+
+    # Références plateau (player_idx, board_idx)
+    pending_attacker: Optional[Tuple[int, int]] = None
+    frenzy_candidate: Optional[Tuple[int, int]] = None
+
+    request: Optional[RequestView] = None
+    mindbug_replay_pending: bool = False
+    end_turn_pending: bool = False
+
+    @property
+    def me(self) -> PlayerView:
+        return self.players[self.observer_idx]
+
+    @property
+    def opponent(self) -> PlayerView:
+        return self.players[1 - self.observer_idx]
+
+    @classmethod
+    def from_state(cls, state: 'GameState', observer_idx: int) -> 'Observation':
+        """Construit l'observation de `observer_idx` sur l'état donné."""
+        players = (state.player1, state.player2)
+        observer = players[observer_idx]
+        opponent = players[1 - observer_idx]
+
+        hidden = [c.id for c in opponent.hand]
+        hidden.extend(c.id for c in observer.deck)
+        hidden.extend(c.id for c in opponent.deck)
+        hidden.extend(c.id for c in state.deck)
+
+        def view(player: 'Player') -> PlayerView:
+            visible = player is observer
+            return PlayerView(
+                hp=player.hp,
+                mindbugs=player.mindbugs,
+                board=tuple(CardView.of(c) for c in player.board),
+                discard=tuple(c.id for c in player.discard),
+                hand=tuple(c.id for c in player.hand) if visible else None,
+                hand_size=len(player.hand),
+                deck_size=len(player.deck),
+            )
+
+        def board_ref(card: Optional['Card']) -> Optional[Tuple[int, int]]:
+            loc = state.locate(card) if card is not None else None
+            if loc is None or loc[1] != "board":
+                return None
+            return (0 if loc[0] is state.player1 else 1), loc[2]
+
+        req = state.active_request
+        request = None
+        if req is not None:
+            request = RequestView(
+                selector_idx=0 if req.selector is state.player1 else 1,
+                reason=getattr(req.reason, "value", req.reason),
+                count=req.count,
+            )
+
+        winner_idx = None
+        if state.winner is not None:
+            winner_idx = 0 if state.winner is state.player1 else 1
+
+        duel = state.initiative_duel
+        return cls(
+            observer_idx=observer_idx,
+            active_player_idx=state.active_player_idx,
+            phase=state.phase,
+            turn_count=state.turn_count,
+            winner_idx=winner_idx,
+            players=(view(state.player1), view(state.player2)),
+            deck_size=len(state.deck),
+            hidden_pool=tuple(sorted(hidden)),
+            pending_card=state.pending_card.id if state.pending_card else None,
+            initiative_duel=(duel[0].id, duel[1].id) if duel else None,
+            pending_attacker=board_ref(state.pending_attacker),
+            frenzy_candidate=board_ref(state.frenzy_candidate),
+            request=request,
+            mindbug_replay_pending=state.mindbug_replay_pending,
+            end_turn_pending=state.end_turn_pending,
+        )
+
+
+@dataclass(frozen=True)
+class Completion:
+    """
+    Complétion échantillonnée des zones cachées d'une Observation
+    (cf. Determinizer.sample_completion). Les tailles doivent correspondre.
+    """
+    opponent_hand: Tuple[str, ...]
+    # Pioches personnelles, indexées par joueur (0 = P1, 1 = P2)
+    decks: Tuple[Tuple[str, ...], Tuple[str, ...]]
+    deck: Tuple[str, ...]
@@ -0,0 +1,159 @@
+"""
+Format binaire compact d'une partie enregistrée (GameRecord).
+
+La partie est entièrement déterminée par sa graine et la suite des coups passés à
+step() : on ne stocke que cela, plus les sets actifs et l'ordre du deck (contrôle
+d'intégrité au rejeu). Un coup tient en un entier variable (varint) :
+(index + 1) << 4 | type, soit un octet pour les index < 7.
+
+Disposition (petit-boutiste, entiers en varint) :
+    "MBRC" | version u8 | drapeaux u8 | vainqueur i8 | graine (zigzag)
+    | sets (nombre, puis longueur + utf-8) | deck (idem) | coups (nombre, puis codes)
+
+Rejeu : mindbug_engine.utils.replay.GameReplayer.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+MAGIC = b"MBRC"
+FORMAT_VERSION = 1
+
+# Types de coups (4 bits) : tout ce que CommandFactory accepte
+ACTION_TYPES = ("CONFIRM_INITIATIVE", "PLAY", "ATTACK", "BLOCK", "NO_BLOCK", "MINDBUG", "PASS",
+                "SELECT_HAND", "SELECT_BOARD", "SELECT_DISCARD",
+                "SELECT_OPP_HAND", "SELECT_OPP_BOARD", "SELECT_OPP_DISCARD")
+_ACTION_CODES = {name: i for i, name in enumerate(ACTION_TYPES)}
+
+_FLAG_AUTO_INITIATIVE = 1
+_FLAG_HAS_WINNER = 2
+
+
+def encode_move(move: Tuple[str, int]) -> int:
+    action, index = move
+    if action not in _ACTION_CODES or index < -1:
+        raise ValueError(f"❌ Coup non enregistrable : {move}")
+    return (index + 1) << 4 | _ACTION_CODES[action]
+
+
+def decode_move(code: int) -> Tuple[str, int]:
+    return ACTION_TYPES[code & 0xF], (code >> 4) - 1
+
+
+# =============================================================================
+#  VARINTS
+# =============================================================================
+
+def _write_varint(out: bytearray, value: int):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("❌ Enregistrement tronqué")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_strings(out: bytearray, values):
+    _write_varint(out, len(values))
+    for value in values:
+        raw = value.encode("utf-8")
+        _write_varint(out, len(raw))
+        out += raw
+
+
+def _read_strings(data: bytes, pos: int) -> Tuple[Tuple[str, ...], int]:
+    count, pos = _read_varint(data, pos)
+    values = []
+    for _ in range(count):
+        length, pos = _read_varint(data, pos)
+        values.append(data[pos:pos + length].decode("utf-8"))
+        pos += length
+    return tuple(values), pos
+
+
+# =============================================================================
+#  ENREGISTREMENT
+# =============================================================================
+
+@dataclass(frozen=True)
+class GameRecord:
+    seed: int
+    sets: Tuple[str, ...]
+    # Ids des cartes de la partie, ordre avant le mélange initial
+    deck: Tuple[str, ...]
+    moves: Tuple[Tuple[str, int], ...]
+    winner: Optional[int] = None
+    # Initiative résolue hors step() (start_headless) : le rejeu la résout d'emblée
+    auto_initiative: bool = False
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    @classmethod
+    def from_game(cls, game) -> 'GameRecord':
+        """Enregistre une partie en cours ou terminée (elle doit avoir une graine)."""
+        if game.seed is None:
+            raise ValueError("❌ Partie sans graine : impossible à rejouer")
+        moves = tuple(game.history)
+        winner = game.state.winner
+        winner_idx = None if winner is None else (0 if winner is game.state.player1 else 1)
+        auto = (all(m[0] != "CONFIRM_INITIATIVE" for m in moves)
+                and game.state.initiative_duel is None and game.state.turn_count > 0)
+        return cls(seed=game.seed, sets=tuple(game.used_sets), deck=tuple(game.initial_deck_ids),
+                   moves=moves, winner=winner_idx, auto_initiative=auto)
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(MAGIC)
+        flags = (_FLAG_AUTO_INITIATIVE if self.auto_initiative else 0) | \
+                (_FLAG_HAS_WINNER if self.winner is not None else 0)
+        out += bytes((FORMAT_VERSION, flags, self.winner if self.winner is not None else 0))
+        _write_varint(out, self.seed * 2 if self.seed >= 0 else -self.seed * 2 - 1)
+        _write_strings(out, self.sets)
+        _write_strings(out, self.deck)
+        _write_varint(out, len(self.moves))
+        for move in self.moves:
+            _write_varint(out, encode_move(move))
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'GameRecord':
+        if data[:4] != MAGIC:
+            raise ValueError("❌ Ce n'est pas un enregistrement Mindbug")
+        if len(data) < 7 or data[4] != FORMAT_VERSION:
+            raise ValueError(f"❌ Version d'enregistrement non supportée : {data[4:5].hex()}")
+        flags, winner = data[5], data[6]
+        zigzag, pos = _read_varint(data, 7)
+        seed = zigzag // 2 if zigzag % 2 == 0 else -(zigzag + 1) // 2
+        sets, pos = _read_strings(data, pos)
+        deck, pos = _read_strings(data, pos)
+        count, pos = _read_varint(data, pos)
+        moves: List[Tuple[str, int]] = []
+        for _ in range(count):
+            code, pos = _read_varint(data, pos)
+            moves.append(decode_move(code))
+        return cls(seed=seed, sets=sets, deck=deck, moves=tuple(moves),
+                   winner=winner if flags & _FLAG_HAS_WINNER else None,
+                   auto_initiative=bool(flags & _FLAG_AUTO_INITIATIVE))
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'GameRecord':
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
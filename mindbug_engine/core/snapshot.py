@@ -0,0 +1,84 @@
+from __future__ import annotations
+import pickle
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict
+
+from mindbug_engine.core.consts import Phase
+
+if TYPE_CHECKING:
+    from mindbug_engine.core.state import GameState
+    from mindbug_engine.engine import MindbugGame
+
+# Contexte par thread : l'IA capture ses snapshots dans un thread séparé de l'UI.
+_context = threading.local()
+
+# Attributs de MindbugGame remplacés par une référence symbolique lors d'un snapshot.
+_BOUND_ATTRS = ("turn_manager", "query_manager", "combat_manager", "effect_manager")
+
+
+@dataclass(frozen=True)
+class GameSnapshot:
+    """
+    Photographie immuable et légère d'une partie, destinée aux agents IA.
+
+    Seul le GameState est sérialisé : la configuration, le DeckFactory (pool complet
+    de cartes) et les managers ne sont PAS copiés. Les callbacks de sélection en attente
+    (SelectionRequest) sont re-liés aux managers du jeu reconstruit.
+    Reconstruction : MindbugGame.from_snapshot(snapshot).
+    """
+    payload: bytes
+    active_player_idx: int
+    phase: Phase
+    turn_count: int
+
+    @property
+    def size(self) -> int:
+        """Taille en octets de l'état sérialisé."""
+        return len(self.payload)
+
+
+class GameBound:
+    """
+    Mixin pour la façade et les managers : pendant un snapshot, ces objets sont
+    sérialisés comme une simple référence nominative (ex: "effect_manager")
+    au lieu d'entraîner tout le graphe d'objets du jeu.
+    """
+
+    def __reduce_ex__(self, protocol):
+        refs: Dict[int, str] = getattr(_context, "refs", None)
+        if refs:
+            name = refs.get(id(self))
+            if name is not None:
+                return _resolve_bound, (name,)
+        return super().__reduce_ex__(protocol)
+
+
+def _resolve_bound(name: str):
+    """Résout une référence nominative vers l'objet équivalent du jeu en cours de restauration."""
+    target = _context.target
+    return target if name == "game" else getattr(target, name)
+
+
+def dump_state(game: 'MindbugGame') -> bytes:
+    """Sérialise game.state en remplaçant les références au jeu et à ses managers."""
+    refs = {id(game): "game"}
+    for attr in _BOUND_ATTRS:
+        obj = getattr(game, attr, None)
+        if obj is not None:
+            refs[id(obj)] = attr
+
+    _context.refs = refs
+    try:
+        return pickle.dumps(game.state, pickle.HIGHEST_PROTOCOL)
+    finally:
+        _context.refs = None
+
+
+def load_state(payload: bytes, target: 'MindbugGame') -> 'GameState':
+    """Désérialise un état en re-liant les références symboliques au jeu `target`."""
+    _context.target = target
+    try:
+        return pickle.loads(payload)
+    finally:
+        _context.target = None
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List, Optional, Any, Tuple
 
 from mindbug_engine.core.consts import Phase
+from mindbug_engine.core.models import zone_of
 
 if TYPE_CHECKING:
     from mindbug_engine.core.models import Player, Card, SelectionRequest
@@ -52,11 +53,55 @@ class GameState:
         """Retourne l'objet Player adverse."""
         return self.player2 if self.active_player_idx == 0 else self.player1
 
+    @property
+    def acting_player_idx(self) -> int:
+        """Index du joueur qui doit agir : le sélecteur pendant une sélection, sinon le joueur actif."""
+        req = self.active_request
+        if req is not None:
+            return 0 if req.selector is self.player1 else 1
+        return self.active_player_idx
+
     @property
     def players(self) -> List[Player]:
         """Retourne la liste des deux joueurs."""
         return [self.player1, self.player2]
 
+    def locate(self, card: Card) -> Optional[Tuple[Player, str, int]]:
+        """
+        (propriétaire, zone, position) d'une carte des zones joueurs, ou None
+        (pioche globale, carte en attente...). Zone en O(1), position lue dans la zone.
+        """
+        loc = self.player1.locate(card)
+        if loc is not None:
+            return self.player1, loc[0], loc[1]
+        loc = self.player2.locate(card)
+        if loc is not None:
+            return self.player2, loc[0], loc[1]
+        return None
+
+    def owner_of(self, card: Card) -> Optional[Player]:
+        """Joueur dont une zone contient `card`, ou None (O(1), sans calcul de position)."""
+        if zone_of(self.player1, card) is not None:
+            return self.player1
+        if zone_of(self.player2, card) is not None:
+            return self.player2
+        return None
+
+    def restrictions(self, action: str, player: Player) -> List[Tuple[Card, Any]]:
+        """
+        Registre des interdictions actives (BAN) visant `player` pour `action`
+        (ex: "BLOCK", "TRIGGER_ON_PLAY"), sous forme de paires (carte source, effet).
+        Lecture O(1) : les index sont tenus à jour par les Zones des joueurs.
+        """
+        other = self.player2 if player is self.player1 else self.player1
+        imposed = other.bans(action, "OPPONENT")
+        own = player.bans(action, "OWNER")
+        if not own:
+            return imposed
+        if not imposed:
+            return own
+        return imposed + own
+
     def __getstate__(self):
         """
         OPTIMISATION IA : Exclut les données lourdes/inutiles lors du clonage.
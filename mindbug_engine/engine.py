@@ -1,18 +1,23 @@
 import random
 import traceback
 import copy
-import pickle
-from typing import Optional, List, Tuple, Any
+from typing import Optional, List, Tuple, Any, Dict
 
 from mindbug_engine.utils.logger import log_info, log_debug, log_error
+from mindbug_engine.utils.instrumentation import EngineStats
+from mindbug_engine.utils.events import EventStream, GameEventType
 
 # --- IMPORTS CORE ---
 from mindbug_engine.core.models import Card, Player
 from mindbug_engine.core.state import GameState
-from mindbug_engine.core.consts import Phase, Keyword, Trigger
+from mindbug_engine.core.config import ConfigurationService
+from mindbug_engine.core.consts import Phase, Keyword, Trigger, keyword_mask
+from mindbug_engine.core.snapshot import GameBound, GameSnapshot, dump_state, load_state
+from mindbug_engine.core.observation import Observation, Completion
 
 # --- IMPORTS INFRASTRUCTURE ---
 from mindbug_engine.infrastructure.deck_factory import DeckFactory
+from mindbug_engine.infrastructure.card_loader import CardLoader
 from constants import PATH_DATA
 
 # --- IMPORTS MANAGERS ---
@@ -20,36 +25,50 @@ from mindbug_engine.managers.turn_manager import TurnManager
 from mindbug_engine.managers.combat_manager import CombatManager
 from mindbug_engine.managers.effect_manager import EffectManager
 from mindbug_engine.managers.query_manager import QueryManager
+from mindbug_engine.managers.event_manager import EventManager
 
 # --- IMPORTS COMMANDS & BUILDER ---
 from mindbug_engine.commands.command_factory import CommandFactory
 
 
-class MindbugGame:
+class MindbugGame(GameBound):
     """
     Moteur principal du jeu Mindbug.
     Gère le cycle de vie d'une partie, la coordination entre les managers
     et l'application des règles.
     """
 
-    def __init__(self, config: 'ConfigurationService'):
+    def __init__(self, config: 'ConfigurationService', seed: Optional[int] = None,
+                 deck_factory: Optional[DeckFactory] = None):
         """
         Initialise une nouvelle instance de jeu.
         Args:
             config: Instance du service de configuration centralisé.
+            seed: Graine du générateur aléatoire de la partie (tirage du deck,
+                  mélanges, effets RANDOM). None = partie non reproductible.
+            deck_factory: DeckFactory partagé entre parties (optionnel) : le JSON
+                  des cartes n'est alors lu qu'une fois (environnements, outils).
         """
         # 1. Configuration et Debug
         self.config = config
         self.verbose = config.debug_mode
+        self.seed = seed
+        self.rng = random.Random(seed)
 
         # 2. Infrastructure (Données et Deck)
-        self.deck_factory = DeckFactory(PATH_DATA)
+        self.deck_factory = deck_factory or DeckFactory(PATH_DATA)
 
         # Création du deck basé sur les sets actifs de la configuration
         # DeckFactory doit être configuré pour demander 22 cartes (20 + 2 pour initiative)
         game_deck, all_cards_ref, used_sets = self.deck_factory.create_deck(
-            active_sets=self.config.active_sets
+            active_sets=self.config.active_sets,
+            rng=self.rng
         )
+        if deck_factory is not None:
+            # Les cartes tirées appartiennent au pool partagé : chaque partie a ses copies
+            game_deck = [c.copy() for c in game_deck]
+        # Ordre du deck avant mélange : contrôle d'intégrité des parties enregistrées
+        self.initial_deck_ids = [c.id for c in game_deck]
         # Exposition pour l'UI ou le debug
         self.used_sets = used_sets
 
@@ -61,22 +80,42 @@ class MindbugGame:
         self.state.all_cards_ref = all_cards_ref
 
         # 4. Managers de Logique
-        self.query_manager = QueryManager(self)
-        self.turn_manager = TurnManager(self)
-        self.combat_manager = CombatManager(self)
-        self.effect_manager = EffectManager(self)
-
-        # Injection croisée finale
-        self.combat_manager.effect_manager = self.effect_manager
+        self._init_managers()
 
         # 5. État d'exécution
         self.is_over = False
+        # Coups joués par step(), dans l'ordre (cf. GameRecord)
         self.history = []
+        # Profondeur d'appel de step() : seuls les coups de premier niveau sont joués
+        # par un joueur, les coups automatiques (attaque Frenzy) en découlent
+        self._step_depth = 0
+
+        # Instrumentation optionnelle (cf. enable_stats)
+        self.stats: Optional[EngineStats] = None
+        # Flux d'événements structurés optionnel (cf. enable_events)
+        self.events: Optional[EventStream] = None
 
         if self.verbose:
             log_info(f"🎮 Jeu initialisé avec les sets : {used_sets}")
             log_info(f"🤖 Difficulté IA : {self.config.ai_difficulty.value}")
 
+    @classmethod
+    def start_headless(cls, seed: Optional[int] = None,
+                       config: 'ConfigurationService' = None,
+                       deck_factory: Optional[DeckFactory] = None) -> 'MindbugGame':
+        """
+        Crée une partie démarrée, initiative résolue, sans interface ni settings.json.
+        Avec une graine, la position de départ est reproductible (outils, tests, IA).
+        """
+        if config is None:
+            config = ConfigurationService(load_from_disk=False)
+
+        game = cls(config, seed=seed, deck_factory=deck_factory)
+        game.start_game()
+        while game.state.phase == Phase.INITIATIVE_BATTLE:
+            game.resolve_initiative_step()
+        return game
+
     def start_game(self):
         """
         Démarre la partie :
@@ -92,7 +131,7 @@ class MindbugGame:
                 f"🎲 Démarrage... Deck Global: {len(self.state.deck)} cartes.")
 
         # 1. Mélange initial
-        random.shuffle(self.state.deck)
+        self.rng.shuffle(self.state.deck)
 
         # 2. Reset des joueurs
         for p in self.state.players:
@@ -138,7 +177,7 @@ class MindbugGame:
             log_info("   -> ÉGALITÉ ! Remélange...")
             self.state.deck.append(c1)
             self.state.deck.append(c2)
-            random.shuffle(self.state.deck)
+            self.rng.shuffle(self.state.deck)
             self._draw_initiative_cards()  # On repioche immédiatement pour affichage
             return
 
@@ -192,11 +231,18 @@ class MindbugGame:
         if self.verbose:
             log_info(f"▶ STEP : {action_type} (idx={index})")
 
+        # Un coup automatique est rejoué par son coup parent : non enregistré
+        if self._step_depth == 0:
+            self.history.append((action_type, index))
         self.update_board_states()
 
+        self._step_depth += 1
         try:
             command = CommandFactory.create(action_type, index, self)
-            if command:
+            if command and self.stats is not None:
+                with self.stats.measure(f"command:{type(command).__name__}"):
+                    command.execute(self)
+            elif command:
                 command.execute(self)
             else:
                 log_debug(f"❌ Commande inconnue ou invalide : {action_type}")
@@ -205,10 +251,48 @@ class MindbugGame:
             if self.verbose:
                 traceback.print_exc()
             return
+        finally:
+            self._step_depth -= 1
 
         self.turn_manager.check_win_condition()
 
-    def get_legal_moves(self) -> List[Tuple[str, int]]:
+    def get_legal_moves(self, collapse_equivalent: bool = False) -> List[Tuple[str, int]]:
+        """
+        Coups légaux (Action, Index).
+        collapse_equivalent : ne garde qu'un coup par groupe de coups équivalents
+        (copies identiques d'une même carte, cf. collapse_equivalent_moves).
+        """
+        if self.stats is not None:
+            with self.stats.measure("legal_moves"):
+                moves = self._generate_legal_moves()
+        else:
+            moves = self._generate_legal_moves()
+        if collapse_equivalent:
+            return self.collapse_equivalent_moves(moves)
+        return moves
+
+    def collapse_equivalent_moves(self, moves: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
+        """
+        Retire les PLAY / ATTACK / BLOCK qui désignent une carte de même signature
+        (id, puissance, blessure, mots-clés) qu'un coup déjà retenu dans la même zone :
+        ils mènent à des positions identiques. Le premier coup du groupe est conservé.
+        """
+        zones = {"PLAY": self.state.active_player.hand,
+                 "ATTACK": self.state.active_player.board,
+                 "BLOCK": self.state.active_player.board}
+        seen = set()
+        result = []
+        for move in moves:
+            zone = zones.get(move[0])
+            if zone is not None and 0 <= move[1] < len(zone):
+                key = (move[0], zone[move[1]].signature())
+                if key in seen:
+                    continue
+                seen.add(key)
+            result.append(move)
+        return result
+
+    def _generate_legal_moves(self) -> List[Tuple[str, int]]:
         self.update_board_states()
         if self.state.winner:
             return []
@@ -220,14 +304,12 @@ class MindbugGame:
         # --- FIX FRENZY (State Persistence) ---
         if self.state.frenzy_candidate:
             # On vérifie si la carte est toujours en jeu (sur un board)
-            in_p1 = self.state.frenzy_candidate in self.state.player1.board
-            in_p2 = self.state.frenzy_candidate in self.state.player2.board
+            loc = self.state.locate(self.state.frenzy_candidate)
 
-            if in_p1 or in_p2:
-                owner = self.state.player1 if in_p1 else self.state.player2
+            if loc is not None and loc[1] == "board":
+                owner, _, idx = loc
                 # Si c'est à nous de jouer, on force l'attaque
                 if ap == owner:
-                    idx = ap.board.index(self.state.frenzy_candidate)
                     return [("ATTACK", idx)]
                 # Sinon (tour adversaire pour bloquer), on garde le frenzy_candidate actif
             else:
@@ -246,8 +328,9 @@ class MindbugGame:
             attacker = self.state.pending_attacker
             if attacker:
                 from mindbug_engine.utils.combat_utils import CombatUtils
+                bans = self.state.restrictions("BLOCK", ap)
                 for i, blocker in enumerate(ap.board):
-                    if CombatUtils.can_block(attacker, blocker):
+                    if CombatUtils.can_block(attacker, blocker, bans):
                         moves.append(("BLOCK", i))
         elif phase == Phase.RESOLUTION_CHOICE:
             req = self.state.active_request
@@ -314,6 +397,9 @@ class MindbugGame:
         if not attacker:
             return
 
+        if blocker is not None and self.events is not None:
+            self.events.emit(self, GameEventType.BLOCK, self.state.owner_of(blocker), blocker,
+                             attacker=attacker.id)
         self.combat_manager.resolve_fight(attacker, blocker)
         self.update_board_states()
 
@@ -330,9 +416,9 @@ class MindbugGame:
             return
 
         # Gestion Frenzy
-        att_owner = self.state.player1 if attacker in self.state.player1.board else self.state.player2
-        is_alive = attacker in att_owner.board
-        has_frenzy = Keyword.FRENZY in attacker.keywords
+        loc = self.state.locate(attacker)
+        is_alive = loc is not None and loc[1] == "board"
+        has_frenzy = attacker.has_keyword(Keyword.FRENZY)
 
         # Si la carte est vivante, a Fureur et n'a pas encore utilisé son bonus (c'est la 1ère attaque)
         if is_alive and has_frenzy and self.state.frenzy_candidate != attacker:
@@ -345,12 +431,8 @@ class MindbugGame:
 
             # AUTO ATTACK frenzy
             # On déclare immédiatement la seconde attaque pour éviter un clic inutile
-            try:
-                att_idx = att_owner.board.index(attacker)
-                log_info(f"⚡ Auto-Attack triggered for Frenzy.")
-                self.step("ATTACK", att_idx)
-            except ValueError:
-                log_error("CRITICAL: Frenzy attacker lost during processing.")
+            log_info(f"⚡ Auto-Attack triggered for Frenzy.")
+            self.step("ATTACK", loc[2])
 
             return
 
@@ -365,49 +447,212 @@ class MindbugGame:
     def put_card_on_board(self, player: Player, card: Card):
         player.board.append(card)
 
-        # Vérification des effets de banissement (Silence)
+        # Vérification des effets de banissement (Silence) via le registre
         opponent = self.state.player2 if player == self.state.player1 else self.state.player1
-        is_silenced = False
-        from mindbug_engine.core.consts import EffectType
+        is_silenced = bool(self.state.restrictions("TRIGGER_ON_PLAY", player))
 
-        for opp_card in opponent.board:
-            if opp_card.trigger == Trigger.PASSIVE:
-                for eff in opp_card.effects:
-                    if eff.type == EffectType.BAN and eff.params.get("action") == "TRIGGER_ON_PLAY":
-                        is_silenced = True
-                        break
-
-        if not is_silenced and card.trigger == Trigger.ON_PLAY:
-            self.effect_manager.apply_effect(card, player, opponent)
+        if not is_silenced:
+            EventManager.emit(Trigger.ON_PLAY, card, player, opponent, self.effect_manager)
 
     def update_board_states(self):
+        if self.stats is not None:
+            with self.stats.measure("passives"):
+                self._refresh_board_states()
+        else:
+            self._refresh_board_states()
+
+    def _refresh_board_states(self):
         for p in self.state.players:
             for c in p.board:
                 c.refresh_state()
         self.effect_manager.apply_passive_effects()
 
-    def clone(self):
+    def enable_stats(self, stats: Optional[EngineStats] = None) -> EngineStats:
         """
-        Crée une copie profonde et légère du jeu pour la simulation IA.
-        Optimisé via pickle et __getstate__.
+        Active l'instrumentation (compteurs et chronos des zones chaudes).
+        Les clones créés ensuite partagent le même objet : une décision IA
+        complète est donc mesurée.
         """
-        new_game = MindbugGame.__new__(MindbugGame)
-        new_game.verbose = False
+        self.stats = stats if stats is not None else EngineStats()
+        return self.stats
 
-        # Copie par référence des éléments immuables ou statiques
-        new_game.config = self.config
-        new_game.deck_factory = self.deck_factory
+    def disable_stats(self) -> Optional[EngineStats]:
+        """Désactive l'instrumentation et renvoie les statistiques collectées."""
+        stats, self.stats = self.stats, None
+        return stats
 
-        # OPTIMISATION MAJEURE : Pickle est ~5-10x plus rapide que deepcopy pour ce cas
-        new_game.state = pickle.loads(pickle.dumps(self.state))
+    def enable_events(self, stream: Optional[EventStream] = None, game_id: Any = None) -> EventStream:
+        """
+        Active le flux d'événements structurés (cf. mindbug_engine.utils.events).
+        Contrairement aux statistiques, les clones n'en héritent pas.
+        """
+        self.events = stream if stream is not None else EventStream(game_id=game_id)
+        return self.events
 
-        # Reconstruction des managers (rapide)
-        new_game.turn_manager = TurnManager(new_game)
-        new_game.query_manager = QueryManager(new_game)
-        new_game.combat_manager = CombatManager(new_game)
-        new_game.effect_manager = EffectManager(new_game)
+    def disable_events(self) -> Optional[EventStream]:
+        events, self.events = self.events, None
+        return events
 
-        # Ré-injection des dépendances croisées
-        new_game.combat_manager.effect_manager = new_game.effect_manager
+    def _init_managers(self):
+        """Instancie les managers de logique et leurs dépendances croisées."""
+        self.query_manager = QueryManager(self)
+        self.turn_manager = TurnManager(self)
+        self.combat_manager = CombatManager(self)
+        self.effect_manager = EffectManager(self)
+
+        # Injection croisée finale
+        self.combat_manager.effect_manager = self.effect_manager
+
+    def snapshot(self) -> GameSnapshot:
+        """
+        Capture l'état minimal nécessaire à un agent (GameState uniquement).
+        La config, le DeckFactory et les managers ne sont pas copiés.
+        """
+        return GameSnapshot(
+            payload=dump_state(self),
+            active_player_idx=self.state.active_player_idx,
+            phase=self.state.phase,
+            turn_count=self.state.turn_count,
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GameSnapshot, config: 'ConfigurationService' = None,
+                      deck_factory: Optional[DeckFactory] = None) -> 'MindbugGame':
+        """
+        Reconstruit un jeu de simulation à partir d'un snapshot.
+        Les managers sont recréés et les callbacks en attente sont re-liés au nouveau jeu.
+
+        Args:
+            snapshot: Snapshot produit par MindbugGame.snapshot().
+            config: Configuration à attacher (optionnelle pour une simulation).
+            deck_factory: Référence partagée au DeckFactory (optionnelle).
+        """
+        new_game = cls._new_shell(config, deck_factory)
+        new_game._bind_state(load_state(snapshot.payload, new_game))
+        return new_game
+
+    def observe(self, player_idx: int) -> Observation:
+        """Retourne l'ensemble d'information du joueur `player_idx` (0 = P1, 1 = P2)."""
+        return Observation.from_state(self.state, player_idx)
 
+    @classmethod
+    def from_observation(cls, obs: Observation, completion: Completion,
+                         catalog: Optional[Dict[str, Card]] = None,
+                         config: 'ConfigurationService' = None) -> 'MindbugGame':
+        """
+        Construit un jeu de simulation jouable à partir d'une Observation
+        et d'une complétion échantillonnée de ses zones cachées.
+
+        Args:
+            obs: Observation du joueur qui simule.
+            completion: IDs des cartes à placer dans les zones cachées.
+            catalog: Prototypes de cartes par ID (défaut : cards.json).
+            config: Configuration à attacher (optionnelle).
+
+        Raises:
+            ValueError: si une sélection est en cours (callback non reconstructible),
+                        ou si la complétion ne correspond pas aux tailles observées.
+        """
+        if obs.request is not None:
+            raise ValueError("Observation avec sélection en cours : utiliser snapshot().")
+
+        if catalog is None:
+            catalog = CardLoader.load_catalog(PATH_DATA)
+
+        def make(card_id: str) -> Card:
+            return catalog[card_id].copy()
+
+        me_idx = obs.observer_idx
+        opp_idx = 1 - me_idx
+        if (len(completion.opponent_hand) != obs.players[opp_idx].hand_size
+                or len(completion.deck) != obs.deck_size
+                or any(len(completion.decks[i]) != obs.players[i].deck_size for i in (0, 1))):
+            raise ValueError("Complétion incompatible avec l'observation.")
+
+        players = []
+        for idx, view in enumerate(obs.players):
+            p = Player(name=f"P{idx + 1}")
+            p.hp = view.hp
+            p.mindbugs = view.mindbugs
+            hand_ids = view.hand if idx == me_idx else completion.opponent_hand
+            p.hand = [make(cid) for cid in hand_ids]
+            p.deck = [make(cid) for cid in completion.decks[idx]]
+            p.discard = [make(cid) for cid in view.discard]
+
+            board = []
+            for cv in view.board:
+                c = make(cv.id)
+                c.power = cv.power
+                c.keyword_mask = keyword_mask(cv.keywords)
+                c.is_damaged = cv.is_damaged
+                board.append(c)
+            p.board = board
+            players.append(p)
+
+        state = GameState([make(cid) for cid in completion.deck], players[0], players[1])
+        state.active_player_idx = obs.active_player_idx
+        state.phase = obs.phase
+        state.turn_count = obs.turn_count
+        if obs.winner_idx is not None:
+            state.winner = players[obs.winner_idx]
+        if obs.pending_card is not None:
+            state.pending_card = make(obs.pending_card)
+        if obs.initiative_duel is not None:
+            state.initiative_duel = (make(obs.initiative_duel[0]), make(obs.initiative_duel[1]))
+        if obs.pending_attacker is not None:
+            p_idx, b_idx = obs.pending_attacker
+            state.pending_attacker = players[p_idx].board[b_idx]
+        if obs.frenzy_candidate is not None:
+            p_idx, b_idx = obs.frenzy_candidate
+            state.frenzy_candidate = players[p_idx].board[b_idx]
+        state.mindbug_replay_pending = obs.mindbug_replay_pending
+        state.end_turn_pending = obs.end_turn_pending
+
+        new_game = cls._new_shell(config, None)
+        new_game._bind_state(state)
+        return new_game
+
+    @classmethod
+    def _new_shell(cls, config, deck_factory) -> 'MindbugGame':
+        """Jeu vide (sans état) avec managers prêts, pour les reconstructions rapides."""
+        new_game = cls.__new__(cls)
+        new_game.config = config
+        new_game.verbose = False
+        new_game.deck_factory = deck_factory
+        new_game.seed = None
+        # Générateur global par défaut : aucun coût d'initialisation pour les simulations
+        new_game.rng = random
+        new_game.used_sets = []
+        new_game.is_over = False
+        new_game.history = []
+        new_game._step_depth = 0
+        new_game.initial_deck_ids = []
+        new_game.stats = None
+        new_game.events = None
+
+        # Les managers doivent exister AVANT le chargement : les callbacks y font référence
+        new_game.state = None
+        new_game._init_managers()
+        return new_game
+
+    def _bind_state(self, state: GameState):
+        """Attache un GameState au jeu et à tous ses managers."""
+        self.state = state
+        self.turn_manager.state = state
+        self.combat_manager.state = state
+        self.effect_manager.state = state
+
+    def clone(self):
+        """
+        Crée une copie profonde et légère du jeu pour la simulation IA.
+        Optimisé via pickle (cf. snapshot()) : seuls le GameState et les callbacks
+        en attente sont copiés, la config et le DeckFactory sont partagés.
+        """
+        new_game = MindbugGame.from_snapshot(self.snapshot(), config=self.config,
+                                             deck_factory=self.deck_factory)
+        # Copie exacte : même suite aléatoire que l'original (ex: perft reproductible)
+        if self.rng is not random:
+            new_game.rng = random.Random.__new__(random.Random)
+            new_game.rng.setstate(self.rng.getstate())
+        new_game.stats = self.stats
         return new_game
@@ -1,6 +1,8 @@
 import json
 import os
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from constants import PATH_DATA
 from mindbug_engine.core.models import Card
 from mindbug_engine.utils.logger import log_error
 
@@ -45,4 +47,28 @@ class CardLoader:
 
         except Exception as e:
             log_error(f"Erreur globale parsing JSON {file_path} : {e}")
-            return []
\ No newline at end of file
+            return []
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load_catalog(file_path: str) -> Dict[str, Card]:
+        """
+        Retourne un prototype par ID de carte (mis en cache par chemin).
+        Les prototypes sont partagés : toujours les copier (Card.copy) avant usage.
+        """
+        catalog = {}
+        for card in CardLoader.load_from_json(file_path):
+            catalog.setdefault(card.id, card)
+        return catalog
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def card_ids(file_path: str = PATH_DATA) -> Tuple[str, ...]:
+        """Ids du catalogue, triés : indexation commune des cartes (encodeur IA, archive de parties)."""
+        return tuple(sorted(CardLoader.load_catalog(file_path)))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def card_indices(file_path: str = PATH_DATA) -> Dict[str, int]:
+        """Id de carte -> position dans card_ids(). Partagé : ne pas modifier."""
+        return {card_id: i for i, card_id in enumerate(CardLoader.card_ids(file_path))}
@@ -16,7 +16,8 @@ class DeckFactory:
 
     def create_deck(self,
                     active_sets: Optional[List[str]] = None,
-                    active_card_ids: Optional[List[str]] = None) -> Tuple[List[Card], List[Card], List[str]]:
+                    active_card_ids: Optional[List[str]] = None,
+                    rng: Optional[random.Random] = None) -> Tuple[List[Card], List[Card], List[str]]:
 
         # 1. Identification des sets disponibles
         available_sets_map: Dict[str, str] = {}
@@ -62,7 +63,7 @@ class DeckFactory:
 
         game_deck = []
         if len(candidates) > REQUIRED_CARDS:
-            game_deck = random.sample(candidates, REQUIRED_CARDS)
+            game_deck = (rng or random).sample(candidates, REQUIRED_CARDS)
         else:
             game_deck = list(candidates)
 
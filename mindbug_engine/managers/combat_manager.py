@@ -1,14 +1,18 @@
 from typing import Optional, Tuple, TYPE_CHECKING
-from mindbug_engine.core.models import Card, Player
-from mindbug_engine.core.consts import Keyword, Trigger
-from mindbug_engine.utils.logger import log_info, log_debug
+from mindbug_engine.core.snapshot import GameBound
+from mindbug_engine.core.models import Card, Player, zone_of
+from mindbug_engine.core.consts import Trigger
+from mindbug_engine.managers.event_manager import EventManager
+from mindbug_engine.utils.combat_oracle import CombatOracle
+from mindbug_engine.utils.events import GameEventType
+from mindbug_engine.utils.logger import log_info
 
 if TYPE_CHECKING:
     from mindbug_engine.engine import MindbugGame
     from mindbug_engine.managers.effect_manager import EffectManager
 
 
-class CombatManager:
+class CombatManager(GameBound):
     """
     Gère la résolution mathématique et logique des combats.
 
@@ -39,10 +43,8 @@ class CombatManager:
 
         # --- CAS 1 : ATTAQUE DIRECTE (Pas de bloqueur) ---
         if not blocker:
-            # Vérification Trigger ON_UNBLOCKED (ex: Turboustique)
-            if attacker.trigger == Trigger.ON_UNBLOCKED:
-                log_info(f"⚡ Trigger {Trigger.ON_UNBLOCKED} activated for {attacker.name}.")
-                self.effect_manager.apply_effect(attacker, att_owner, def_owner)
+            # Trigger ON_UNBLOCKED (ex: Turboustique)
+            EventManager.emit(Trigger.ON_UNBLOCKED, attacker, att_owner, def_owner, self.effect_manager)
 
             # Dégâts normaux (si pas d'effet spécifique qui annule l'attaque)
             damage = attacker.power
@@ -53,6 +55,10 @@ class CombatManager:
                 # Note : Les règles standard Mindbug disent "Perd 1 PV". Si vous jouez avec "Dégâts = Puissance", changez en -= damage.
                 # Ici je mets -1 PV par défaut comme le jeu physique standard.
                 if def_owner.hp < 0: def_owner.hp = 0
+                events = getattr(self.game, "events", None)
+                if events is not None:
+                    events.emit(self.game, GameEventType.DAMAGE, def_owner, attacker,
+                                amount=1, hp=def_owner.hp)
             else:
                 log_info(f"⚔️ {attacker.name} has 0 power, no damage dealt.")
 
@@ -61,42 +67,32 @@ class CombatManager:
         # --- CAS 2 : COMBAT DE CRÉATURES ---
 
         # 1. Trigger ON_BLOCKED (ex: Effet qui tue le bloqueur avant le combat)
-        if attacker.trigger == Trigger.ON_BLOCKED:
-            log_info(f"⚡ Trigger {Trigger.ON_BLOCKED} activated for {attacker.name}")
-            self.effect_manager.apply_effect(attacker, att_owner, def_owner)
-
-            # Si le bloqueur a été retiré par l'effet (ex: détruit), le combat s'arrête
-            if blocker not in def_owner.board:
-                log_info(f"> Blocker removed by effect. Combat ends.")
-                return False, True  # Attaquant vivant, Bloqueur considéré mort/parti
+        #    puis ON_BLOCK (effet du bloqueur au moment où il bloque)
+        blk_owner = self._get_owner(blocker)
+        EventManager.emit(Trigger.ON_BLOCKED, attacker, att_owner, def_owner, self.effect_manager)
+        if zone_of(def_owner, blocker) == "board":
+            EventManager.emit(Trigger.ON_BLOCK, blocker, blk_owner, att_owner, self.effect_manager)
+
+        # Si le bloqueur a été retiré par un effet (ex: détruit), le combat s'arrête
+        if zone_of(def_owner, blocker) != "board":
+            log_info(f"> Blocker removed by effect. Combat ends.")
+            return False, True  # Attaquant vivant, Bloqueur considéré mort/parti
+        if zone_of(att_owner, attacker) != "board":
+            log_info(f"> Attacker removed by effect. Combat ends.")
+            return True, False
 
         # 2. Logique de Combat (Puissance & Mots-clés)
         log_info(f"⚔️ Combat : {attacker.name} ({attacker.power}) vs {blocker.name} ({blocker.power})")
 
-        att_poison = Keyword.POISON in attacker.keywords
-        blk_poison = Keyword.POISON in blocker.keywords
-
-        att_die = False
-        blk_die = False
-
-        # A. Comparaison Puissance
-        if attacker.power > blocker.power:
-            blk_die = True
-        elif blocker.power > attacker.power:
-            att_die = True
-        else:
-            # Égalité
-            att_die = True
-            blk_die = True
+        # Puissance, Poison et Tenace : issue lue dans la table de l'oracle
+        outcome = CombatOracle.duel(attacker, blocker)
+        att_die, blk_die = outcome.att_dies, outcome.blk_dies
 
-        # B. Application Poison (L'emporte sur la puissance)
-        if att_poison: blk_die = True
-        if blk_poison: att_die = True
-
-        # C. Sauvegarde Tenace (Tough)
-        # Si la créature doit mourir, on check si elle a un bouclier
-        att_die = self._apply_tough_save(attacker, att_die)
-        blk_die = self._apply_tough_save(blocker, blk_die)
+        # Sauvegarde Tenace (Tough) : la carte survit mais est marquée blessée
+        if outcome.att_saved:
+            self._mark_tough_save(attacker)
+        if outcome.blk_saved:
+            self._mark_tough_save(blocker)
 
         # 3. Application des Morts (Physique + Triggers)
         if att_die:
@@ -116,38 +112,27 @@ class CombatManager:
         Retrait du plateau -> Ajout Défausse -> Trigger ON_DEATH.
         """
         # 1. Déplacement physique
-        if card in owner.board:
+        if zone_of(owner, card) == "board":
             owner.board.remove(card)
             owner.discard.append(card)
+            events = getattr(self.game, "events", None)
+            if events is not None:
+                events.emit(self.game, GameEventType.DEATH, owner, card)
 
         # 2. Reset (on retire les dégâts, buffs temporaires, etc.)
         card.reset()
 
         # 3. Trigger ON_DEATH (Dernier Souffle)
-        if card.trigger == Trigger.ON_DEATH:
-            log_debug(f"⚡ Trigger ON_DEATH activated for {card.name}")
-
-            opponent = self.state.player2 if owner == self.state.player1 else self.state.player1
+        opponent = self.state.player2 if owner == self.state.player1 else self.state.player1
+        EventManager.emit(Trigger.ON_DEATH, card, owner, opponent, self.effect_manager)
 
-            if self.effect_manager:
-                self.effect_manager.apply_effect(card, owner, opponent)
-            else:
-                log_debug("⚠️ EffectManager not linked in CombatManager!")
-
-    def _apply_tough_save(self, card: Card, is_dying: bool) -> bool:
+    def _mark_tough_save(self, card: Card):
         """
-        Gère la survie via Tenace (Tough).
+        Survie via Tenace (Tough).
         """
-        # Si la carte doit mourir ET qu'elle a TOUGH (donc pas encore damaged ou base tough)
-        if is_dying and Keyword.TOUGH in card.keywords:
-            log_info(f"   🛡️ {card.name} uses TOUGH ! It survives.")
-
-            # On marque le dégât. Le Keyword sera retiré au prochain update_board_states()
-            card.is_damaged = True
-
-            return False  # La carte ne meurt pas
-
-        return is_dying
+        log_info(f"   🛡️ {card.name} uses TOUGH ! It survives.")
+        # On marque le dégât. Le Keyword sera retiré au prochain update_board_states()
+        card.is_damaged = True
 
     def calculate_real_power(self, card: Card, owner: Player, opponent: Player) -> int:
         """
@@ -158,6 +143,6 @@ class CombatManager:
 
     def _get_owner(self, card: Card) -> Player:
         p1 = self.state.player1
-        if card in p1.board:
+        if zone_of(p1, card) == "board":
             return p1
         return self.state.player2
\ No newline at end of file
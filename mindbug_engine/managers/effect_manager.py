@@ -1,8 +1,10 @@
 import random
 from functools import partial
 from typing import List, Dict, Any, TYPE_CHECKING
+from mindbug_engine.core.snapshot import GameBound
 from mindbug_engine.core.models import Card, Player, CardEffect
 from mindbug_engine.core.consts import Trigger, EffectType
+from mindbug_engine.utils.events import GameEventType
 from mindbug_engine.utils.logger import log_info, log_error
 
 # Imports des actions
@@ -19,7 +21,7 @@ if TYPE_CHECKING:
     from mindbug_engine.engine import MindbugGame
 
 
-class EffectManager:
+class EffectManager(GameBound):
     def __init__(self, game: 'MindbugGame'):
         self.game = game
         self.state = game.state
@@ -52,33 +54,40 @@ class EffectManager:
         p1 = self.state.player1
         p2 = self.state.player2
 
+        # Seules les cartes abonnées à PASSIVE sont visitées (index des Zones)
         all_sources = []
-        for c in p1.board:
+        for c in p1.subscribers(Trigger.PASSIVE):
             all_sources.append((c, p1, p2))
-        for c in p2.board:
+        for c in p2.subscribers(Trigger.PASSIVE):
             all_sources.append((c, p2, p1))
 
         for card, owner, opp in all_sources:
-            if card.trigger == Trigger.PASSIVE:
-                for effect in card.effects:
-                    # On ignore les interdictions (BAN) ici car elles sont gérées par les règles de combat
-                    if effect.type == EffectType.BAN:
-                        continue
+            for effect in card.effects:
+                # On ignore les interdictions (BAN) ici car elles sont gérées par les règles de combat
+                if effect.type == EffectType.BAN:
+                    continue
 
-                    if not self._check_global_conditions(effect.condition, owner, opp):
-                        continue
+                if not self._check_global_conditions(effect.condition, owner, opp):
+                    continue
 
-                    # Récupération des cibles
-                    raw_candidates = self._get_candidates(
-                        effect, card, owner, opp)
-                    targets = self._filter_targets(
-                        raw_candidates, effect.condition)
+                # Récupération des cibles
+                raw_candidates = self._get_candidates(
+                    effect, card, owner, opp)
+                targets = self._filter_targets(
+                    raw_candidates, effect.condition)
 
-                    for t in targets:
-                        self._dispatch_verb(effect, t, card, owner, opp)
+                for t in targets:
+                    self._dispatch_verb(effect, t, card, owner, opp)
 
     def _process_single_effect(self, effect: CardEffect, source_card: Card, owner: Player, opponent: Player):
         """Gère la sélection des cibles (Auto, Random, Choix) puis exécute l'action."""
+        stats = getattr(self.game, "stats", None)
+        if stats is not None:
+            with stats.measure(f"effect:{getattr(effect.type, 'value', effect.type)}"):
+                return self._select_and_resolve(effect, source_card, owner, opponent)
+        return self._select_and_resolve(effect, source_card, owner, opponent)
+
+    def _select_and_resolve(self, effect: CardEffect, source_card: Card, owner: Player, opponent: Player):
         candidates = self._get_candidates(effect, source_card, owner, opponent)
         valid_targets = self._filter_targets(candidates, effect.condition)
 
@@ -100,7 +109,9 @@ class EffectManager:
         elif select_method == "RANDOM":
             nb = len(valid_targets) if count == "ALL" else count
             # random.sample plante si k > len, donc on prend le min
-            chosen = random.sample(valid_targets, min(nb, len(valid_targets)))
+            # Générateur de la partie (reproductibilité), module random à défaut
+            rng = getattr(self.game, "rng", random)
+            chosen = rng.sample(valid_targets, min(nb, len(valid_targets)))
             callback(chosen)
 
         elif select_method in ["CHOICE_USER", "CHOICE_OPP"]:
@@ -123,15 +134,27 @@ class EffectManager:
     def _dispatch_verb(self, effect, target, source, owner, opp):
         """Délègue l'exécution à la classe d'action appropriée."""
         action_handler = self._actions.get(effect.type)
+        events = getattr(self.game, "events", None)
+        hp_before = target.hp if events is not None and isinstance(target, Player) else None
         if action_handler:
             try:
-                action_handler.execute(
-                    target, effect.params, source, owner, opp)
+                stats = getattr(self.game, "stats", None)
+                if stats is not None:
+                    with stats.measure(f"action:{type(action_handler).__name__}"):
+                        action_handler.execute(
+                            target, effect.params, source, owner, opp)
+                else:
+                    action_handler.execute(
+                        target, effect.params, source, owner, opp)
             except Exception as e:
                 log_error(f"Erreur exécution action {effect.type}: {e}")
         else:
             log_error(f"⚠️ Action non gérée : {effect.type}")
 
+        if hp_before is not None and target.hp < hp_before:
+            events.emit(self.game, GameEventType.DAMAGE, target, source,
+                        amount=hp_before - target.hp, hp=target.hp)
+
     # =========================================================================
     #  HELPERS DE CIBLAGE ET FILTRAGE
     # =========================================================================
@@ -228,8 +251,6 @@ class EffectManager:
         """Helper utilitaire pour récupérer le propriétaire d'une carte."""
         if isinstance(card_or_player, Player):
             return card_or_player
-        p1 = self.state.player1
-        # On vérifie toutes les zones
-        if card_or_player in p1.hand + p1.board + p1.discard:
-            return p1
-        return self.state.player2
+        # Index de localisation : O(1), sans concaténer les zones
+        owner = self.state.owner_of(card_or_player)
+        return owner if owner is not None else self.state.player2
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 from mindbug_engine.managers.effects.base import EffectAction
-from mindbug_engine.core.consts import Keyword
+from mindbug_engine.core.consts import Keyword, KEYWORD_BITS
+from mindbug_engine.core.models import grant_keywords
 from mindbug_engine.utils.logger import log_info
 
 
@@ -27,9 +28,8 @@ class AddKeywordAction(EffectAction):
                 # Conversion de la string en Enum Keyword pour garantir la validité
                 kw = Keyword(kw_str)
 
-                # On ne l'ajoute que s'il n'est pas déjà présent
-                if kw not in target.keywords:
-                    target.keywords.append(kw)
+                # OU binaire : sans effet si le mot-clé est déjà présent
+                if grant_keywords(target, KEYWORD_BITS[kw.value]):
                     log_info(f"   -> Mot-clé {kw.value} ajouté à {target.name}")
             except ValueError:
                 # Log d'erreur si le mot-clé dans le JSON n'existe pas dans l'Enum
@@ -1,5 +1,6 @@
 from typing import Any, Dict
 from mindbug_engine.managers.effects.base import EffectAction
+from mindbug_engine.core.models import mask_of, grant_keywords
 
 class CopyKeywordsAction(EffectAction):
     def __init__(self, effect_manager):
@@ -16,6 +17,4 @@ class CopyKeywordsAction(EffectAction):
 
         for src in sources:
             if hasattr(src, 'keywords'):
-                for kw in src.keywords:
-                    if kw not in target.keywords:
-                        target.keywords.append(kw)
\ No newline at end of file
+                grant_keywords(target, mask_of(src))
\ No newline at end of file
@@ -1,6 +1,6 @@
 from typing import Any, Dict
 from mindbug_engine.managers.effects.base import EffectAction
-from mindbug_engine.core.models import Card
+from mindbug_engine.core.models import Card, zone_of
 
 class DestroyAction(EffectAction):
     def __init__(self, combat_manager):
@@ -10,4 +10,4 @@ class DestroyAction(EffectAction):
         if isinstance(target, Card):
             # On réutilise la logique de mort centralisée dans le CombatManager
             # qui gère le déplacement vers la défausse et le reset
-            self.combat_manager.apply_lethal_damage(target, owner if target in owner.board else opponent)
+            self.combat_manager.apply_lethal_damage(target, owner if zone_of(owner, target) == "board" else opponent)
@@ -2,6 +2,7 @@ from typing import Any, Dict
 from mindbug_engine.managers.effects.base import EffectAction
 # AJOUT de l'import pour les logs
 from mindbug_engine.utils.logger import log_info
+from mindbug_engine.core.models import zone_of
 
 
 class DiscardAction(EffectAction):
@@ -14,9 +15,9 @@ class DiscardAction(EffectAction):
         from mindbug_engine.core.models import Player
 
         # On cherche à qui appartient la main contenant la cible
-        card_owner = opponent if target in opponent.hand else owner
+        card_owner = opponent if zone_of(opponent, target) == "hand" else owner
 
-        if target in card_owner.hand:
+        if zone_of(card_owner, target) == "hand":
             card_owner.hand.remove(target)
             card_owner.discard.append(target)
 
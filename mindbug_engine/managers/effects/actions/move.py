@@ -1,5 +1,6 @@
 from typing import Any, Dict
 from mindbug_engine.managers.effects.base import EffectAction
+from mindbug_engine.core.models import zone_of
 
 
 class MoveAction(EffectAction):
@@ -9,7 +10,7 @@ class MoveAction(EffectAction):
         if dest == "HAND":
             # On cherche la carte dans les défausses
             for p in [owner, opponent]:
-                if target in p.discard:
+                if zone_of(p, target) == "discard":
                     p.discard.remove(target)
                     target.reset()  # La carte redevient "neuve" en retournant en main
                     p.hand.append(target)
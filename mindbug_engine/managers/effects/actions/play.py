@@ -1,6 +1,6 @@
 from typing import Any, Dict
 from mindbug_engine.managers.effects.base import EffectAction
-from mindbug_engine.core.models import Card
+from mindbug_engine.core.models import Card, zone_of
 from mindbug_engine.utils.logger import log_info
 
 class PlayAction(EffectAction):
@@ -14,7 +14,7 @@ class PlayAction(EffectAction):
         card_owner = self.game.effect_manager._get_owner(target)
 
         # On retire la carte de sa zone actuelle (souvent la défausse)
-        if target in card_owner.discard:
+        if zone_of(card_owner, target) == "discard":
             card_owner.discard.remove(target)
         
         # On la place sur le plateau de celui qui a activé l'effet
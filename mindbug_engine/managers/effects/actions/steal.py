@@ -1,6 +1,6 @@
 from typing import Any, Dict
 from mindbug_engine.managers.effects.base import EffectAction
-from mindbug_engine.core.models import Card
+from mindbug_engine.core.models import Card, zone_of
 from mindbug_engine.utils.logger import log_info
 
 class StealAction(EffectAction):
@@ -15,14 +15,16 @@ class StealAction(EffectAction):
         if not victim or thief == victim:
             return 
 
+        zone = zone_of(victim, target)
+
         # Cas 1 : Vol sur le plateau (Board)
-        if target in victim.board:
+        if zone == "board":
             victim.board.remove(target)
             thief.board.append(target)
             log_info(f"   -> {thief.name} vole {target.name} (Plateau)")
 
         # Cas 2 : Vol dans la main (Hand)
-        elif target in victim.hand:
+        elif zone == "hand":
             victim.hand.remove(target)
             thief.hand.append(target)
             # On demande au TurnManager de compléter la main de la victime si besoin
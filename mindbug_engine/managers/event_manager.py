@@ -0,0 +1,71 @@
+from typing import Optional, TYPE_CHECKING
+from mindbug_engine.core.models import Card, Player
+from mindbug_engine.utils.events import GameEventType
+from mindbug_engine.utils.logger import log_info, log_debug
+
+if TYPE_CHECKING:
+    from mindbug_engine.managers.effect_manager import EffectManager
+
+
+class EventManager:
+    """
+    Dispatcher des événements de jeu (Triggers).
+
+    Le moteur émet un événement (ON_PLAY, ON_ATTACK, ON_BLOCK, ...) pour une carte
+    "sujet". Seules les cartes abonnées sont visitées :
+    1. Le sujet lui-même, si son trigger est l'événement (scope SELF, cas standard).
+    2. Les cartes en jeu abonnées à l'événement avec un scope ALLIES / ENEMIES / ANY,
+       lues dans l'index Player.subscribers() maintenu par les Zones.
+
+    Sans état : l'EffectManager à utiliser est passé à chaque émission (le
+    CombatManager peut ainsi recevoir le sien par injection).
+    """
+
+    @staticmethod
+    def emit(trigger: str, subject: Optional[Card], owner: Player, opponent: Player,
+             effect_manager: Optional['EffectManager']) -> bool:
+        """
+        Déclenche `trigger` pour `subject` (contrôlé par `owner`).
+        Retourne True si au moins un effet a été appliqué.
+        """
+        if effect_manager is None:
+            log_debug(f"⚠️ EffectManager not linked, {trigger} ignored.")
+            return False
+
+        fired = False
+        if subject is not None and subject.trigger == trigger \
+                and getattr(subject, "trigger_scope", "SELF") == "SELF":
+            log_info(f"⚡ Trigger {trigger} activated for {subject.name}.")
+            EventManager._record(effect_manager, trigger, subject, owner)
+            effect_manager.apply_effect(subject, owner, opponent)
+            fired = True
+
+        # Écouteurs des autres cartes (index par trigger, pas de scan du plateau)
+        for player, other, allied in ((owner, opponent, True), (opponent, owner, False)):
+            if not isinstance(player, Player):
+                continue
+            listeners = player.subscribers(trigger)
+            if not listeners:
+                continue
+            for listener in list(listeners):
+                scope = listener.trigger_scope
+                if scope == "SELF" or listener is subject:
+                    continue
+                if scope == "ANY" or (scope == "ALLIES" and allied) \
+                        or (scope == "ENEMIES" and not allied):
+                    log_info(f"⚡ Trigger {trigger} ({scope}) activated for {listener.name}.")
+                    EventManager._record(effect_manager, trigger, listener, player, subject)
+                    effect_manager.apply_effect(listener, player, other)
+                    fired = True
+        return fired
+
+    @staticmethod
+    def _record(effect_manager: 'EffectManager', trigger: str, card: Card, owner: Player,
+                subject: Optional[Card] = None):
+        """Événement TRIGGER dans le flux structuré du jeu, s'il est activé."""
+        game = getattr(effect_manager, "game", None)
+        events = getattr(game, "events", None)
+        if events is None:
+            return
+        events.emit(game, GameEventType.TRIGGER, owner, card, trigger=getattr(trigger, "value", trigger),
+                    subject=None if subject is None else subject.id)
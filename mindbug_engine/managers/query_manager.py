@@ -1,6 +1,8 @@
 from typing import Any, List, TYPE_CHECKING
+from mindbug_engine.core.snapshot import GameBound
 from mindbug_engine.core.consts import Phase
 from mindbug_engine.core.models import SelectionRequest
+from mindbug_engine.utils.events import GameEventType, object_id
 from mindbug_engine.utils.logger import log_info, log_debug, log_error
 
 # Import conditionnel pour éviter les cycles, ou import direct depuis le bon fichier
@@ -8,7 +10,7 @@ if TYPE_CHECKING:
     from mindbug_engine.core.state import GameState
     from mindbug_engine.engine import MindbugGame
 
-class QueryManager:
+class QueryManager(GameBound):
     """
     Responsable UNIQUE de la gestion des interactions (Questions/Réponses).
     Gère le cycle de vie d'une SelectionRequest.
@@ -43,6 +45,11 @@ class QueryManager:
         self.game.state.phase = Phase.RESOLUTION_CHOICE
 
         log_info(f"[QUERY] {selector.name} must choose {count} target(s) for {reason}.")
+        events = getattr(self.game, "events", None)
+        if events is not None:
+            events.emit(self.game, GameEventType.SELECTION_REQUESTED, selector,
+                        reason=getattr(reason, "value", reason), count=count,
+                        candidates=[object_id(c) for c in candidates])
 
     def resolve_selection(self, selected_items: List[Any]) -> bool:
         """
@@ -77,6 +84,11 @@ class QueryManager:
             # On ferme la requête AVANT le callback
             # (Car le callback pourrait déclencher une nouvelle requête !)
             self.game.state.active_request = None
+            events = getattr(self.game, "events", None)
+            if events is not None:
+                events.emit(self.game, GameEventType.SELECTION_RESOLVED, req.selector,
+                            reason=getattr(req.reason, "value", req.reason),
+                            selected=[object_id(c) for c in final_selection])
 
             # 3. Exécution du Callback (L'effet réel)
             if req.callback:
@@ -1,8 +1,10 @@
+from mindbug_engine.core.snapshot import GameBound
 from mindbug_engine.core.consts import Phase
+from mindbug_engine.utils.events import GameEventType
 from mindbug_engine.utils.logger import log_info, log_debug
 
 
-class TurnManager:
+class TurnManager(GameBound):
     """
     Gère le flux temporel du jeu : Tours, Phases, Conditions de victoire.
     Aligné Architecture V3 (Reçoit 'game' en dépendance).
@@ -51,6 +53,10 @@ class TurnManager:
         if self.state.winner:
             return
 
+        events = getattr(self.game, "events", None)
+        if events is not None:
+            events.emit(self.game, GameEventType.TURN_END, self.state.active_player_idx)
+
         # 2. Pioche
         self.refill_hand(self.state.player1)
         self.refill_hand(self.state.player2)
@@ -84,3 +90,8 @@ class TurnManager:
             self.state.phase = Phase.GAME_OVER
             log_info(
                 f"🏆 VICTOIRE : {self.state.player1.name} gagne la partie !")
+
+        events = getattr(self.game, "events", None)
+        if self.state.winner and events is not None:
+            events.emit(self.game, GameEventType.GAME_OVER, self.state.winner,
+                        hp=[self.state.player1.hp, self.state.player2.hp])
@@ -0,0 +1,295 @@
+"""
+Archive de parties enregistrées : un fichier de données + deux index à largeur fixe.
+
+- <nom>.mbra : en-tête "MBRA" + version, puis les GameRecord.to_bytes() bout à bout ;
+- <nom>.games : une ligne GAME_DTYPE par partie (position dans le fichier, graine,
+  vainqueur, nombre de coups, cartes vues / jouées / mindbuggées en masques de bits) ;
+- <nom>.positions : une ligne POSITION_DTYPE par coup (partie, numéro, phase,
+  joueur qui agit, type de coup, carte concernée).
+
+Les index sont calculés une fois, à l'ajout (rejeu de la partie), puis lus en
+memmap : les requêtes sont des masques NumPy, sans lire ni rejouer les parties.
+Seule la reconstruction d'une position (position()) rejoue la partie visée.
+Un ajout écrit les données, les positions, puis la ligne .games : un ajout
+interrompu (ligne absente) est ignoré à la lecture et écrasé au suivant.
+"""
+import os
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from constants import PATH_DATA
+from mindbug_engine.core.consts import Phase
+from mindbug_engine.core.record import ACTION_TYPES, GameRecord
+from mindbug_engine.infrastructure.card_loader import CardLoader
+from mindbug_engine.infrastructure.deck_factory import DeckFactory
+from mindbug_engine.utils.replay import GameReplayer
+
+MAGIC = b"MBRA"
+FORMAT_VERSION = 1
+_HEADER = MAGIC + bytes((FORMAT_VERSION,))
+
+# Bit i des masques de cartes = CardLoader.card_ids()[i] (ordre du catalogue)
+_MASK_WORDS = 2  # 128 cartes
+
+PHASES = tuple(Phase)
+_PHASE_CODES = {phase: i for i, phase in enumerate(PHASES)}
+_ACTION_CODES = {name: i for i, name in enumerate(ACTION_TYPES)}
+
+GAME_DTYPE = np.dtype([
+    ("offset", "<u8"), ("size", "<u4"), ("seed", "<i8"), ("moves", "<u4"),
+    ("winner", "i1"), ("mindbugs", "u1"),
+    ("seen", "<u8", (_MASK_WORDS,)), ("played", "<u8", (_MASK_WORDS,)),
+    ("mindbugged", "<u8", (_MASK_WORDS,)),
+    ("first_position", "<u8"),
+])
+POSITION_DTYPE = np.dtype([
+    ("game", "<u4"), ("ply", "<u2"), ("phase", "u1"), ("player", "i1"),
+    ("action", "u1"), ("card", "<i2"),
+])
+
+
+def card_index(card: Union[str, int]) -> int:
+    """Index de catalogue d'une carte, par id ("15") ou par nom ("Gorillion")."""
+    if isinstance(card, int):
+        return card
+    indices = CardLoader.card_indices()
+    if card in indices:
+        return indices[card]
+    for card_id, proto in CardLoader.load_catalog(PATH_DATA).items():
+        if proto.name == card:
+            return indices[card_id]
+    raise KeyError(f"❌ Carte inconnue : {card}")
+
+
+def _set_bit(mask: np.ndarray, index: int):
+    mask[index // 64] |= np.uint64(1) << np.uint64(index % 64)
+
+
+def _move_card(game, move) -> Optional[str]:
+    """Id de la carte désignée par un coup (avant qu'il soit joué)."""
+    action, idx = move
+    state = game.state
+    ap = state.active_player
+    if action == "PLAY" and 0 <= idx < len(ap.hand):
+        return ap.hand[idx].id
+    if action in ("ATTACK", "BLOCK") and 0 <= idx < len(ap.board):
+        return ap.board[idx].id
+    if action == "MINDBUG" and state.pending_card is not None:
+        return state.pending_card.id
+    return None
+
+
+class ReplayArchive:
+
+    def __init__(self, path: str, snapshot_interval: int = 32):
+        """path : chemin sans extension ; les fichiers sont créés au premier ajout."""
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self.data_path = path + ".mbra"
+        self.games_path = path + ".games"
+        self.positions_path = path + ".positions"
+        self._deck_factory = None
+        self._replayers: Dict[int, GameReplayer] = {}
+        self._load()
+
+    # =========================================================================
+    #  LECTURE
+    # =========================================================================
+
+    def _load(self):
+        """
+        Une partie n'existe qu'une fois sa ligne écrite dans .games (écrite en dernier) :
+        les lignes de positions et octets de données au-delà, laissés par un ajout
+        interrompu, sont ignorés ici puis écrasés au prochain ajout.
+        """
+        def mapped(path, dtype, count):
+            if count == 0:
+                return np.zeros(0, dtype=dtype)
+            return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+
+        if os.path.exists(self.data_path):
+            with open(self.data_path, "rb") as f:
+                if f.read(len(_HEADER)) != _HEADER:
+                    raise ValueError(f"❌ Archive illisible ou version non supportée : {self.data_path}")
+        games_size = os.path.getsize(self.games_path) if os.path.exists(self.games_path) else 0
+        self.games = mapped(self.games_path, GAME_DTYPE, games_size // GAME_DTYPE.itemsize)
+        self.positions = mapped(self.positions_path, POSITION_DTYPE, self._position_count())
+        self._data = mapped(self.data_path, np.uint8, self._data_size())
+        self._replayers.clear()
+
+    def _position_count(self) -> int:
+        if len(self.games) == 0:
+            return 0
+        last = self.games[-1]
+        return int(last["first_position"]) + int(last["moves"])
+
+    def _data_size(self) -> int:
+        if len(self.games) == 0:
+            return len(_HEADER) if os.path.exists(self.data_path) else 0
+        last = self.games[-1]
+        return int(last["offset"]) + int(last["size"])
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def record(self, game: int) -> GameRecord:
+        row = self.games[game]
+        start = int(row["offset"])
+        return GameRecord.from_bytes(bytes(self._data[start:start + int(row["size"])]))
+
+    def replayer(self, game: int) -> GameReplayer:
+        if game not in self._replayers:
+            if len(self._replayers) >= 16:
+                self._replayers.pop(next(iter(self._replayers)))
+            self._replayers[game] = GameReplayer(self.record(game), self.snapshot_interval,
+                                                 deck_factory=self._factory())
+        return self._replayers[game]
+
+    def position(self, game: int, ply: int):
+        """MindbugGame de la partie `game` avant le coup `ply`."""
+        return self.replayer(game).position(ply)
+
+    # =========================================================================
+    #  REQUÊTES (masques NumPy sur les index)
+    # =========================================================================
+
+    @staticmethod
+    def _has_card(masks: np.ndarray, card) -> np.ndarray:
+        index = card_index(card)
+        return ((masks[:, index // 64] >> np.uint64(index % 64)) & np.uint64(1)).astype(bool)
+
+    def find_games(self, winner: Optional[int] = None, seen=None, played=None, mindbugged=None,
+                   min_moves: int = 0) -> np.ndarray:
+        """
+        Indices des parties vérifiant tous les critères donnés.
+        seen : carte apparue face visible (terrain ou défausse) ; winner=-1 : parties sans vainqueur.
+        """
+        games = self.games
+        keep = games["moves"] >= min_moves
+        if winner is not None:
+            keep &= games["winner"] == winner
+        if seen is not None:
+            keep &= self._has_card(games["seen"], seen)
+        if played is not None:
+            keep &= self._has_card(games["played"], played)
+        if mindbugged is not None:
+            keep &= self._has_card(games["mindbugged"], mindbugged)
+        return np.flatnonzero(keep)
+
+    def find_positions(self, phase: Optional[Phase] = None, action: Optional[str] = None,
+                       card=None, player: Optional[int] = None) -> np.ndarray:
+        """
+        Lignes de self.positions vérifiant les critères (ex: action="MINDBUG",
+        card="Gorillion" : toutes les positions où Gorillion a été mindbuggé).
+        """
+        pos = self.positions
+        keep = np.ones(len(pos), dtype=bool)
+        if phase is not None:
+            keep &= pos["phase"] == _PHASE_CODES[Phase(phase)]
+        if action is not None:
+            keep &= pos["action"] == _ACTION_CODES[action]
+        if card is not None:
+            keep &= pos["card"] == card_index(card)
+        if player is not None:
+            keep &= pos["player"] == player
+        return np.flatnonzero(keep)
+
+    def sample_positions(self, size: int, rng: Optional[np.random.Generator] = None, **criteria) -> np.ndarray:
+        """Tire `size` lignes de positions (avec remise) parmi celles vérifiant les critères."""
+        rng = rng or np.random.default_rng()
+        rows = self.find_positions(**criteria)
+        if len(rows) == 0:
+            return rows
+        return rng.choice(rows, size=size)
+
+    def position_at(self, row: int):
+        """MindbugGame correspondant à une ligne de self.positions."""
+        pos = self.positions[row]
+        return self.position(int(pos["game"]), int(pos["ply"]))
+
+    # =========================================================================
+    #  AJOUT
+    # =========================================================================
+
+    def _factory(self) -> DeckFactory:
+        if self._deck_factory is None:
+            self._deck_factory = DeckFactory(PATH_DATA)
+        return self._deck_factory
+
+    def _index(self, record: GameRecord, game_id: int):
+        """Rejoue la partie une fois et calcule ses lignes d'index."""
+        indices = CardLoader.card_indices()
+        if len(indices) > 64 * _MASK_WORDS:
+            raise RuntimeError("❌ Catalogue trop grand pour les masques de l'archive")
+        game_row = np.zeros(1, dtype=GAME_DTYPE)[0]
+        positions = np.zeros(len(record), dtype=POSITION_DTYPE)
+        positions["game"] = game_id
+        positions["card"] = -1
+
+        seen = set()
+        replayer = GameReplayer(record, self.snapshot_interval, deck_factory=self._factory())
+        for ply, game in replayer.positions():
+            state = game.state
+            for player in (state.player1, state.player2):
+                seen.update(card.id for card in player.board)
+                seen.update(card.id for card in player.discard)
+            if ply == len(record):
+                break
+            move = record.moves[ply]
+            row = positions[ply]
+            row["ply"] = ply
+            row["phase"] = _PHASE_CODES[Phase(state.phase)]
+            row["player"] = state.acting_player_idx
+            row["action"] = _ACTION_CODES[move[0]]
+            card = _move_card(game, move)
+            if card in indices:
+                row["card"] = indices[card]
+                if move[0] == "PLAY":
+                    _set_bit(game_row["played"], indices[card])
+                elif move[0] == "MINDBUG":
+                    _set_bit(game_row["mindbugged"], indices[card])
+                    game_row["mindbugs"] += 1
+
+        for card in seen:
+            if card in indices:
+                _set_bit(game_row["seen"], indices[card])
+        game_row["seed"] = record.seed
+        game_row["moves"] = len(record)
+        game_row["winner"] = -1 if record.winner is None else record.winner
+        return game_row, positions
+
+    @staticmethod
+    def _truncate(path: str, size: int):
+        """Retire la fin d'un fichier laissée par un ajout interrompu."""
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            os.truncate(path, size)
+
+    def append(self, record: GameRecord) -> int:
+        """Ajoute une partie ; retourne son index dans l'archive."""
+        game_id = len(self.games)
+        game_row, positions = self._index(record, game_id)
+        payload = record.to_bytes()
+
+        # Les memmaps sont fermés avant de toucher aux fichiers
+        data_size, position_count = self._data_size(), self._position_count()
+        self.games = self.positions = self._data = None
+        self._truncate(self.data_path, data_size)
+        self._truncate(self.positions_path, position_count * POSITION_DTYPE.itemsize)
+        self._truncate(self.games_path, game_id * GAME_DTYPE.itemsize)
+
+        with open(self.data_path, "ab") as f:
+            if data_size == 0:
+                f.write(_HEADER)
+            game_row["offset"] = f.tell()
+            f.write(payload)
+        game_row["size"] = len(payload)
+        game_row["first_position"] = position_count
+
+        # Ligne de la partie écrite en dernier : elle valide données et positions
+        with open(self.positions_path, "ab") as f:
+            positions.tofile(f)
+        with open(self.games_path, "ab") as f:
+            np.asarray([game_row], dtype=GAME_DTYPE).tofile(f)
+        self._load()
+        return game_id
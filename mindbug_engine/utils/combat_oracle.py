@@ -0,0 +1,99 @@
+"""
+Oracle de combat : issue d'un duel attaquant / bloqueur, mémoïsée.
+
+Un duel ne dépend que de (puissance, masque de mots-clés, blessée) des deux
+cartes : la table est partagée par toutes les parties (moteur, heuristiques,
+recherche) et se remplit à la demande, ou d'avance via precompute().
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple, TYPE_CHECKING
+
+from mindbug_engine.core.consts import Keyword, KEYWORD_BITS
+from mindbug_engine.core.models import mask_of
+
+if TYPE_CHECKING:
+    from mindbug_engine.core.models import Card
+
+_POISON = KEYWORD_BITS[Keyword.POISON.value]
+_TOUGH = KEYWORD_BITS[Keyword.TOUGH.value]
+
+
+@dataclass(frozen=True)
+class DuelOutcome:
+    att_dies: bool
+    blk_dies: bool
+    # Survie grâce à Tenace (la carte doit être marquée blessée)
+    att_saved: bool = False
+    blk_saved: bool = False
+
+    @property
+    def score(self) -> int:
+        """Bilan de l'échange côté attaquant : +1 bloqueur tué, -1 attaquant perdu."""
+        return int(self.blk_dies) - int(self.att_dies)
+
+
+DuelKey = Tuple[int, int, bool, int, int, bool]
+
+
+class CombatOracle:
+    # Table partagée : (att_power, att_mask, att_damaged, blk_power, blk_mask, blk_damaged) -> issue
+    _table: Dict[DuelKey, DuelOutcome] = {}
+
+    @staticmethod
+    def key(attacker: 'Card', blocker: 'Card') -> DuelKey:
+        return (attacker.power, mask_of(attacker), attacker.is_damaged,
+                blocker.power, mask_of(blocker), blocker.is_damaged)
+
+    @staticmethod
+    def _compute(key: DuelKey) -> DuelOutcome:
+        att_power, att_mask, att_damaged, blk_power, blk_mask, blk_damaged = key
+
+        # A. Comparaison Puissance (égalité : les deux meurent)
+        att_dies = blk_power >= att_power
+        blk_dies = att_power >= blk_power
+
+        # B. Poison (l'emporte sur la puissance)
+        if att_mask & _POISON:
+            blk_dies = True
+        if blk_mask & _POISON:
+            att_dies = True
+
+        # C. Tenace : ignore une destruction si la carte n'est pas déjà blessée
+        att_saved = att_dies and bool(att_mask & _TOUGH) and not att_damaged
+        blk_saved = blk_dies and bool(blk_mask & _TOUGH) and not blk_damaged
+        return DuelOutcome(att_dies and not att_saved, blk_dies and not blk_saved,
+                           att_saved, blk_saved)
+
+    @classmethod
+    def lookup(cls, key: DuelKey) -> DuelOutcome:
+        outcome = cls._table.get(key)
+        if outcome is None:
+            outcome = cls._table[key] = cls._compute(key)
+        return outcome
+
+    @classmethod
+    def duel(cls, attacker: 'Card', blocker: 'Card') -> DuelOutcome:
+        return cls.lookup(cls.key(attacker, blocker))
+
+    @classmethod
+    def matrix(cls, attackers: Sequence['Card'],
+               blockers: Sequence['Card']) -> List[List[DuelOutcome]]:
+        """Toutes les paires d'un coup : matrix[i][j] = duel(attackers[i], blockers[j])."""
+        blk_keys = [(b.power, mask_of(b), b.is_damaged) for b in blockers]
+        rows = []
+        for a in attackers:
+            att_key = (a.power, mask_of(a), a.is_damaged)
+            rows.append([cls.lookup(att_key + bk) for bk in blk_keys])
+        return rows
+
+    @classmethod
+    def precompute(cls, cards: Iterable['Card']):
+        """Remplit la table pour toutes les paires de la base de cartes (état de base)."""
+        profiles = {(c.base_power, c.base_keyword_mask) for c in cards}
+        for att_power, att_mask in profiles:
+            for blk_power, blk_mask in profiles:
+                cls.lookup((att_power, att_mask, False, blk_power, blk_mask, False))
+
+    @classmethod
+    def clear(cls):
+        cls._table.clear()
@@ -1,5 +1,7 @@
-from typing import Tuple, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from mindbug_engine.core.consts import Keyword
+from mindbug_engine.core.models import has_keyword
+from mindbug_engine.utils.combat_oracle import CombatOracle
 
 if TYPE_CHECKING:
     from mindbug_engine.core.models import Card
@@ -9,27 +11,28 @@ class CombatUtils:
     @staticmethod
     def simulate_combat(attacker: 'Card', blocker: 'Card',
                         override_att_power=None, override_blk_power=None) -> Tuple[bool, bool]:
+        """Comparaison de puissance brute (sans Poison / Tenace : cf. CombatOracle)."""
         p_att = override_att_power if override_att_power is not None else attacker.power
         p_blk = override_blk_power if override_blk_power is not None else blocker.power
 
-        att_dead = False
-        blk_dead = False
-
-        if p_att > p_blk:
-            blk_dead = True
-        elif p_blk > p_att:
-            att_dead = True
-        else:
-            att_dead = True
-            blk_dead = True
-
-        return att_dead, blk_dead
+        outcome = CombatOracle.lookup((p_att, 0, False, p_blk, 0, False))
+        return outcome.att_dies, outcome.blk_dies
 
     @staticmethod
-    def can_block(attacker: 'Card', blocker: 'Card') -> bool:
-        if Keyword.SNEAKY.value in attacker.keywords:
-            if Keyword.SNEAKY.value not in blocker.keywords:
-                return False
+    def can_block(attacker: 'Card', blocker: 'Card', bans: Optional[List[tuple]] = None) -> bool:
+        """
+        `bans` : interdictions "BLOCK" du registre (GameState.restrictions), si connues.
+        Sans registre, on relit les effets de l'attaquant.
+        """
+        if has_keyword(attacker, Keyword.SNEAKY) and not has_keyword(blocker, Keyword.SNEAKY):
+            return False
+
+        if bans is not None:
+            for source, eff in bans:
+                # Une interdiction de blocage ne protège que la carte qui la porte
+                if source is attacker and CombatUtils._check_ban_condition(blocker, eff.condition):
+                    return False
+            return True
 
         if attacker.effects:
             for eff in attacker.effects:
@@ -0,0 +1,139 @@
+"""
+Flux d'événements structurés d'une partie (export JSONL, analyses pandas).
+
+Activé via MindbugGame.enable_events(). Désactivé (par défaut), chaque point
+d'émission se résume à un test `events is None`. Les clones (simulations IA)
+n'héritent pas du flux.
+
+Chaque événement est un dict prêt pour json.dumps :
+    {"seq": 12, "game": "g-42", "ply": 7, "turn": 4, "type": "ATTACK",
+     "player": 0, "card": "15", ...champs propres au type}
+- ply : index dans game.history (= GameRecord.moves) du coup qui a provoqué l'événement
+  (-1 avant le premier coup) ; une attaque Frenzy automatique porte le ply du coup joué ;
+- player : index du joueur concerné (0 = P1, 1 = P2) ;
+- card : id catalogue de la carte concernée (None si aucune).
+
+Consommation :
+    stream = game.enable_events(game_id="g-42")
+    stream.subscribe(print)                       # abonné : appelé à chaque événement
+    for event in stream.drain(): ...              # générateur : événements en attente
+    with JsonlSink("events.jsonl") as sink:       # fichier JSONL, écriture par blocs
+        stream.subscribe(sink)
+"""
+import json
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, TextIO, Union
+
+Event = Dict[str, Any]
+
+
+class GameEventType(str, Enum):
+    CARD_PLAYED = "CARD_PLAYED"                  # carte jouée depuis la main (avant le Mindbug)
+    MINDBUG_USED = "MINDBUG_USED"                # player = voleur
+    ATTACK = "ATTACK"
+    BLOCK = "BLOCK"                              # player = défenseur, attacker = id de l'attaquant
+    DAMAGE = "DAMAGE"                            # PV perdus par `player` (amount), card = source
+    DEATH = "DEATH"                              # carte détruite (plateau -> défausse)
+    TRIGGER = "TRIGGER"                          # effet déclenché (trigger = ON_PLAY, ON_DEATH...)
+    SELECTION_REQUESTED = "SELECTION_REQUESTED"  # player = celui qui choisit
+    SELECTION_RESOLVED = "SELECTION_RESOLVED"
+    TURN_END = "TURN_END"                        # player = joueur dont le tour se termine
+    GAME_OVER = "GAME_OVER"                      # player = vainqueur
+
+
+def object_id(obj: Any) -> Any:
+    """Id de carte, ou valeur brute pour les options spéciales (ex: "NO_HUNT", joueur)."""
+    card_id = getattr(obj, "id", None)
+    if card_id is not None:
+        return card_id
+    if isinstance(obj, str):
+        return obj
+    return getattr(obj, "name", None)
+
+
+class EventStream:
+    """
+    Tampon + abonnés d'une partie.
+    keep=False : les événements ne sont transmis qu'aux abonnés (aucune accumulation).
+    """
+
+    def __init__(self, game_id: Any = None, keep: bool = True):
+        self.game_id = game_id
+        self.keep = keep
+        self.count = 0
+        self._pending: Deque[Event] = deque()
+        self._subscribers: List[Callable[[Event], None]] = []
+
+    def subscribe(self, callback: Callable[[Event], None]) -> Callable[[Event], None]:
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[Event], None]):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def emit(self, game, event_type: GameEventType, player=None, card=None, **data):
+        """player : Player ou index ; card : Card, id ou None."""
+        state = game.state
+        if player is not None and not isinstance(player, int):
+            player = 0 if player is state.player1 else 1
+        event = {"seq": self.count}
+        if self.game_id is not None:
+            event["game"] = self.game_id
+        event.update(ply=len(game.history) - 1, turn=state.turn_count, type=event_type.value,
+                     player=player, card=None if card is None else object_id(card))
+        event.update(data)
+        self.count += 1
+
+        if self.keep:
+            self._pending.append(event)
+        for callback in self._subscribers:
+            callback(event)
+
+    def drain(self) -> Iterator[Event]:
+        """Générateur : rend (et retire) les événements en attente, y compris ceux émis pendant l'itération."""
+        pending = self._pending
+        while pending:
+            yield pending.popleft()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+class JsonlSink:
+    """
+    Abonné qui écrit un événement par ligne (JSON Lines), par blocs de `buffer_size`.
+    Ouvert en ajout : plusieurs parties peuvent alimenter le même fichier (cf. game_id).
+    """
+
+    def __init__(self, target: Union[str, TextIO], buffer_size: int = 256):
+        self._owns_file = isinstance(target, str)
+        self._file = open(target, "a", encoding="utf-8") if self._owns_file else target
+        self.buffer_size = buffer_size
+        self._lines: List[str] = []
+
+    def __call__(self, event: Event):
+        self._lines.append(json.dumps(event, ensure_ascii=False))
+        if len(self._lines) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            self._file.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+        self._file.flush()
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
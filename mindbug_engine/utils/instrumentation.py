@@ -0,0 +1,113 @@
+"""
+Instrumentation optionnelle du moteur (compteurs + chronos par zone chaude).
+
+Activée via MindbugGame.enable_stats(). Désactivée (par défaut), chaque point
+instrumenté se résume à un test `stats is None`.
+
+Clés mesurées :
+  - command:<Classe>       exécution de chaque Command (PlayCardCommand, ...)
+  - effect:<EffectType>    résolution d'un effet (ciblage + sélection)
+  - action:<Classe>        exécution d'un handler d'action (StealAction, ...)
+  - passives               recalcul des auras (apply_passive_effects)
+  - legal_moves            génération des coups légaux
+"""
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class TimerStat:
+    count: int = 0
+    # Temps total (sous-appels inclus), en secondes
+    total: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class _Measure:
+    """Context manager réutilisable (pas de générateur : moins coûteux)."""
+    __slots__ = ("stats", "key")
+
+    def __init__(self, stats: 'EngineStats', key: str):
+        self.stats = stats
+        self.key = key
+
+    def __enter__(self):
+        self.stats.start(self.key)
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stats.stop()
+        return False
+
+
+class EngineStats:
+    """
+    Statistiques collectées pendant une ou plusieurs parties (clones inclus).
+
+    `timers` agrège par clé ; `folded` agrège le temps propre (hors sous-appels)
+    par pile d'appels, au format des flame graphs (flamegraph.pl, speedscope).
+    """
+
+    def __init__(self):
+        self.timers: Dict[str, TimerStat] = {}
+        self.folded: Dict[str, float] = {}
+        # Pile en cours : [clé, début, temps des enfants]
+        self._stack: List[list] = []
+
+    def measure(self, key: str) -> _Measure:
+        return _Measure(self, key)
+
+    def start(self, key: str):
+        self._stack.append([key, time.perf_counter(), 0.0])
+
+    def stop(self):
+        key, begin, children = self._stack.pop()
+        elapsed = time.perf_counter() - begin
+
+        timer = self.timers.get(key)
+        if timer is None:
+            timer = self.timers[key] = TimerStat()
+        timer.count += 1
+        timer.total += elapsed
+
+        path = ";".join([frame[0] for frame in self._stack] + [key])
+        self.folded[path] = self.folded.get(path, 0.0) + (elapsed - children)
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def reset(self):
+        self.timers.clear()
+        self.folded.clear()
+        self._stack.clear()
+
+    # =========================================================================
+    #  EXPORTS
+    # =========================================================================
+
+    def to_dict(self) -> Dict:
+        return {key: {"count": t.count, "total": t.total, "mean": t.mean}
+                for key, t in sorted(self.timers.items(), key=lambda kv: -kv[1].total)}
+
+    def to_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def to_folded(self) -> str:
+        """Une ligne 'pile;d;appels valeur' par pile, valeur = temps propre en µs."""
+        return "\n".join(f"{path} {int(seconds * 1e6)}"
+                         for path, seconds in sorted(self.folded.items()))
+
+    def write_folded(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_folded() + "\n")
+
+    def summary(self, top: int = 15) -> str:
+        lines = [f"{'key':<36}{'count':>10}{'total(ms)':>12}{'mean(µs)':>12}"]
+        for key, data in list(self.to_dict().items())[:top]:
+            lines.append(f"{key:<36}{data['count']:>10}{data['total'] * 1e3:>12.2f}"
+                         f"{data['mean'] * 1e6:>12.2f}")
+        return "\n".join(lines)
@@ -1,6 +1,7 @@
 import logging
 import os
 import sys
+from contextlib import contextmanager
 
 
 # Configuration du logger
@@ -48,4 +49,16 @@ def log_debug(msg):
 
 
 def log_error(msg):
-    GameLogger.get_logger().error(msg)
\ No newline at end of file
+    GameLogger.get_logger().error(msg)
+
+
+@contextmanager
+def silenced(level=logging.CRITICAL):
+    """Coupe temporairement les logs du jeu (simulations IA, outils, benchmarks)."""
+    logger = GameLogger.get_logger()
+    original_level = logger.level
+    logger.setLevel(level)
+    try:
+        yield
+    finally:
+        logger.setLevel(original_level)
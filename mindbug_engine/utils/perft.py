@@ -0,0 +1,115 @@
+"""
+Perft : compteur exhaustif de l'arbre de jeu (get_legal_moves + step).
+
+Sert à la fois de benchmark de génération de coups (noeuds/seconde) et de test
+de non-régression : les comptes obtenus depuis des positions de départ graines
+sont figés comme valeurs de référence dans les tests.
+
+Usage : python -m mindbug_engine.utils.perft --seeds 1 2 3 --depth 3
+        (--folded perft.folded pour un profil flame graph du moteur)
+"""
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.core.config import ConfigurationService
+from mindbug_engine.utils.logger import silenced
+from mindbug_engine.utils.instrumentation import EngineStats
+
+
+@dataclass
+class PerftResult:
+    seed: int
+    depth: int
+    nodes: int
+    seconds: float
+
+    @property
+    def nps(self) -> float:
+        """Noeuds (feuilles) par seconde."""
+        return self.nodes / self.seconds if self.seconds > 0 else float("inf")
+
+
+def perft(game: MindbugGame, depth: int) -> int:
+    """
+    Compte les feuilles à la profondeur `depth`.
+    Les parties terminées (ou bloquées) avant la profondeur comptent pour 0.
+    Le jeu passé en paramètre n'est pas modifié (chaque coup est joué sur un clone).
+    """
+    if depth == 0:
+        return 1
+    moves = game.get_legal_moves()
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for action, index in moves:
+        child = game.clone()
+        child.step(action, index)
+        nodes += perft(child, depth - 1)
+    return nodes
+
+
+def perft_divide(game: MindbugGame, depth: int) -> Dict[Tuple[str, int], int]:
+    """Détail par coup racine (utile pour localiser une divergence)."""
+    result = {}
+    for action, index in game.get_legal_moves():
+        child = game.clone()
+        child.step(action, index)
+        result[(action, index)] = perft(child, depth - 1)
+    return result
+
+
+def run_perft(seed: int, depth: int, active_sets: Optional[List[str]] = None,
+              stats: Optional[EngineStats] = None) -> PerftResult:
+    """
+    Perft depuis la position de départ reproductible de `seed`.
+    Si `stats` est fourni, l'instrumentation du moteur est activée pendant le comptage.
+    """
+    config = ConfigurationService(load_from_disk=False)
+    if active_sets:
+        config.active_sets = list(active_sets)
+
+    with silenced():
+        game = MindbugGame.start_headless(seed=seed, config=config)
+        if stats is not None:
+            game.enable_stats(stats)
+        start = time.perf_counter()
+        nodes = perft(game, depth)
+        elapsed = time.perf_counter() - start
+    return PerftResult(seed=seed, depth=depth, nodes=nodes, seconds=elapsed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perft Mindbug (comptage de l'arbre de jeu).")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--divide", action="store_true", help="Détail par coup racine.")
+    parser.add_argument("--folded", help="Écrit un profil 'folded stacks' du moteur.")
+    args = parser.parse_args(argv)
+    stats = EngineStats() if args.folded else None
+
+    total_nodes, total_time = 0, 0.0
+    for seed in args.seeds:
+        if args.divide:
+            with silenced():
+                game = MindbugGame.start_headless(seed=seed)
+                for move, count in perft_divide(game, args.depth).items():
+                    print(f"  seed={seed} {move}: {count}")
+        res = run_perft(seed, args.depth, stats=stats)
+        total_nodes += res.nodes
+        total_time += res.seconds
+        print(f"seed={seed} depth={res.depth} nodes={res.nodes} "
+              f"time={res.seconds:.3f}s nps={res.nps:,.0f}")
+
+    if total_time > 0:
+        print(f"TOTAL nodes={total_nodes} nps={total_nodes / total_time:,.0f}")
+    if stats is not None:
+        stats.write_folded(args.folded)
+        print(stats.summary())
+
+
+if __name__ == "__main__":
+    main()
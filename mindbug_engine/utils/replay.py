@@ -0,0 +1,119 @@
+"""
+Rejeu d'une partie enregistrée (GameRecord) : reconstruction de n'importe quel coup.
+
+La position après `ply` coups s'obtient en rejouant step() depuis le départ.
+Le rejoueur garde un instantané (GameSnapshot + état du générateur aléatoire)
+tous les `snapshot_interval` coups : l'accès à un coup profond ne rejoue alors
+qu'au plus snapshot_interval - 1 coups depuis l'instantané le plus proche.
+"""
+import bisect
+import random
+from typing import Dict, Iterator, Optional, Tuple
+
+from constants import PATH_DATA
+from mindbug_engine.core.config import ConfigurationService
+from mindbug_engine.core.consts import Phase
+from mindbug_engine.core.record import GameRecord
+from mindbug_engine.core.snapshot import GameSnapshot
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.infrastructure.deck_factory import DeckFactory
+from mindbug_engine.utils.logger import silenced
+
+
+class GameReplayer:
+
+    def __init__(self, record: GameRecord, snapshot_interval: int = 32,
+                 deck_factory: Optional[DeckFactory] = None):
+        if snapshot_interval < 1:
+            raise ValueError("❌ snapshot_interval doit être >= 1")
+        self.record = record
+        self.snapshot_interval = snapshot_interval
+        self.config = ConfigurationService(load_from_disk=False)
+        self.config.active_sets = list(record.sets)
+        self.deck_factory = deck_factory or DeckFactory(PATH_DATA)
+        # ply -> (instantané, état du générateur aléatoire)
+        self._snapshots: Dict[int, Tuple[GameSnapshot, tuple]] = {}
+        self._plies = []
+
+    def __len__(self) -> int:
+        return len(self.record.moves)
+
+    # =========================================================================
+    #  RECONSTRUCTION
+    # =========================================================================
+
+    def initial_game(self) -> MindbugGame:
+        """Position de départ (avant le premier coup enregistré)."""
+        record = self.record
+        with silenced():
+            game = MindbugGame(self.config, seed=record.seed, deck_factory=self.deck_factory)
+            if tuple(game.initial_deck_ids) != record.deck:
+                raise ValueError("❌ Deck différent de l'enregistrement (cartes ou sets modifiés ?)")
+            game.start_game()
+            if record.auto_initiative:
+                while game.state.phase == Phase.INITIATIVE_BATTLE:
+                    game.resolve_initiative_step()
+        return game
+
+    def position(self, ply: int) -> MindbugGame:
+        """Nouvelle partie, dans l'état atteint après les `ply` premiers coups."""
+        if not 0 <= ply <= len(self):
+            raise IndexError(f"❌ Coup {ply} hors de l'enregistrement (0..{len(self)})")
+
+        i = bisect.bisect_right(self._plies, ply) - 1
+        if i >= 0:
+            start = self._plies[i]
+            game = self._restore(start)
+        else:
+            start = 0
+            game = self.initial_game()
+            self._store(0, game)
+
+        with silenced():
+            for current in range(start, ply):
+                game.step(*self.record.moves[current])
+                if (current + 1) % self.snapshot_interval == 0:
+                    self._store(current + 1, game)
+        return game
+
+    def positions(self) -> Iterator[Tuple[int, MindbugGame]]:
+        """
+        Parcourt toute la partie : (ply, jeu) pour ply = 0..len.
+        Le même objet jeu est avancé à chaque itération (le cloner pour le garder).
+        """
+        game = self.position(0)
+        yield 0, game
+        for ply, move in enumerate(self.record.moves, start=1):
+            with silenced():
+                game.step(*move)
+            if ply % self.snapshot_interval == 0 and ply not in self._snapshots:
+                self._store(ply, game)
+            yield ply, game
+
+    def verify(self) -> bool:
+        """Vrai si le rejeu complet retrouve le vainqueur enregistré."""
+        state = self.position(len(self)).state
+        winner = state.winner
+        winner_idx = None if winner is None else (0 if winner is state.player1 else 1)
+        return winner_idx == self.record.winner
+
+    # =========================================================================
+    #  INSTANTANÉS
+    # =========================================================================
+
+    def _store(self, ply: int, game: MindbugGame):
+        if ply in self._snapshots:
+            return
+        self._snapshots[ply] = (game.snapshot(), game.rng.getstate())
+        bisect.insort(self._plies, ply)
+
+    def _restore(self, ply: int) -> MindbugGame:
+        snapshot, rng_state = self._snapshots[ply]
+        game = MindbugGame.from_snapshot(snapshot, config=self.config, deck_factory=self.deck_factory)
+        game.seed = self.record.seed
+        game.used_sets = list(self.record.sets)
+        game.initial_deck_ids = list(self.record.deck)
+        game.rng = random.Random()
+        game.rng.setstate(rng_state)
+        game.history = list(self.record.moves[:ply])
+        return game
@@ -30,3 +30,17 @@ DIFFICULTY_UI_CONFIG = {
         "next": Difficulty.EASY  # Boucle le cycle
     }
 }
+
+# Stratégies d'IA proposées dans les paramètres (cycle dans l'ordre)
+STRATEGY_UI_CONFIG = {
+    "MCTS": {
+        "label": "RECHERCHE (MCTS)",
+        "desc": "Simule des parties avant chaque coup",
+        "next": "HEURISTIC"
+    },
+    "HEURISTIC": {
+        "label": "INSTINCT (HEURISTIQUE)",
+        "desc": "Réponse instantanée, idéal sur machine modeste",
+        "next": "MCTS"
+    }
+}
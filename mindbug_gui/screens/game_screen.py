@@ -1,7 +1,7 @@
 import pygame
+import random
 import threading
 import time
-from copy import deepcopy
 from typing import List, Optional
 
 from mindbug_engine.utils.logger import log_error
@@ -35,7 +35,8 @@ class GameScreen(BaseScreen):
         super().__init__(app)
 
         # 1. INITIALISATION DU MOTEUR (BACKEND)
-        self.game = MindbugGame(config=self.app.config)
+        # Graine tirée au hasard mais connue : la partie peut être rejouée (GameRecord)
+        self.game = MindbugGame(config=self.app.config, seed=random.randrange(2 ** 31))
         self.error_message = None
 
         # Sauvegarde des sets actifs si nécessaire
@@ -51,10 +52,10 @@ class GameScreen(BaseScreen):
         # 2. IA (AGENT)
         self.ai_agent = None
         if self.app.config.game_mode == "PVE":
-            # On utilise la stratégie MCTS par défaut pour le PvE
+            # Stratégie choisie dans les paramètres (MCTS par défaut)
             self.ai_agent = AgentFactory.create_agent(
                 difficulty=self.app.config.ai_difficulty,
-                strategy="MCTS"
+                strategy=self.app.config.ai_strategy
             )
 
         # --- INITIALISATION ETAT IA ---
@@ -290,8 +291,9 @@ class GameScreen(BaseScreen):
             # Petit délai pour laisser l'interface respirer (UX)
             time.sleep(0.5)
 
-            # On clone le jeu pour que l'IA puisse simuler sans toucher au vrai état
-            game_clone = deepcopy(self.game)
+            # Snapshot léger (GameState seul) : l'IA simule sans toucher au vrai état
+            game_clone = MindbugGame.from_snapshot(
+                self.game.snapshot(), config=self.game.config)
 
             # On demande à l'agent (MCTS ou Heuristic) de choisir une action
             self.ai_thread_result = self.ai_agent.get_action(game_clone)
@@ -7,7 +7,7 @@ from mindbug_gui.screens.base_screen import BaseScreen
 from mindbug_gui.widgets.buttons import Button, Toggle, UIWidget
 
 # --- CONFIG & COLORS ---
-from mindbug_gui.core.settings_config import DIFFICULTY_UI_CONFIG
+from mindbug_gui.core.settings_config import DIFFICULTY_UI_CONFIG, STRATEGY_UI_CONFIG
 from mindbug_gui.core.colors import (
     TEXT_PRIMARY, TEXT_SECONDARY, ACCENT,
     BTN_SURFACE, BTN_DANGER, BTN_HOVER
@@ -79,6 +79,23 @@ class SettingsScreen(BaseScreen):
         self.desc_rect = self.desc_surf.get_rect(center=(cx, y + 40))
         y += 90
 
+        # 2b. STRATÉGIE DE L'IA (Bouton Cycle)
+        strat_data = STRATEGY_UI_CONFIG.get(self.config.ai_strategy, STRATEGY_UI_CONFIG["MCTS"])
+        btn_strat = Button(
+            x=cx - 150, y=y, width=300, height=50,
+            text=f"IA : {strat_data['label']}",
+            font=font_widget,
+            action="CYCLE_STRATEGY",
+            bg_color=BTN_SURFACE,
+            hover_color=BTN_HOVER
+        )
+        self.widgets.append(btn_strat)
+
+        self.strat_desc_surf = font_small.render(
+            strat_data['desc'], True, TEXT_SECONDARY)
+        self.strat_desc_rect = self.strat_desc_surf.get_rect(center=(cx, y + 40))
+        y += 90
+
         # 3. OPTIONS GLOBALES (Interrupteurs / Toggles)
         # Mode Debug
         tg_debug = Toggle(
@@ -166,6 +183,10 @@ class SettingsScreen(BaseScreen):
             self._cycle_difficulty()
             return None
 
+        elif action == "CYCLE_STRATEGY":
+            self._cycle_strategy()
+            return None
+
         elif action == "TOGGLE_DEBUG":
             self.config.debug_mode = not self.config.debug_mode
             return None
@@ -196,6 +217,13 @@ class SettingsScreen(BaseScreen):
             self.config.ai_difficulty = DIFFICULTY_UI_CONFIG[curr]["next"]
             self._init_ui()
 
+    def _cycle_strategy(self):
+        """Alterne entre les stratégies d'IA (MCTS / Heuristique)."""
+        curr = self.config.ai_strategy
+        if curr in STRATEGY_UI_CONFIG:
+            self.config.ai_strategy = STRATEGY_UI_CONFIG[curr]["next"]
+            self._init_ui()
+
     def _update_sets_config(self, set_id: str, should_be_active: bool):
         """Met à jour les sets actifs avec une sécurité pour garder au moins 1 set."""
         sets = self.config.active_sets
@@ -225,6 +253,7 @@ class SettingsScreen(BaseScreen):
         # Titres et labels
         surface.blit(self.title_surf, self.title_rect)
         surface.blit(self.desc_surf, self.desc_rect)
+        surface.blit(self.strat_desc_surf, self.strat_desc_rect)
         surface.blit(self.sets_title_surf, self.sets_title_rect)
 
         # Dessin des widgets
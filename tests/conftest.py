@@ -17,6 +17,7 @@ class MockConfig:
         self.debug_mode = False
         self.game_mode = "HOTSEAT"
         self.ai_difficulty = Difficulty.MEDIUM
+        self.ai_strategy = "MCTS"
         self.active_sets = ["FIRST_CONTACT"]
         self.resolution = (1280, 720)
         self.fullscreen = False
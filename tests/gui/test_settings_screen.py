@@ -18,6 +18,7 @@ class MockApp:
         # Configuration Mockée
         self.config = MagicMock()
         self.config.ai_difficulty = Difficulty.MEDIUM
+        self.config.ai_strategy = "MCTS"
         self.config.debug_mode = False
         self.config.available_sets_in_db = ["First Contact", "Beyond"]
         self.config.active_sets = ["First Contact"]
@@ -93,3 +94,17 @@ def test_toggles_initial_state(mock_app):
         w, 'action', '') == "TOGGLE_DEBUG")
 
     assert tg.value is True
+
+
+def test_action_cycle_strategy(mock_app, settings_screen):
+    """Vérifie le cycle des stratégies d'IA : MCTS -> HEURISTIC -> MCTS."""
+    mock_app.config.ai_strategy = "MCTS"
+    settings_screen._process_action("CYCLE_STRATEGY")
+    assert mock_app.config.ai_strategy == "HEURISTIC"
+
+    btn = next(w for w in settings_screen.widgets if getattr(
+        w, 'action', '') == "CYCLE_STRATEGY")
+    assert "HEURISTIQUE" in btn.text
+
+    settings_screen._process_action("CYCLE_STRATEGY")
+    assert mock_app.config.ai_strategy == "MCTS"
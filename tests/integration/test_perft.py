@@ -0,0 +1,44 @@
+import pytest
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.utils.logger import silenced
+from mindbug_engine.utils.perft import perft, perft_divide, run_perft
+
+# Valeurs de référence (moteur actuel, set FIRST_CONTACT).
+# Toute optimisation du moteur doit conserver ces comptes à l'identique.
+GOLDEN_PERFT = [
+    # (seed, depth, nodes)
+    (1, 5, 539),
+    (2, 5, 549),
+    (3, 5, 628),
+    (4, 5, 540),
+    (1, 6, 1691),
+]
+
+
+@pytest.mark.parametrize("seed,depth,expected", GOLDEN_PERFT)
+def test_perft_golden_values(seed, depth, expected):
+    result = run_perft(seed, depth)
+    assert result.nodes == expected
+    assert result.nps > 0
+
+
+def test_seeded_start_position_is_reproducible():
+    with silenced():
+        g1 = MindbugGame.start_headless(seed=42)
+        g2 = MindbugGame.start_headless(seed=42)
+
+    for p1, p2 in zip(g1.state.players, g2.state.players):
+        assert [c.id for c in p1.hand] == [c.id for c in p2.hand]
+        assert [c.id for c in p1.deck] == [c.id for c in p2.deck]
+    assert g1.state.active_player_idx == g2.state.active_player_idx
+
+
+def test_perft_divide_matches_total_and_leaves_game_untouched():
+    with silenced():
+        game = MindbugGame.start_headless(seed=1)
+        hand_before = [c.id for c in game.state.active_player.hand]
+
+        divide = perft_divide(game, 3)
+        assert sum(divide.values()) == perft(game, 3)
+
+    assert [c.id for c in game.state.active_player.hand] == hand_before
@@ -3,6 +3,7 @@ from mindbug_engine.core.consts import Difficulty
 from mindbug_ai.factory import AgentFactory
 from mindbug_ai.interface import AgentInterface
 from mindbug_ai.mcts.agent import MCTSAgent
+from mindbug_ai.heuristic import HeuristicAgent
 
 
 def test_factory_creates_mcts_agent():
@@ -31,3 +32,21 @@ def test_factory_creates_extreme_agent():
     assert isinstance(agent, MCTSAgent)
     # On vérifie qu'il a au moins 5 secondes de réflexion
     assert agent.simulation_time >= 5.0
+
+
+def test_factory_creates_heuristic_agent():
+    """Vérifie que la stratégie HEURISTIC (défaut) est instanciable."""
+    agent = AgentFactory.create_agent(difficulty=Difficulty.EASY)
+
+    assert isinstance(agent, HeuristicAgent)
+    assert agent.randomness > 0
+    assert AgentFactory.create_agent(Difficulty.HARD, "HEURISTIC").randomness == 0
+
+
+def test_factory_supports_every_configured_strategy():
+    """Les stratégies proposées par la configuration sont toutes instanciables."""
+    from mindbug_engine.core.config import ConfigurationService
+    from mindbug_ai.factory import STRATEGIES
+    assert STRATEGIES is ConfigurationService.AI_STRATEGIES
+    for strategy in ConfigurationService.AI_STRATEGIES:
+        assert isinstance(AgentFactory.create_agent(Difficulty.EASY, strategy), AgentInterface)
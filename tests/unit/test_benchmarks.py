@@ -0,0 +1,36 @@
+from benchmarks import BENCHMARKS, run_suite, compare, regressions
+from benchmarks.report import to_json
+
+
+def test_suite_runs_every_benchmark():
+    results = run_suite(seed=1, duration=0.01)
+
+    assert set(results) == set(BENCHMARKS)
+    for name, res in results.items():
+        assert res.name == name
+        assert res.ops > 0, name
+        assert res.ops_per_sec > 0, name
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    def report(**ops_per_sec):
+        return {"results": {k: {"ops_per_sec": v} for k, v in ops_per_sec.items()}}
+
+    baseline = report(step=1000.0, clone=200.0, mcts=50.0)
+    current = report(step=950.0, clone=100.0, games=10.0)
+
+    comparisons = {c.name: c for c in compare(current, baseline)}
+    # Seuls les benchmarks communs sont comparés
+    assert set(comparisons) == {"step", "clone"}
+    assert comparisons["clone"].ratio == 0.5
+
+    failed = regressions(list(comparisons.values()), threshold=0.1)
+    assert [c.name for c in failed] == ["clone"]
+
+
+def test_json_report_contains_rates():
+    results = run_suite(seed=2, duration=0.01, only=["clone"])
+    data = to_json(results, seed=2, duration=0.01)
+
+    assert data["meta"]["seed"] == 2
+    assert data["results"]["clone"]["ops_per_sec"] > 0
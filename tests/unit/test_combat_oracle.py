@@ -0,0 +1,45 @@
+from constants import PATH_DATA
+from mindbug_engine.core.consts import Keyword
+from mindbug_engine.core.models import Card
+from mindbug_engine.infrastructure.card_loader import CardLoader
+from mindbug_engine.utils.combat_oracle import CombatOracle, DuelOutcome
+
+
+def test_duel_power_poison_and_tough():
+    strong = Card("s", "Strong", 6)
+    weak = Card("w", "Weak", 2)
+    assert CombatOracle.duel(strong, weak) == DuelOutcome(False, True)
+    assert CombatOracle.duel(weak, weak) == DuelOutcome(True, True)
+
+    poison = Card("p", "Poison", 1, keywords=[Keyword.POISON])
+    assert CombatOracle.duel(poison, strong) == DuelOutcome(True, True)
+
+    tough = Card("t", "Tough", 1, keywords=[Keyword.TOUGH])
+    assert CombatOracle.duel(strong, tough) == DuelOutcome(False, False, blk_saved=True)
+    # Déjà blessée : Tenace ne protège plus
+    tough.is_damaged = True
+    assert CombatOracle.duel(strong, tough) == DuelOutcome(False, True)
+
+
+def test_lookups_are_memoized():
+    CombatOracle.clear()
+    a, b = Card("a", "A", 3), Card("b", "B", 4)
+    first = CombatOracle.duel(a, b)
+    assert CombatOracle.duel(Card("c", "C", 3), Card("d", "D", 4)) is first
+
+
+def test_matrix_scores_every_pairing():
+    attackers = [Card("a1", "A1", 5), Card("a2", "A2", 2, keywords=["POISON"])]
+    blockers = [Card("b1", "B1", 3), Card("b2", "B2", 8, keywords=["TOUGH"])]
+    grid = CombatOracle.matrix(attackers, blockers)
+
+    assert [[o.score for o in row] for row in grid] == [[1, -1], [0, -1]]
+    assert grid[1][1].blk_saved
+
+
+def test_precompute_covers_card_database():
+    CombatOracle.clear()
+    cards = CardLoader.load_from_json(PATH_DATA)
+    CombatOracle.precompute(cards)
+    profiles = {(c.base_power, c.base_keyword_mask) for c in cards}
+    assert len(CombatOracle._table) == len(profiles) ** 2
@@ -28,6 +28,7 @@ def test_load_valid_file_overrides(tmp_path, monkeypatch):
         "resolution": [1920, 1080],
         "ai_difficulty": "HARD",
         "active_sets": ["S1", "S2"],
+        "ai_strategy": "HEURISTIC",
     }
     path.write_text(json.dumps(data), encoding="utf-8")
 
@@ -39,6 +40,7 @@ def test_load_valid_file_overrides(tmp_path, monkeypatch):
     assert cfg.resolution == (1920, 1080)
     assert cfg.ai_difficulty == Difficulty.HARD
     assert cfg.active_sets == ["S1", "S2"]
+    assert cfg.ai_strategy == "HEURISTIC"
 
 
 def test_load_invalid_ai_defaults_to_medium(tmp_path, monkeypatch):
@@ -52,6 +54,16 @@ def test_load_invalid_ai_defaults_to_medium(tmp_path, monkeypatch):
     assert cfg.ai_difficulty == Difficulty.MEDIUM
 
 
+def test_load_invalid_strategy_defaults_to_mcts(tmp_path, monkeypatch):
+    path = tmp_path / "settings.json"
+    monkeypatch.setattr(ConfigurationService, "FILE_PATH", str(path))
+
+    path.write_text(json.dumps({"ai_strategy": "SKYNET"}), encoding="utf-8")
+
+    cfg = ConfigurationService()
+    assert cfg.ai_strategy == "MCTS"
+
+
 def test_empty_active_sets_does_not_overwrite_default(tmp_path, monkeypatch):
     path = tmp_path / "settings.json"
     monkeypatch.setattr(ConfigurationService, "FILE_PATH", str(path))
@@ -84,3 +96,4 @@ def test_save_writes_file(tmp_path, monkeypatch):
     assert content["active_sets"] == ["A"]
     assert content["resolution"] == [800, 600]
     assert content["fullscreen"] is True
+    assert content["ai_strategy"] == "MCTS"
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from mindbug_engine.core.consts import Phase
+from mindbug_engine.engine import MindbugGame
+from mindbug_ai.learning import (ACTION_COUNT, OBSERVATION_LAYOUT, OBSERVATION_SIZE, action_to_move,
+                                 encode, encode_batch, move_to_action)
+from mindbug_ai.learning.encoder import CARD_COLUMNS, CARD_INDEX, MAX_SLOTS, SCALARS
+
+
+def _block(vector, name):
+    start, width = OBSERVATION_LAYOUT[name]
+    return vector[start:start + width]
+
+
+def test_action_space_round_trip():
+    for action in range(ACTION_COUNT):
+        assert move_to_action(action_to_move(action)) == action
+    assert action_to_move(move_to_action(("NO_BLOCK", -1))) == ("NO_BLOCK", -1)
+    with pytest.raises(ValueError):
+        move_to_action(("PLAY", MAX_SLOTS))
+
+
+def test_encode_views_and_mask(game_empty, create_card):
+    state = game_empty.state
+    state.phase = Phase.P1_MAIN
+    state.player1.hand = [create_card("Unknown", 3)]
+    attacker = create_card("Poison", 4, keywords=["POISON"])
+    attacker.id = "01"
+    state.player1.board = [attacker]
+    state.player2.hand = [create_card("Hidden", 9)]
+    state.player2.hp = 2
+
+    obs, mask = encode(game_empty, 0)
+    assert obs.shape == (OBSERVATION_SIZE,) and obs.dtype == np.float32
+    assert _block(obs, "scalars")[SCALARS.index("opp_hp")] == 2
+    assert _block(obs, "scalars")[SCALARS.index("opp_hand")] == 1
+    assert _block(obs, "count_me_board")[CARD_INDEX["01"]] == 1
+    # Carte hors catalogue : colonne "inconnue"
+    assert _block(obs, "hand_slots")[CARD_COLUMNS - 1] == 1
+    assert _block(obs, "me_board_power")[0] == 4
+    assert _block(obs, "me_board_keywords")[2] == 1  # POISON = 3e bit
+
+    legal = {action_to_move(a) for a in np.flatnonzero(mask)}
+    assert legal == set(game_empty.get_legal_moves())
+
+    # Vu par l'adversaire : mon plateau devient le sien
+    theirs, _ = encode(game_empty, 1)
+    assert _block(theirs, "count_opp_board")[CARD_INDEX["01"]] == 1
+    assert _block(theirs, "scalars")[SCALARS.index("me_hp")] == 2
+
+
+def test_batch_matches_single_encoding():
+    games = [MindbugGame.start_headless(seed=s) for s in range(4)]
+    for g in games[2:]:
+        g.step(*g.get_legal_moves()[0])
+
+    out = np.full((len(games), OBSERVATION_SIZE), 7.0, dtype=np.float32)
+    masks = np.ones((len(games), ACTION_COUNT), dtype=bool)
+    encode_batch(games, out=out, masks=masks)
+
+    for row, g in enumerate(games):
+        obs, mask = encode(g)
+        assert np.array_equal(out[row], obs)
+        assert np.array_equal(masks[row], mask)
+
+    with pytest.raises(ValueError):
+        encode_batch(games, out=np.zeros((1, OBSERVATION_SIZE), dtype=np.float32))
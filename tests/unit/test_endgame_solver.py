@@ -0,0 +1,66 @@
+from mindbug_engine.core.models import Card
+from mindbug_engine.core.consts import Phase
+from mindbug_ai.mcts.agent import MCTSAgent
+from mindbug_ai.mcts.solver import EndgameSolver
+
+
+def setup_endgame(game, p1_board, p2_board, p1_hp=3, p2_hp=3):
+    s = game.state
+    s.player1.board = p1_board
+    s.player2.board = p2_board
+    s.player1.hp = p1_hp
+    s.player2.hp = p2_hp
+    s.active_player_idx = 0
+    s.phase = Phase.P1_MAIN
+    return game
+
+
+def test_solver_applicability(game_empty):
+    assert EndgameSolver.is_applicable(game_empty)
+
+    game_empty.state.player2.deck = [Card("x", "X", 1)]
+    assert not EndgameSolver.is_applicable(game_empty)
+
+
+def test_solver_finds_forced_win(game_empty):
+    """Une attaque imblocable sur un adversaire à 1 PV est une victoire prouvée."""
+    setup_endgame(game_empty, [Card("g", "Gorillion", 10)], [], p2_hp=1)
+
+    result = EndgameSolver().solve(game_empty)
+
+    assert result.proven
+    assert result.value == EndgameSolver.WIN
+    assert result.move == ("ATTACK", 0)
+
+
+def test_solver_proves_loss(game_empty):
+    """Attaque forcée d'une 1 contre un 10 à 1 PV : la défaite est inévitable."""
+    setup_endgame(game_empty, [Card("s", "Small", 1)], [Card("g", "Gorillion", 10)], p1_hp=1)
+
+    result = EndgameSolver().solve(game_empty)
+
+    assert result.value == EndgameSolver.LOSS
+    # La recherche ne modifie pas la partie réelle
+    assert game_empty.state.player1.hp == 1
+    assert len(game_empty.state.player1.board) == 1
+
+
+def test_solver_reports_unknown_when_budget_exhausted(game_empty):
+    setup_endgame(game_empty, [Card("s", "Small", 1)], [Card("g", "Gorillion", 10)], p1_hp=1)
+
+    result = EndgameSolver(max_nodes=1).solve(game_empty)
+
+    assert not result.proven
+    assert result.move in game_empty.get_legal_moves()
+
+
+def test_mcts_agent_uses_solver_in_endgame(game_empty, capsys):
+    setup_endgame(game_empty, [Card("a", "Small", 1), Card("g", "Gorillion", 10)], [], p2_hp=1)
+
+    agent = MCTSAgent(simulation_time=5.0)
+    move = agent.get_action(game_empty)
+
+    assert agent.last_solver_result.proven
+    assert move in [("ATTACK", 0), ("ATTACK", 1)]
+    # Résultat annoncé dans les logs du jeu, pas sur la sortie standard (workers, benchmarks)
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,105 @@
+import pickle
+from mindbug_engine.core.models import Card, CardEffect, Player, Zone
+from mindbug_engine.core.consts import Phase, Trigger, EffectType
+from mindbug_engine.managers.event_manager import EventManager
+
+
+def heal_owner(amount=1):
+    return CardEffect(EffectType.MODIFY_STAT, target={"group": "OWNER"},
+                      params={"stat": "HP", "amount": amount, "operation": "ADD"})
+
+
+def test_zone_mutations_keep_subscriber_index():
+    p = Player("P")
+    passive = Card("a", "Aura", 3, trigger=Trigger.PASSIVE)
+    dying = Card("d", "Dying", 2, trigger=Trigger.ON_DEATH)
+    vanilla = Card("v", "Vanilla", 5)
+
+    p.board = [passive, vanilla]
+    assert isinstance(p.board, Zone)
+    assert p.subscribers(Trigger.PASSIVE) == [passive]
+
+    p.board.append(dying)
+    assert p.subscribers(Trigger.ON_DEATH) == [dying]
+
+    p.board.remove(passive)
+    p.discard.append(passive)
+    assert p.subscribers(Trigger.PASSIVE) == []
+
+    # Les cartes hors plateau ne sont pas abonnées
+    p.hand = [Card("h", "InHand", 1, trigger=Trigger.PASSIVE)]
+    assert p.subscribers(Trigger.PASSIVE) == []
+
+
+def test_incremental_index_matches_full_rebuild():
+    p = Player("P")
+    ban = CardEffect(EffectType.BAN, target={"group": "OPPONENT"}, params={"action": "BLOCK"})
+    cards = [Card(str(i), f"C{i}", i, trigger=(Trigger.PASSIVE if i % 2 else Trigger.ON_DEATH),
+                  effects=[ban] if i % 3 == 0 else None) for i in range(6)]
+    for card in cards:
+        p.board.append(card)
+    p.board.remove(cards[3])
+    p.board.pop(0)
+    p.board.append(cards[3])
+
+    triggers, bans = p._triggers, p._bans
+    p._index_board()
+    assert triggers == p._triggers and bans == p._bans
+    assert p.subscribers(Trigger.PASSIVE) == [cards[1], cards[5], cards[3]]
+    assert [c for c, _ in p.bans("BLOCK", "OPPONENT")] == [cards[3]]
+
+
+def test_subscriber_index_survives_pickle():
+    p = Player("P")
+    aura = Card("a", "Aura", 3, trigger=Trigger.PASSIVE)
+    p.board = [aura]
+
+    clone = pickle.loads(pickle.dumps(p))
+
+    assert clone.board.owner is clone
+    assert [c.id for c in clone.subscribers(Trigger.PASSIVE)] == ["a"]
+    clone.board.clear()
+    assert clone.subscribers(Trigger.PASSIVE) == []
+    assert p.subscribers(Trigger.PASSIVE) == [aura]
+
+
+def test_on_block_is_dispatched(game):
+    p1, p2 = game.state.player1, game.state.player2
+    guard = Card("g", "Guard", 5, trigger=Trigger.ON_BLOCK, effects=[heal_owner()])
+    p1.board = [Card("a", "Attacker", 3)]
+    p2.board = [guard]
+    game.state.active_player_idx = 0
+    game.state.phase = Phase.P1_MAIN
+
+    game.step("ATTACK", 0)
+    game.step("BLOCK", 0)
+
+    assert p2.hp == 4
+    assert p1.board == []
+
+
+def test_scoped_listener_reacts_to_allies_only(game_empty):
+    p1, p2 = game_empty.state.player1, game_empty.state.player2
+    mourner = Card("m", "Mourner", 1, trigger=Trigger.ON_DEATH,
+                   effects=[heal_owner()], trigger_scope="ALLIES")
+    ally, enemy = Card("x", "Ally", 2), Card("y", "Enemy", 2)
+    p1.board = [mourner, ally]
+    p2.board = [enemy]
+    cm = game_empty.combat_manager
+
+    cm.apply_lethal_damage(enemy, p2)
+    assert p1.hp == 3
+
+    cm.apply_lethal_damage(ally, p1)
+    assert p1.hp == 4
+
+    # Un écouteur scopé ne réagit pas à sa propre mort
+    cm.apply_lethal_damage(mourner, p1)
+    assert p1.hp == 4
+
+
+def test_emit_without_effect_manager_is_a_noop():
+    p1, p2 = Player("P1"), Player("P2")
+    card = Card("c", "C", 1, trigger=Trigger.ON_PLAY, effects=[heal_owner()])
+    assert EventManager.emit(Trigger.ON_PLAY, card, p1, p2, None) is False
+    assert p1.hp == 3
@@ -0,0 +1,123 @@
+import io
+import json
+import random
+
+from mindbug_engine.core.consts import Phase
+from mindbug_engine.core.record import GameRecord
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.utils.events import EventStream, GameEventType, JsonlSink
+from mindbug_engine.utils.logger import silenced
+
+
+def _play(game, seed, max_moves=400):
+    rng = random.Random(seed)
+    with silenced():
+        for _ in range(max_moves):
+            moves = game.get_legal_moves()
+            if not moves:
+                break
+            game.step(*rng.choice(moves))
+
+
+def test_play_mindbug_attack_block_events(game_empty, create_card):
+    game = game_empty
+    p1, p2 = game.state.player1, game.state.player2
+    game.state.phase = Phase.P1_MAIN
+    played = create_card("Volée", power=5)
+    p1.hand = [played]
+    p2.mindbugs = 1
+    stream = game.enable_events(game_id="t")
+
+    game.step("PLAY", 0)
+    game.step("MINDBUG", -1)
+    events = list(stream.drain())
+    assert [(e["type"], e["player"], e["card"]) for e in events] == [
+        ("CARD_PLAYED", 0, played.id), ("MINDBUG_USED", 1, played.id)]
+    assert all(e["game"] == "t" for e in events)
+    assert len(stream) == 0
+
+    # P1 rejoue : attaque, P2 bloque avec la carte volée, l'attaquant meurt
+    attacker = create_card("Attaquant", power=3)
+    p1.board = [attacker]
+    game.step("ATTACK", 0)
+    game.step("BLOCK", 0)
+    events = list(stream.drain())
+    summary = [(e["type"], e["player"], e["card"]) for e in events]
+    assert summary[:3] == [("ATTACK", 0, attacker.id), ("BLOCK", 1, played.id), ("DEATH", 0, attacker.id)]
+    assert events[1]["attacker"] == attacker.id
+    assert ("TURN_END", 0, None) in summary
+    assert [e["seq"] for e in events] == list(range(2, 2 + len(events)))
+
+
+def test_full_game_stream_is_consistent():
+    game = MindbugGame.start_headless(seed=3)
+    stream = game.enable_events()
+    seen = []
+    stream.subscribe(seen.append)
+    _play(game, seed=3)
+
+    events = list(stream.drain())
+    assert events == seen
+    types = {e["type"] for e in events}
+    assert {"CARD_PLAYED", "ATTACK", "TURN_END"} <= types
+    assert all(e["type"] in GameEventType.__members__ for e in events)
+    assert all(-1 <= e["ply"] < len(game.history) for e in events)
+
+    # ply = index du coup dans l'enregistrement, y compris après une attaque Frenzy automatique
+    record = GameRecord.from_game(game)
+    attacks = [e for e in events if e["type"] == "ATTACK"]
+    assert len(attacks) > sum(move[0] == "ATTACK" for move in record.moves)
+    assert {ply for ply, move in enumerate(record.moves) if move[0] == "ATTACK"} <= {e["ply"] for e in attacks}
+    caused_by = {"CARD_PLAYED": "PLAY", "MINDBUG_USED": "MINDBUG"}
+    for e in events:
+        if e["type"] in caused_by:
+            assert record.moves[e["ply"]][0] == caused_by[e["type"]]
+    if game.state.winner is not None:
+        assert events[-1]["type"] == "GAME_OVER"
+        assert events[-1]["player"] == (0 if game.state.winner is game.state.player1 else 1)
+    # Les dégâts subis retrouvent les PV finaux
+    for idx, player in enumerate(game.state.players):
+        lost = sum(e["amount"] for e in events if e["type"] == "DAMAGE" and e["player"] == idx)
+        assert player.hp >= 3 - lost
+
+
+def test_clones_do_not_inherit_stream(game):
+    stream = game.enable_events()
+    clone = game.clone()
+    assert clone.events is None
+    with silenced():
+        clone.step("PLAY", 0)
+    assert len(stream) == 0
+    assert game.disable_events() is stream and game.events is None
+
+
+def test_jsonl_sink_buffers_and_flushes():
+    buffer = io.StringIO()
+    stream = EventStream(game_id=7, keep=False)
+    sink = stream.subscribe(JsonlSink(buffer, buffer_size=3))
+    game = MindbugGame.start_headless(seed=5)
+    game.enable_events(stream)
+    _play(game, seed=5, max_moves=6)
+
+    assert len(stream) == 0  # keep=False : rien n'est accumulé
+    written = buffer.getvalue().count("\n")
+    assert written % 3 == 0 and written <= stream.count
+    sink.close()
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == stream.count
+    assert [json.loads(line)["seq"] for line in lines] == list(range(stream.count))
+
+
+def test_death_only_for_cards_leaving_the_board(game_empty, create_card):
+    game = game_empty
+    p1 = game.state.player1
+    on_board, in_hand = create_card("Plateau", power=2), create_card("Main", power=2)
+    p1.board = [on_board]
+    p1.hand = [in_hand]
+    stream = game.enable_events()
+
+    game.combat_manager.apply_lethal_damage(in_hand, p1)
+    game.combat_manager.apply_lethal_damage(on_board, p1)
+    deaths = [e["card"] for e in stream.drain() if e["type"] == "DEATH"]
+    assert deaths == [on_board.id]
+    assert p1.hand == [in_hand] and p1.discard == [on_board]
@@ -0,0 +1,109 @@
+import pytest
+
+from mindbug_engine.core.config import ConfigurationService
+from mindbug_engine.core.record import GameRecord, decode_move, encode_move
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.utils.logger import silenced
+from mindbug_engine.utils.replay import GameReplayer
+from mindbug_ai.heuristic import HeuristicAgent
+from mindbug_ai.learning.selfplay import play_game
+
+
+def _played_game(seed, max_moves=400):
+    agents = [HeuristicAgent(0.3, seed=seed), HeuristicAgent(0.3, seed=seed + 1)]
+    with silenced():
+        return play_game(seed, agents, max_steps=max_moves)
+
+
+def _same_position(a, b):
+    return a.observe(0) == b.observe(0) and a.observe(1) == b.observe(1)
+
+
+def test_move_codes_are_compact():
+    assert decode_move(encode_move(("PLAY", 3))) == ("PLAY", 3)
+    assert decode_move(encode_move(("PASS", -1))) == ("PASS", -1)
+    assert encode_move(("SELECT_OPP_DISCARD", 5)) < 128  # un octet
+    with pytest.raises(ValueError):
+        encode_move(("TELEPORT", 0))
+
+
+def test_round_trip_and_replay_final_position(tmp_path):
+    game = _played_game(seed=4)
+    record = GameRecord.from_game(game)
+    assert record.auto_initiative and len(record) == len(game.history) > 0
+
+    data = record.to_bytes()
+    # En-tête (graine, sets, deck) + ~1 octet par coup
+    assert len(data) < 120 + 2 * len(record)
+    path = tmp_path / "game.mbr"
+    record.save(str(path))
+    assert GameRecord.load(str(path)) == record
+
+    replayer = GameReplayer(record, snapshot_interval=8)
+    assert replayer.verify()
+    assert _same_position(replayer.position(len(record)), game)
+
+
+def test_snapshot_access_matches_sequential_replay():
+    record = GameRecord.from_game(_played_game(seed=9))
+    sequential = {ply: (g.observe(0), g.observe(1)) for ply, g in GameReplayer(record).positions()}
+
+    replayer = GameReplayer(record, snapshot_interval=5)
+    # Accès dans le désordre : reconstruit depuis l'instantané le plus proche
+    for ply in (len(record), 3, len(record) // 2, 0, 11):
+        game = replayer.position(ply)
+        assert (game.observe(0), game.observe(1)) == sequential[ply]
+        assert game.history == list(record.moves[:ply])
+    assert GameRecord.from_game(replayer.position(len(record))) == record
+
+    with pytest.raises(IndexError):
+        replayer.position(len(record) + 1)
+
+
+def test_gui_style_game_records_initiative_confirmation():
+    game = MindbugGame(ConfigurationService(load_from_disk=False), seed=21)
+    with silenced():
+        game.start_game()
+        while game.state.initiative_duel:
+            game.step("CONFIRM_INITIATIVE")
+        game.step(*game.get_legal_moves()[0])
+    record = GameRecord.from_game(game)
+    assert not record.auto_initiative
+    assert _same_position(GameReplayer(record).position(len(record)), game)
+
+
+def test_unreplayable_or_mismatched_records_are_rejected():
+    with pytest.raises(ValueError):
+        GameRecord.from_game(MindbugGame(ConfigurationService(load_from_disk=False)))
+    with pytest.raises(ValueError):
+        GameRecord.from_bytes(b"XXXX")
+
+    record = GameRecord.from_game(MindbugGame.start_headless(seed=1))
+    tampered = GameRecord(record.seed, record.sets, tuple(reversed(record.deck)), record.moves)
+    with pytest.raises(ValueError):
+        GameReplayer(tampered).position(0)
+
+
+def test_frenzy_auto_attacks_are_replayed_not_recorded(monkeypatch):
+    """La seconde attaque Frenzy est jouée par le moteur : le rejeu la redéclenche."""
+    auto_steps = []
+    step = MindbugGame.step
+
+    def counting_step(game, action_type, index=-1):
+        if game._step_depth:
+            auto_steps.append((action_type, index))
+        step(game, action_type, index)
+
+    monkeypatch.setattr(MindbugGame, "step", counting_step)
+    game = _played_game(seed=12)
+    record = GameRecord.from_game(game)
+    monkeypatch.undo()
+    assert auto_steps and all(action == "ATTACK" for action, _ in auto_steps)
+
+    replayer = GameReplayer(record)
+    assert replayer.verify()
+    final = replayer.position(len(record))
+    # Puissances passives recalculées au prochain coup : on les rafraîchit des deux côtés
+    final.update_board_states()
+    game.update_board_states()
+    assert _same_position(final, game)
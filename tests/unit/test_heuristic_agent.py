@@ -0,0 +1,60 @@
+from mindbug_engine.core.consts import Phase
+from mindbug_engine.core.models import SelectionRequest
+from mindbug_ai.heuristic import HeuristicAgent, CardValues
+
+
+def test_card_value_adds_effect_bonus(create_card):
+    plain = create_card("Plain", 5)
+    thief = create_card("Thief", 5, effect_type="STEAL", effect_target="ENEMIES")
+    assert CardValues.value(thief) > CardValues.value(plain) == 5
+
+
+def test_main_phase_takes_winning_attack_else_plays(game_empty, create_card):
+    p1, p2 = game_empty.state.player1, game_empty.state.player2
+    p1.hand = [create_card("Small", 2), create_card("Big", 8)]
+    p1.board = [create_card("Ninja", 3, keywords=["SNEAKY"])]
+    p2.board = [create_card("Wall", 6)]
+    agent = HeuristicAgent()
+
+    assert agent.get_action(game_empty) == ("ATTACK", 0)
+
+    p1.board = []
+    assert agent.get_action(game_empty) == ("PLAY", 1)
+    # Mindbugs adverses : on garde la grosse carte
+    p2.mindbugs = 1
+    assert agent.get_action(game_empty) == ("PLAY", 0)
+
+
+def test_block_and_mindbug_decisions(game_empty, create_card):
+    state = game_empty.state
+    attacker = create_card("Atk", 4)
+    state.player1.board = [attacker]
+    state.player2.board = [create_card("Small", 1), create_card("Big", 6)]
+    state.phase = Phase.BLOCK_DECISION
+    state.active_player_idx = 1
+    state.pending_attacker = attacker
+    assert HeuristicAgent().get_action(game_empty) == ("BLOCK", 1)
+
+    state.phase = Phase.MINDBUG_DECISION
+    state.pending_attacker = None
+    state.player2.mindbugs = 2
+    state.pending_card = create_card("Titan", 10)
+    assert HeuristicAgent().get_action(game_empty) == ("MINDBUG", -1)
+    state.pending_card = create_card("Mouse", 2)
+    assert HeuristicAgent().get_action(game_empty) == ("PASS", -1)
+
+
+def test_selection_skips_already_selected(game_empty, create_card):
+    state = game_empty.state
+    p1 = state.player1
+    low, mid, high = create_card("Low", 1), create_card("Mid", 4), create_card("High", 9)
+    p1.hand = [high, low, mid]
+    state.phase = Phase.RESOLUTION_CHOICE
+    state.active_request = SelectionRequest(candidates=[high, low, mid], count=2,
+                                            reason="DISCARD", selector=p1)
+
+    agent = HeuristicAgent()
+    # Défausse chez soi : la carte la moins précieuse, puis la suivante
+    assert agent.get_action(game_empty) == ("SELECT_HAND", 1)
+    state.active_request.current_selection.append(low)
+    assert agent.get_action(game_empty) == ("SELECT_HAND", 2)
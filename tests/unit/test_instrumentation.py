@@ -0,0 +1,63 @@
+import json
+from mindbug_engine.core.models import Card, CardEffect
+from mindbug_engine.core.consts import Phase, Trigger, EffectType
+from mindbug_engine.utils.instrumentation import EngineStats
+
+
+def test_stats_disabled_by_default(game):
+    assert game.stats is None
+    game.get_legal_moves()
+    assert game.clone().stats is None
+
+
+def test_stats_count_commands_effects_and_actions(game):
+    p1, p2 = game.state.player1, game.state.player2
+    destroy = CardEffect(EffectType.DESTROY,
+                         target={"group": "ENEMIES", "zone": "BOARD", "select": "ALL"})
+    p1.hand = [Card("bomb", "Bomb", 3, trigger=Trigger.ON_PLAY, effects=[destroy])]
+    p2.board = [Card("v", "Victim", 5)]
+    game.state.active_player_idx = 0
+    game.state.phase = Phase.P1_MAIN
+
+    stats = game.enable_stats()
+    game.get_legal_moves()
+    game.step("PLAY", 0)
+
+    assert stats.timers["legal_moves"].count == 1
+    assert stats.timers["command:PlayCardCommand"].count == 1
+    assert stats.timers["effect:DESTROY"].count == 1
+    assert stats.timers["action:DestroyAction"].count == 1
+    assert stats.timers["passives"].count >= 2
+
+    # Piles imbriquées pour les flame graphs
+    assert "command:PlayCardCommand;effect:DESTROY;action:DestroyAction" in stats.folded
+    line = stats.to_folded().splitlines()[0]
+    path, value = line.rsplit(" ", 1)
+    assert path and int(value) >= 0
+
+    assert game.disable_stats() is stats
+    assert game.stats is None
+
+
+def test_clones_share_stats_and_export_json(game, tmp_path):
+    stats = game.enable_stats()
+    clone = game.clone()
+    assert clone.stats is stats
+
+    clone.get_legal_moves()
+    assert stats.timers["legal_moves"].count == 1
+
+    out = tmp_path / "stats.json"
+    stats.to_json(str(out))
+    data = json.loads(out.read_text())
+    assert data["legal_moves"]["count"] == 1
+
+
+def test_stop_accumulates_self_time_only():
+    stats = EngineStats()
+    with stats.measure("outer"):
+        with stats.measure("inner"):
+            pass
+    outer, inner = stats.timers["outer"], stats.timers["inner"]
+    assert outer.total >= inner.total
+    assert abs(stats.folded["outer"] + stats.folded["outer;inner"] - outer.total) < 1e-9
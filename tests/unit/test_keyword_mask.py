@@ -0,0 +1,68 @@
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from mindbug_engine.core.consts import Keyword, KeywordFlag, keyword_mask, keywords_of
+from mindbug_engine.core.models import Card, has_keyword, grant_keywords, mask_of
+
+
+def test_keyword_mask_roundtrip():
+    mask = keyword_mask(["POISON", Keyword.FRENZY])
+    assert mask == KeywordFlag.POISON | KeywordFlag.FRENZY
+    # Ordre canonique de l'Enum, quel que soit l'ordre d'entrée
+    assert keywords_of(mask) == (Keyword.FRENZY, Keyword.POISON)
+    with pytest.raises(ValueError):
+        keyword_mask(["NOT_A_KEY"])
+
+
+def test_card_keywords_view_behaves_like_list():
+    c = Card("k1", "Multi", 4, keywords=["TOUGH", "SNEAKY"])
+    assert "TOUGH" in c.keywords and Keyword.SNEAKY in c.keywords
+    assert "POISON" not in c.keywords and "FOO" not in c.keywords
+    assert len(c.keywords) == 2
+    assert c.keywords == [Keyword.SNEAKY, Keyword.TOUGH]
+
+    c.keywords.append(Keyword.HUNTER)
+    c.keywords.remove("TOUGH")
+    assert c.has_keyword(Keyword.HUNTER) and not c.has_keyword(Keyword.TOUGH)
+    with pytest.raises(ValueError):
+        c.keywords.remove(Keyword.TOUGH)
+
+    # Les masques de base ne bougent pas : reset = simple affectation
+    assert c.base_keyword_mask == KeywordFlag.TOUGH | KeywordFlag.SNEAKY
+    c.reset()
+    assert c.keyword_mask == c.base_keyword_mask
+
+
+def test_refresh_clears_tough_bit_only_when_damaged():
+    c = Card("k2", "Tank", 5, keywords=["TOUGH", "POISON"])
+    c.keywords.append("FRENZY")
+    c.refresh_state()
+    assert c.keywords == ["TOUGH", "POISON"]
+
+    c.is_damaged = True
+    c.refresh_state()
+    assert c.keyword_mask == KeywordFlag.POISON
+
+
+def test_copy_and_pickle_preserve_masks():
+    c = Card("k3", "Hybrid", 3, keywords=["HUNTER"])
+    c.keywords.append("POISON")
+    for clone in (c.copy(), pickle.loads(pickle.dumps(c))):
+        assert clone.base_keyword_mask == c.base_keyword_mask
+        assert clone.keyword_mask == c.keyword_mask
+
+
+def test_helpers_support_plain_keyword_lists():
+    fake = SimpleNamespace(name="F", keywords=[Keyword.TOUGH])
+    assert has_keyword(fake, Keyword.TOUGH)
+    assert mask_of(fake) == KeywordFlag.TOUGH
+
+    gained = grant_keywords(fake, KeywordFlag.TOUGH | KeywordFlag.SNEAKY)
+    assert gained == KeywordFlag.SNEAKY
+    assert fake.keywords == [Keyword.TOUGH, Keyword.SNEAKY]
+
+    card = Card("k4", "Real", 2)
+    assert grant_keywords(card, mask_of(fake)) == KeywordFlag.TOUGH | KeywordFlag.SNEAKY
+    assert grant_keywords(card, KeywordFlag.TOUGH) == 0
@@ -57,4 +57,15 @@ def test_legal_moves_frenzy_constraint(game):
 
     # Seule l'attaque avec la carte en fureur est légale
     assert len(moves) == 1
-    assert moves[0] == ("ATTACK", 0)
\ No newline at end of file
+    assert moves[0] == ("ATTACK", 0)
+
+
+def test_acting_player_is_selector_during_selection(game):
+    state = game.state
+    state.active_player_idx = 0
+    assert state.acting_player_idx == 0
+
+    state.phase = Phase.RESOLUTION_CHOICE
+    state.active_request = SelectionRequest(candidates=[], count=1, reason="Test",
+                                            selector=state.player2, callback=lambda x: None)
+    assert state.acting_player_idx == 1
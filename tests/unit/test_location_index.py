@@ -0,0 +1,84 @@
+from mindbug_engine.core.models import Card, Player, zone_of
+
+
+def cards(n, prefix="c"):
+    return [Card(f"{prefix}{i}", f"{prefix.upper()}{i}", i) for i in range(n)]
+
+
+def test_positions_follow_zone_mutations():
+    p = Player("P")
+    a, b, c, d = cards(4)
+    p.hand = [a, b, c]
+    assert p.locate(b) == ("hand", 1)
+
+    p.hand.remove(a)
+    assert p.locate(a) is None
+    assert p.locate(b) == ("hand", 0) and p.locate(c) == ("hand", 1)
+
+    p.hand.insert(0, d)
+    assert [p.locate(x)[1] for x in (d, b, c)] == [0, 1, 2]
+
+    card = p.hand.pop(1)
+    p.board.append(card)
+    assert p.locate(b) == ("board", 0)
+    assert p.locate(c) == ("hand", 1)
+
+    p.hand.clear()
+    assert p.locate(c) is None and p.locate(d) is None
+    assert p.locate(b) == ("board", 0)
+
+
+def test_reassigned_zones_are_reindexed_on_lookup():
+    p = Player("P")
+    a, b, c, d = cards(4)
+    hand = p.hand
+    p.hand = [a, b]
+    p.deck = [c]
+    # Réaffectations successives (déterminisation) : seule la dernière compte
+    p.hand = [c, d]
+    p.deck = [a]
+    assert p.hand is hand
+    assert p.locate(d) == ("hand", 1) and p.locate(a) == ("deck", 0)
+    assert p.locate(b) is None
+    assert zone_of(p, c) == "hand"
+
+
+def test_move_between_players_updates_both_indexes(game_empty):
+    state = game_empty.state
+    p1, p2 = state.player1, state.player2
+    target, other = cards(2, "t")
+    p1.board = [other, target]
+
+    assert state.locate(target) == (p1, "board", 1)
+    assert state.owner_of(target) is p1
+
+    p1.board.remove(target)
+    p2.board.append(target)
+
+    assert state.locate(target) == (p2, "board", 0)
+    assert state.locate(other) == (p1, "board", 0)
+    assert zone_of(p1, target) is None
+    assert zone_of(p2, target) == "board"
+
+
+def test_index_rebuilt_after_clone(game):
+    sim = game.clone()
+    for p_sim in sim.state.players:
+        for name in Player.ZONES:
+            for i, c in enumerate(getattr(p_sim, name)):
+                assert sim.state.locate(c) == (p_sim, name, i)
+
+    # Les index du clone ne référencent pas les cartes de l'original
+    original = game.state.player1.hand[0]
+    assert sim.state.locate(original) is None
+
+
+def test_zone_of_falls_back_to_scan_for_plain_objects():
+    class Holder:
+        hand, board, discard, deck = [], [], [], []
+
+    holder = Holder()
+    card = Card("x", "X", 1)
+    holder.discard = [card]
+    assert zone_of(holder, card) == "discard"
+    assert zone_of(holder, Card("y", "Y", 1)) is None
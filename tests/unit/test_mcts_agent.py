@@ -38,3 +38,14 @@ def test_mcts_agent_returns_move_within_time_budget():
     assert agent.root is not None
     # On vérifie qu'il a fait au moins quelques simulations
     assert agent.root.visits > 0
+
+
+def test_mcts_agent_simulates_from_its_observation(game, monkeypatch):
+    """Les simulations partent de l'observation de l'IA : le vrai jeu n'est jamais copié."""
+    agent = MCTSAgent(simulation_time=0.05, use_solver=False)
+    monkeypatch.setattr(game, "clone", MagicMock(side_effect=AssertionError("copie du vrai jeu")))
+
+    action = agent.get_action(game)
+
+    assert action in game.get_legal_moves()
+    assert agent.last_iterations > 0
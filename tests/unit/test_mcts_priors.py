@@ -0,0 +1,61 @@
+import pytest
+
+from mindbug_engine.core.consts import Phase
+from mindbug_ai.mcts.agent import MCTSAgent
+from mindbug_ai.mcts.node import MCTSNode
+from mindbug_ai.mcts.priors import HeuristicPrior, UniformPrior
+
+
+def test_heuristic_prior_prefers_winning_attack(game_empty, create_card):
+    p1, p2 = game_empty.state.player1, game_empty.state.player2
+    p1.board = [create_card("Weak", 1), create_card("Ninja", 3, keywords=["SNEAKY"])]
+    p2.board = [create_card("Wall", 5)]
+
+    moves = game_empty.get_legal_moves()
+    probs = HeuristicPrior().evaluate(game_empty, moves)
+    assert sum(probs) == pytest.approx(1.0)
+    assert probs[moves.index(("ATTACK", 1))] > probs[moves.index(("ATTACK", 0))]
+    assert UniformPrior().evaluate(game_empty, moves) == [0.5, 0.5]
+
+
+def test_prior_drives_expansion_order_and_child_prior(game_empty, create_card):
+    state = game_empty.state
+    attacker = create_card("Atk", 4)
+    state.player1.board = [attacker]
+    state.player2.board = [create_card("Small", 1), create_card("Big", 6)]
+    state.phase = Phase.BLOCK_DECISION
+    state.active_player_idx = 1
+    state.pending_attacker = attacker
+
+    node = MCTSNode(state=game_empty, move_prior=HeuristicPrior())
+    # Bloquer avec Big (tue l'attaquant et survit) est développé en premier
+    assert node.next_untried_move() == ("BLOCK", 1)
+
+    child = node.add_child(("BLOCK", 1), game_empty, 1)
+    assert child.prior == pytest.approx(node.priors[("BLOCK", 1)])
+    assert child.move_prior is node.move_prior
+
+
+def test_progressive_widening_and_puct():
+    node = MCTSNode()
+    node.untried_moves = [("PLAY", 0), ("PLAY", 1), ("PLAY", 2)]
+    assert node.can_expand(None)
+    assert node.can_expand((1.0, 0.5))
+
+    a = node.add_child(("PLAY", 0), None, 0)
+    assert not node.can_expand((1.0, 0.5))  # 0 visite : un seul enfant
+    node.visits = 4
+    assert node.can_expand((1.0, 0.5))       # ceil(sqrt(4)) = 2 enfants
+
+    b = node.add_child(("PLAY", 1), None, 0)
+    a.prior, b.prior = 0.9, 0.1
+    a.visits = b.visits = 2
+    a.wins = b.wins = 1
+    assert node.puct_select_child() is a
+
+
+def test_agent_with_priors_returns_legal_move(game):
+    agent = MCTSAgent(simulation_time=0.05, use_solver=False, widening=(1.0, 0.5))
+    move = agent.get_action(game)
+    assert move in game.get_legal_moves()
+    assert agent.last_iterations > 0
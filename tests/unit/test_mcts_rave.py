@@ -0,0 +1,48 @@
+from mindbug_engine.core.consts import Difficulty
+from mindbug_ai.factory import AgentFactory
+from mindbug_ai.mcts.agent import MCTSAgent
+from mindbug_ai.mcts.node import MCTSNode
+
+
+def test_value_blends_amaf_with_schedule():
+    node = MCTSNode(move=("ATTACK", 0))
+    node.visits, node.wins = 1, 0.0
+    node.amaf_visits, node.amaf_wins = 10, 10.0
+
+    assert node.value() == 0.0
+    blended = node.value(rave_k=30)
+    assert 0.0 < blended < 1.0
+    # Plus de visites réelles : AMAF pèse moins
+    node.visits = 100
+    assert node.value(rave_k=30) < blended
+
+
+def test_update_amaf_credits_moves_played_later():
+    root = MCTSNode()
+    a = root.add_child(("PLAY", 0), None, 0, amaf_key=("PLAY", "01"))
+    b = root.add_child(("PLAY", 1), None, 0, amaf_key=("PLAY", "02"))
+    c = root.add_child(("PASS", -1), None, 0)
+
+    # L'arbre a suivi a, puis le rollout a joué "02" (joueur 0) et "PASS" (joueur 1)
+    trajectory = [(0, ("PLAY", "01")), (0, ("PLAY", "02")), (1, ("PASS", -1))]
+    MCTSAgent._update_amaf(a, trajectory, tree_depth=1, results=(1.0, 0.0))
+
+    assert (a.amaf_visits, a.amaf_wins) == (1, 1.0)
+    assert (b.amaf_visits, b.amaf_wins) == (1, 1.0)
+    # PASS joué par l'autre joueur : pas de crédit
+    assert c.amaf_visits == 0
+
+
+def test_amaf_key_uses_card_identity(game):
+    ap = game.state.active_player
+    assert MCTSAgent._amaf_key(game, ("PLAY", 0)) == ("PLAY", ap.hand[0].id)
+    assert MCTSAgent._amaf_key(game, ("NO_BLOCK", -1)) == ("NO_BLOCK", -1)
+
+
+def test_rave_agent_runs_and_factory_enables_it_on_short_budgets(game):
+    agent = MCTSAgent(simulation_time=0.05, use_solver=False, rave_k=50)
+    assert agent.get_action(game) in game.get_legal_moves()
+    assert any(c.amaf_visits for c in agent.root.children)
+
+    assert AgentFactory.create_agent(Difficulty.EASY, "MCTS").rave_k == 50
+    assert AgentFactory.create_agent(Difficulty.HARD, "MCTS").rave_k is None
@@ -0,0 +1,37 @@
+from mindbug_engine.core.consts import Phase
+from mindbug_ai.mcts.node import MCTSNode
+
+
+def test_collapse_identical_copies_in_hand_and_board(game_empty, create_card):
+    p1 = game_empty.state.player1
+    p1.hand = [create_card("Twin", 3), create_card("Other", 2), create_card("Twin", 3)]
+    p1.board = [create_card("Guard", 4), create_card("Guard", 4)]
+
+    assert len(game_empty.get_legal_moves()) == 5
+    assert game_empty.get_legal_moves(collapse_equivalent=True) == [
+        ("PLAY", 0), ("PLAY", 1), ("ATTACK", 0)]
+
+
+def test_distinct_state_is_not_collapsed(game_empty, create_card):
+    p1 = game_empty.state.player1
+    hurt = create_card("Tank", 4, keywords=["TOUGH"])
+    fresh = create_card("Tank", 4, keywords=["TOUGH"])
+    p1.board = [hurt, fresh]
+    hurt.is_damaged = True
+
+    assert game_empty.get_legal_moves(collapse_equivalent=True) == [("ATTACK", 0), ("ATTACK", 1)]
+
+
+def test_block_moves_collapsed_and_node_uses_option(game_empty, create_card):
+    state = game_empty.state
+    attacker = create_card("Atk", 5)
+    state.player1.board = [attacker]
+    state.player2.board = [create_card("Wall", 2), create_card("Wall", 2)]
+    state.phase = Phase.BLOCK_DECISION
+    state.active_player_idx = 1
+    state.pending_attacker = attacker
+
+    assert game_empty.get_legal_moves(collapse_equivalent=True) == [("NO_BLOCK", -1), ("BLOCK", 0)]
+    node = MCTSNode(state=game_empty, collapse_equivalent=True)
+    assert node.untried_moves == [("NO_BLOCK", -1), ("BLOCK", 0)]
+    assert len(MCTSNode(state=game_empty).untried_moves) == 3
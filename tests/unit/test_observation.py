@@ -0,0 +1,78 @@
+import dataclasses
+import pytest
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.core.models import Card, SelectionRequest
+from mindbug_engine.core.consts import Phase
+from mindbug_engine.core.observation import Observation, Completion
+from mindbug_ai.mcts.determinizer import Determinizer
+
+
+@pytest.fixture
+def dealt_game(game):
+    """Partie distribuée avec des pioches non vides (zones cachées)."""
+    p1, p2 = game.state.player1, game.state.player2
+    p1.deck = [p1.hand.pop()]
+    p2.deck = [p2.hand.pop(), p2.hand.pop()]
+    game.state.deck = [p1.hand.pop()]
+    p1.board = [p1.hand.pop()]
+    game.state.active_player_idx = 0
+    game.state.phase = Phase.P1_MAIN
+    return game
+
+
+def test_observation_hides_private_zones(dealt_game):
+    state = dealt_game.state
+    obs = dealt_game.observe(0)
+
+    assert obs.me.hand == tuple(c.id for c in state.player1.hand)
+    assert obs.opponent.hand is None
+    assert obs.opponent.hand_size == len(state.player2.hand)
+    assert obs.me.deck_size == 1 and obs.opponent.deck_size == 2
+    assert obs.me.board[0].id == state.player1.board[0].id
+
+    hidden = state.player2.hand + state.player1.deck + state.player2.deck + state.deck
+    assert obs.hidden_pool == tuple(sorted(c.id for c in hidden))
+
+
+def test_observation_is_immutable(dealt_game):
+    obs = dealt_game.observe(1)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        obs.phase = Phase.P2_MAIN
+
+
+def test_from_observation_builds_playable_game(dealt_game):
+    obs = dealt_game.observe(0)
+    completion = Determinizer().sample_completion(obs)
+
+    sim = MindbugGame.from_observation(obs, completion)
+
+    # La partie reconstruite a la même forme publique...
+    assert sim.observe(0).players[0] == obs.players[0]
+    assert sim.observe(0).hidden_pool == obs.hidden_pool
+    # ... et se joue normalement
+    assert sim.get_legal_moves() == dealt_game.get_legal_moves()
+    played = obs.me.hand[0]
+    sim.step("PLAY", 0)
+    assert any(c.id == played for p in sim.state.players for c in p.board)
+
+
+def test_sample_completion_respects_sizes(dealt_game):
+    obs = dealt_game.observe(1)
+    completion = Determinizer().sample_completion(obs)
+
+    assert len(completion.opponent_hand) == obs.players[0].hand_size
+    assert len(completion.decks[0]) == 1 and len(completion.decks[1]) == 2
+    assert len(completion.deck) == obs.deck_size
+    dealt = completion.opponent_hand + completion.decks[0] + completion.decks[1] + completion.deck
+    assert sorted(dealt) == list(obs.hidden_pool)
+
+
+def test_from_observation_rejects_invalid_input(dealt_game):
+    obs = dealt_game.observe(0)
+    with pytest.raises(ValueError):
+        MindbugGame.from_observation(obs, Completion((), ((), ()), ()))
+
+    dealt_game.state.active_request = SelectionRequest(
+        candidates=[], count=1, reason="TEST", selector=dealt_game.state.player1)
+    with pytest.raises(ValueError):
+        MindbugGame.from_observation(dealt_game.observe(0), Completion((), ((), ()), ()))
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from mindbug_engine.core.consts import Phase
+from mindbug_engine.core.record import GameRecord
+from mindbug_engine.utils.archive import PHASES, ReplayArchive, card_index
+from mindbug_engine.utils.logger import silenced
+from mindbug_ai.heuristic import HeuristicAgent
+from mindbug_ai.learning.selfplay import play_game
+
+
+def _record(seed, max_moves=400):
+    agents = [HeuristicAgent(0.3, seed=seed), HeuristicAgent(0.3, seed=seed + 1)]
+    with silenced():
+        return GameRecord.from_game(play_game(seed, agents, max_steps=max_moves))
+
+
+@pytest.fixture(scope="module")
+def archive(tmp_path_factory):
+    archive = ReplayArchive(str(tmp_path_factory.mktemp("archive") / "games"), snapshot_interval=8)
+    for seed in range(6):
+        archive.append(_record(seed))
+    return archive
+
+
+def test_append_and_reopen(archive):
+    assert len(archive) == 6
+    assert archive.games["moves"].sum() == len(archive.positions)
+    reopened = ReplayArchive(archive.path)
+    for i in range(len(archive)):
+        assert reopened.record(i) == archive.record(i) == _record(i)
+        assert reopened.games["winner"][i] == (-1 if archive.record(i).winner is None else archive.record(i).winner)
+
+
+def test_mindbug_queries_match_replayed_positions(archive):
+    rows = archive.find_positions(action="MINDBUG")
+    assert len(rows) > 0
+    for row in rows:
+        pos = archive.positions[row]
+        game = archive.position_at(row)
+        card = game.state.pending_card
+        assert card_index(card.id) == pos["card"]
+        # Requête par nom de carte : même résultat
+        assert row in archive.find_positions(action="MINDBUG", card=card.name)
+        assert pos["game"] in archive.find_games(mindbugged=card.name)
+        assert pos["game"] in archive.find_games(seen=card.id)
+
+
+def test_sample_positions_by_phase(archive):
+    rng = np.random.default_rng(0)
+    rows = archive.sample_positions(10, rng=rng, phase=Phase.BLOCK_DECISION)
+    assert len(rows) == 10
+    for row in rows:
+        assert archive.position_at(row).state.phase == Phase.BLOCK_DECISION
+    assert len(archive.sample_positions(5, action="CONFIRM_INITIATIVE")) == 0
+
+
+def test_rejects_foreign_file(tmp_path):
+    (tmp_path / "bad.mbra").write_bytes(b"NOPE")
+    with pytest.raises(ValueError):
+        ReplayArchive(str(tmp_path / "bad"))
+    with pytest.raises(KeyError):
+        card_index("Carte inexistante")
+
+
+def test_interrupted_append_is_ignored_then_overwritten(tmp_path):
+    path = str(tmp_path / "games")
+    archive = ReplayArchive(path)
+    archive.append(_record(0))
+    positions = len(archive.positions)
+
+    # Ajout interrompu : données et positions écrites, ligne de partie absente
+    with open(path + ".mbra", "ab") as f:
+        f.write(b"\x00" * 40)
+    with open(path + ".positions", "ab") as f:
+        f.write(b"\x01" * 25)
+
+    reopened = ReplayArchive(path)
+    assert len(reopened) == 1 and len(reopened.positions) == positions
+    assert reopened.append(_record(1)) == 1
+    assert reopened.games["first_position"][1] == positions
+    assert reopened.games["moves"].sum() == len(reopened.positions)
+    assert reopened.record(1) == _record(1)
+    assert np.all(reopened.positions["game"][positions:] == 1)
+
+
+def test_frenzy_game_positions_match_the_played_game(tmp_path):
+    """Seed 12 : attaques Frenzy automatiques, non enregistrées mais rejouées."""
+    seen = []
+    agents = [HeuristicAgent(0.3, seed=12), HeuristicAgent(0.3, seed=13)]
+    with silenced():
+        game = play_game(12, agents, max_steps=400,
+                         on_position=lambda g: seen.append((g.observe(0), g.observe(1), g.state.phase,
+                                                            g.state.acting_player_idx)))
+    archive = ReplayArchive(str(tmp_path / "games"))
+    archive.append(GameRecord.from_game(game))
+    assert len(archive.positions) == len(seen)
+
+    for row, (obs0, obs1, phase, player) in enumerate(seen):
+        pos = archive.positions[row]
+        assert PHASES[pos["phase"]] == phase and pos["player"] == player
+        replayed = archive.position_at(row)
+        # Puissances passives recalculées avant chaque coup, comme dans la partie jouée
+        replayed.update_board_states()
+        assert (replayed.observe(0), replayed.observe(1)) == (obs0, obs1)
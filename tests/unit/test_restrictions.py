@@ -0,0 +1,82 @@
+from mindbug_engine.core.models import Card, CardEffect
+from mindbug_engine.core.consts import Phase, Trigger, EffectType
+from mindbug_engine.utils.combat_utils import CombatUtils
+
+
+def block_ban(value):
+    return CardEffect(EffectType.BAN, target={"group": "ENEMIES"},
+                      condition={"stat": "POWER", "operator": "LTE", "value": value},
+                      params={"action": "BLOCK"})
+
+
+def silence():
+    return CardEffect(EffectType.BAN, target={"group": "OPPONENT"},
+                      params={"action": "TRIGGER_ON_PLAY"})
+
+
+def test_registry_follows_board_changes(game_empty):
+    state = game_empty.state
+    p1, p2 = state.player1, state.player2
+    widow = Card("06", "Veuve", 2, trigger=Trigger.PASSIVE, effects=[silence()])
+
+    assert state.restrictions("TRIGGER_ON_PLAY", p2) == []
+
+    p1.board.append(widow)
+    assert state.restrictions("TRIGGER_ON_PLAY", p2) == [(widow, widow.effects[0])]
+    assert state.restrictions("TRIGGER_ON_PLAY", p1) == []
+
+    # Vol : la restriction change de camp
+    p1.board.remove(widow)
+    p2.board.append(widow)
+    assert state.restrictions("TRIGGER_ON_PLAY", p2) == []
+    assert len(state.restrictions("TRIGGER_ON_PLAY", p1)) == 1
+
+    p2.board = []
+    assert state.restrictions("TRIGGER_ON_PLAY", p1) == []
+
+
+def test_owner_side_restrictions(game_empty):
+    state = game_empty.state
+    p1 = state.player1
+    self_ban = CardEffect(EffectType.BAN, target={"group": "OWNER"},
+                          params={"action": "TRIGGER_ON_PLAY"})
+    p1.board = [Card("x", "Curse", 1, trigger=Trigger.PASSIVE, effects=[self_ban])]
+
+    assert len(state.restrictions("TRIGGER_ON_PLAY", p1)) == 1
+    assert state.restrictions("TRIGGER_ON_PLAY", state.player2) == []
+
+
+def test_silence_is_lifted_when_source_leaves(game_empty):
+    p1, p2 = game_empty.state.player1, game_empty.state.player2
+    heal = CardEffect(EffectType.MODIFY_STAT, target={"group": "OWNER"},
+                      params={"stat": "HP", "amount": 1, "operation": "ADD"})
+    widow = Card("06", "Veuve", 2, trigger=Trigger.PASSIVE, effects=[silence()])
+    p1.board = [widow]
+
+    game_empty.put_card_on_board(p2, Card("h1", "Healer", 1, trigger=Trigger.ON_PLAY, effects=[heal]))
+    assert p2.hp == 3
+
+    game_empty.combat_manager.apply_lethal_damage(widow, p1)
+    game_empty.put_card_on_board(p2, Card("h2", "Healer", 1, trigger=Trigger.ON_PLAY, effects=[heal]))
+    assert p2.hp == 4
+
+
+def test_block_ban_only_protects_its_source(game_empty):
+    state = game_empty.state
+    p1, p2 = state.player1, state.player2
+    bear = Card("02", "Ours", 8, trigger=Trigger.PASSIVE, effects=[block_ban(6)])
+    other = Card("o", "Other", 3)
+    weak = Card("w", "Weak", 5)
+    p1.board = [bear, other]
+    p2.board = [weak]
+
+    bans = state.restrictions("BLOCK", p2)
+    assert CombatUtils.can_block(bear, weak, bans) is False
+    assert CombatUtils.can_block(other, weak, bans) is True
+
+    state.active_player_idx = 1
+    state.phase = Phase.BLOCK_DECISION
+    state.pending_attacker = other
+    assert ("BLOCK", 0) in game_empty.get_legal_moves()
+    state.pending_attacker = bear
+    assert ("BLOCK", 0) not in game_empty.get_legal_moves()
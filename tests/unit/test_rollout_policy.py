@@ -0,0 +1,91 @@
+import random
+
+import numpy as np
+import pytest
+
+from constants import PATH_ROLLOUT_POLICY
+
+from mindbug_ai.learning import (MOVE_FEATURE_COUNT, MOVE_FEATURE_NAMES, SearchRecorder,
+                                 SoftmaxPolicy, move_features)
+from mindbug_ai.mcts.agent import MCTSAgent
+
+
+def test_move_features_one_row_per_move(game_empty, create_card):
+    p1, p2 = game_empty.state.player1, game_empty.state.player2
+    p1.hand = [create_card("Big", 8, keywords=["POISON"])]
+    p1.board = [create_card("Ninja", 3, keywords=["SNEAKY"])]
+    p2.board = [create_card("Wall", 6)]
+
+    moves = game_empty.get_legal_moves()
+    X = move_features(game_empty, moves)
+    assert X.shape == (len(moves), MOVE_FEATURE_COUNT) and X.dtype == np.float32
+
+    play = X[moves.index(("PLAY", 0))]
+    attack = X[moves.index(("ATTACK", 0))]
+    assert play[MOVE_FEATURE_NAMES.index("is_play")] == 1.0
+    assert play[MOVE_FEATURE_NAMES.index("kw_poison")] == 1.0
+    # Furtif : attaque gratuite, le score tactique la favorise
+    assert attack[MOVE_FEATURE_NAMES.index("heuristic")] > 0
+
+
+def test_fit_recovers_preferred_feature(tmp_path):
+    rng = np.random.default_rng(0)
+    hot = MOVE_FEATURE_NAMES.index("heuristic")
+    samples = []
+    for _ in range(100):
+        X = rng.normal(size=(4, MOVE_FEATURE_COUNT)).astype(np.float32)
+        target = np.zeros(4, dtype=np.float32)
+        target[np.argmax(X[:, hot])] = 1.0
+        samples.append((X, target))
+
+    policy = SoftmaxPolicy.fit(samples, epochs=300)
+    assert policy.agreement(samples) > 0.9
+    assert policy.weights[hot] == max(policy.weights)
+
+    path = tmp_path / "policy.json"
+    policy.save(str(path))
+    loaded = SoftmaxPolicy.load(str(path))
+    assert np.allclose(loaded.weights, policy.weights)
+    assert loaded.cross_entropy(samples) == pytest.approx(policy.cross_entropy(samples))
+
+
+def test_sample_follows_probabilities(game_empty, create_card):
+    game_empty.state.player1.hand = [create_card("A", 2), create_card("B", 9)]
+    moves = game_empty.get_legal_moves()
+    weights = np.zeros(MOVE_FEATURE_COUNT)
+    weights[MOVE_FEATURE_NAMES.index("card_power")] = 50.0
+    policy = SoftmaxPolicy(weights)
+
+    probs = policy.probabilities(game_empty, moves)
+    assert probs.sum() == pytest.approx(1.0)
+    assert policy.sample(game_empty, moves, random.Random(0)) == ("PLAY", 1)
+
+
+def test_rollout_logits_match_feature_matrix(game_empty, create_card):
+    p1, p2 = game_empty.state.player1, game_empty.state.player2
+    p1.hand = [create_card("A", 4, keywords=["TOUGH"]), create_card("B", 7)]
+    p1.board = [create_card("C", 5, keywords=["HUNTER", "POISON"])]
+    p2.board = [create_card("D", 3)]
+    policy = SoftmaxPolicy(np.random.default_rng(1).normal(size=MOVE_FEATURE_COUNT), temperature=0.5)
+
+    moves = game_empty.get_legal_moves()
+    expected = move_features(game_empty, moves).astype(np.float64) @ policy.weights / 0.5
+    assert np.allclose(policy.logits(game_empty, moves), expected, atol=1e-5)
+    assert np.allclose(policy.logits(game_empty, moves), expected, atol=1e-5)  # attributs mémoïsés
+
+
+def test_recorder_and_agent_with_learned_rollouts(game):
+    samples = []
+    policy = SoftmaxPolicy(np.zeros(MOVE_FEATURE_COUNT))
+    recorder = SearchRecorder(MCTSAgent(simulation_time=0.05, rollout_policy=policy), samples)
+
+    move = recorder.get_action(game)
+    assert move in game.get_legal_moves()
+    features, target = samples[0]
+    assert len(features) == len(target) and target.sum() == pytest.approx(1.0)
+
+
+def test_shipped_policy_loads(game):
+    policy = SoftmaxPolicy.load(PATH_ROLLOUT_POLICY)
+    moves = game.get_legal_moves()
+    assert policy.sample(game, moves) in moves
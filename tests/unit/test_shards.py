@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from mindbug_ai.learning import ShardDataset, generate_shards
+from mindbug_ai.learning.encoder import OBSERVATION_SIZE
+
+
+def test_generate_read_and_resume(tmp_path):
+    full = tmp_path / "full"
+    manifest = generate_shards(str(full), games=4, chunk_games=2, shard_size=50)
+    assert manifest["games"] == 4
+    assert len(manifest["shards"]) > 1  # débordement sur plusieurs fragments
+
+    data = ShardDataset(str(full))
+    assert len(data) == manifest["positions"]
+    row = data[len(data) - 1]
+    assert row["obs"].shape == (OBSERVATION_SIZE,)
+    assert row["policy"].sum() == pytest.approx(1.0)
+    # La politique cible ne désigne que des coups légaux
+    batch = data.batch(np.arange(len(data)))
+    assert not (batch["policy"] > 0)[~batch["mask"]].any()
+
+    # Issue : +1 / -1 selon le joueur dans une partie décidée, 0 sinon
+    for seed in np.unique(batch["game"]):
+        rows = batch["game"] == seed
+        outcomes = batch["outcome"][rows]
+        if outcomes.any():
+            winners = set(batch["player"][rows][outcomes > 0])
+            assert len(winners) == 1 and set(batch["player"][rows][outcomes < 0]).isdisjoint(winners)
+
+    # Reprise : 2 parties puis prolongation à 4 = même contenu
+    resumed = tmp_path / "resumed"
+    generate_shards(str(resumed), games=2, chunk_games=2, shard_size=50)
+    generate_shards(str(resumed), games=4, chunk_games=2, shard_size=50)
+    again = ShardDataset(str(resumed)).batch(np.arange(len(data)))
+    for name in ("obs", "policy", "outcome", "game"):
+        assert np.array_equal(again[name], batch[name])
+
+    # Dernier lot incomplet (3 parties sur des lots de 2) : complété par la graine 3
+    topped = tmp_path / "topped"
+    generate_shards(str(topped), games=3, chunk_games=2, shard_size=50)
+    manifest = generate_shards(str(topped), games=4, chunk_games=2, shard_size=50)
+    assert manifest["games"] == 4
+    assert sorted(map(tuple, manifest["chunks_done"])) == [(0, 0, 2), (1, 2, 3), (1, 3, 4)]
+    again = ShardDataset(str(topped)).batch(np.arange(len(data)))
+    for name in ("obs", "policy", "outcome", "game"):
+        assert np.array_equal(again[name], batch[name])
+
+    with pytest.raises(ValueError):
+        generate_shards(str(resumed), games=4, chunk_games=3, shard_size=50)
+    with pytest.raises(IndexError):
+        data.batch([len(data)])
+
+
+def test_process_pool_generation(tmp_path):
+    manifest = generate_shards(str(tmp_path), games=4, chunk_games=1, workers=2, shard_size=1000)
+    assert sorted(chunk for chunk, _, _ in manifest["chunks_done"]) == [0, 1, 2, 3]
+    assert len(ShardDataset(str(tmp_path)).sample(8, np.random.default_rng(0))["obs"]) == 8
@@ -0,0 +1,69 @@
+from mindbug_engine.engine import MindbugGame
+from mindbug_engine.core.models import Card, CardEffect
+from mindbug_engine.core.consts import Phase, Trigger, EffectType
+from mindbug_engine.core.snapshot import GameSnapshot
+
+
+def test_snapshot_roundtrip_is_independent(game):
+    """Le jeu reconstruit est une copie indépendante de l'original."""
+    game.state.player1.hp = 2
+    snap = game.snapshot()
+
+    assert isinstance(snap, GameSnapshot)
+    assert snap.active_player_idx == game.state.active_player_idx
+    assert snap.phase == game.state.phase
+
+    sim = MindbugGame.from_snapshot(snap)
+    assert sim.state.player1.hp == 2
+    assert len(sim.state.player1.hand) == len(game.state.player1.hand)
+
+    sim.state.player1.hp = 0
+    sim.state.player1.hand.clear()
+    assert game.state.player1.hp == 2
+    assert len(game.state.player1.hand) == 5
+
+
+def test_snapshot_excludes_heavy_references(game):
+    """Ni la config, ni le DeckFactory, ni le pool de cartes ne sont embarqués."""
+    sim = MindbugGame.from_snapshot(game.snapshot())
+
+    assert sim.config is None
+    assert sim.deck_factory is None
+    assert sim.state.all_cards_ref == []
+    # Les managers pointent bien sur le nouvel état
+    assert sim.turn_manager.state is sim.state
+    assert sim.combat_manager.state is sim.state
+    assert sim.effect_manager.state is sim.state
+
+
+def test_snapshot_rebinds_pending_selection(game):
+    """Une sélection en attente se résout sur le jeu reconstruit, pas sur l'original."""
+    p1, p2 = game.state.player1, game.state.player2
+    steal = CardEffect(EffectType.STEAL,
+                       target={"group": "ENEMIES", "zone": "BOARD",
+                               "count": 1, "select": "CHOICE_USER"})
+    thief = Card("thief", "Thief", 3, trigger=Trigger.ON_PLAY, effects=[steal])
+    p1.hand = [thief]
+    p2.board = [Card("v1", "Victim", 6), Card("v2", "Other", 2)]
+    game.state.active_player_idx = 0
+    game.state.phase = Phase.P1_MAIN
+
+    game.step("PLAY", 0)
+    assert game.state.phase == Phase.RESOLUTION_CHOICE
+
+    sim = MindbugGame.from_snapshot(game.snapshot())
+    sim.step("SELECT_OPP_BOARD", 0)
+
+    # Le vol a eu lieu dans la simulation...
+    assert [c.id for c in sim.state.player1.board] == ["thief", "v1"]
+    assert sim.state.active_request is None
+    # ... et l'original est intact, toujours en attente de sélection
+    assert [c.id for c in game.state.player2.board] == ["v1", "v2"]
+    assert game.state.active_request is not None
+
+
+def test_clone_shares_config_and_factory(game):
+    clone = game.clone()
+    assert clone.config is game.config
+    assert clone.deck_factory is game.deck_factory
+    assert clone.state is not game.state
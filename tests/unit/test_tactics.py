@@ -0,0 +1,62 @@
+from mindbug_engine.core.consts import Phase
+from mindbug_ai.tactics import TacticalAnalyzer, HP_VALUE
+
+
+def test_attack_options_pick_defender_best_block(game_empty, create_card):
+    p1, p2 = game_empty.state.player1, game_empty.state.player2
+    big = create_card("Big", 6)
+    small = create_card("Small", 2)
+    p1.board = [big, small]
+    p2.board = [create_card("Wall", 4)]
+
+    options = TacticalAnalyzer.attack_options(game_empty)
+    assert [o.attacker_index for o in options] == [0, 1]
+
+    # Bloquer Big coûterait le Mur : le défenseur préfère encaisser
+    assert options[0].response is None and options[0].score == HP_VALUE
+    # Small est bloqué et meurt
+    assert options[1].response.blocker_index == 0
+    assert options[1].score == -1 and options[1].trade == -2
+
+
+def test_sneaky_and_lethal(game_empty, create_card):
+    p1, p2 = game_empty.state.player1, game_empty.state.player2
+    p2.hp = 1
+    p1.board = [create_card("Ninja", 1, keywords=["SNEAKY"])]
+    p2.board = [create_card("Giant", 9)]
+
+    option = TacticalAnalyzer.attack_options(game_empty)[0]
+    assert option.blocks == ()
+    assert option.lethal
+
+
+def test_hunter_chooses_blocker_and_ban_filters(game_empty, create_card):
+    p1, p2 = game_empty.state.player1, game_empty.state.player2
+    p1.board = [create_card("Hunter", 5, keywords=["HUNTER"])]
+    p2.board = [create_card("Big", 8), create_card("Prey", 1)]
+
+    option = TacticalAnalyzer.attack_options(game_empty)[0]
+    assert option.response.blocker_index == 1
+    assert option.score == 1
+
+    ban = create_card("Pachy", 7, effect_type="BAN", effect_target={"group": "ENEMIES"},
+                      effect_params={"action": "BLOCK"},
+                      effect_condition={"stat": "POWER", "operator": "LTE", "value": 6})
+    p1.board = [ban]
+    option = TacticalAnalyzer.attack_options(game_empty)[0]
+    assert [b.blocker_index for b in option.blocks] == [0]
+
+
+def test_pending_blocks_and_other_phases(game_empty, create_card):
+    state = game_empty.state
+    attacker = create_card("Atk", 3)
+    state.player1.board = [attacker]
+    state.player2.board = [create_card("B1", 5), create_card("B2", 3)]
+    assert TacticalAnalyzer.pending_blocks(game_empty) == []
+
+    state.phase = Phase.BLOCK_DECISION
+    state.active_player_idx = 1
+    state.pending_attacker = attacker
+    assert TacticalAnalyzer.attack_options(game_empty) == []
+    blocks = TacticalAnalyzer.pending_blocks(game_empty)
+    assert [(b.outcome.att_dies, b.outcome.blk_dies) for b in blocks] == [(True, False), (True, True)]
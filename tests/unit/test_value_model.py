@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from constants import PATH_VALUE_MODEL
+from mindbug_ai.learning import (FEATURE_COUNT, FEATURE_NAMES, LinearValueModel,
+                                 generate_dataset, position_features)
+from mindbug_ai.mcts.agent import MCTSAgent
+
+
+def test_position_features_perspective(game_empty, create_card):
+    state = game_empty.state
+    state.player1.board = [create_card("Frenzy", 4, keywords=["FRENZY"])]
+    state.player2.hp = 1
+
+    mine = position_features(game_empty, 0)
+    theirs = position_features(game_empty, 1)
+    assert mine.shape == (FEATURE_COUNT,) and mine.dtype == np.float32
+    assert mine[FEATURE_NAMES.index("me_power")] == 4
+    assert mine[FEATURE_NAMES.index("me_kw_frenzy")] == 1
+    assert mine[FEATURE_NAMES.index("opp_hp")] == 1
+    assert theirs[FEATURE_NAMES.index("opp_power")] == 4
+    assert mine[-1] + theirs[-1] == 1.0
+
+
+def test_fit_separable_data_and_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, FEATURE_COUNT)).astype(np.float32) * 3 + 5
+    y = (X[:, 0] > 5).astype(np.float32)
+
+    model = LinearValueModel.fit(X, y, epochs=300)
+    assert model.accuracy(X, y) > 0.95
+    assert model.log_loss(X, y) < 0.3
+
+    path = tmp_path / "model.json"
+    model.save(str(path))
+    loaded = LinearValueModel.load(str(path))
+    assert np.allclose(loaded.predict(X), model.predict(X))
+
+    path.write_text('{"features": ["x"], "weights": [1.0], "bias": 0}')
+    with pytest.raises(ValueError):
+        LinearValueModel.load(str(path))
+
+
+def test_generate_dataset_labels_both_perspectives():
+    X, y = generate_dataset(games=3, seed=0, randomness=0.2)
+    assert X.shape[1] == FEATURE_COUNT and len(X) == len(y) > 0
+    # Chaque position est vue par les deux joueurs : exactement un gagnant par paire
+    assert np.all(y[0::2] + y[1::2] == 1.0)
+
+
+def test_shipped_model_and_cutoff_agent(game):
+    model = LinearValueModel.load(PATH_VALUE_MODEL)
+    p0 = model.win_probability(game, 0)
+    assert 0.0 < p0 < 1.0
+
+    agent = MCTSAgent(simulation_time=0.05, value_model=model, rollout_depth=4,
+                      value_prior_visits=2)
+    move = agent.get_action(game)
+    assert move in game.get_legal_moves()
+    assert agent._simulation_results(game) == pytest.approx((p0, 1.0 - p0))
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from mindbug_ai.env import MindbugVectorEnv
+from mindbug_ai.learning import ACTION_COUNT, OBSERVATION_SIZE
+
+
+def _rollout(vec, steps, seed=0):
+    """Actions légales aléatoires ; renvoie la trace (obs, dones) de chaque step."""
+    rng = np.random.default_rng(seed)
+    obs, masks, acting = vec.reset()
+    trace = []
+    for _ in range(steps):
+        assert masks.any(axis=1).all()
+        actions = (rng.random(masks.shape) * masks).argmax(axis=1)
+        obs, masks, acting, rewards, dones, winners = vec.step(actions)
+        # Récompenses à somme nulle, uniquement en fin de partie
+        assert np.all(rewards.sum(axis=1) == 0)
+        assert np.all((winners >= 0) <= dones)
+        trace.append((obs.copy(), dones.copy()))
+    return trace
+
+
+def test_in_process_slots_auto_reset():
+    with MindbugVectorEnv(num_workers=0, envs_per_worker=3, seed=0, max_steps=20) as vec:
+        assert vec.buffers["obs"].shape == (3, OBSERVATION_SIZE)
+        assert vec.buffers["masks"].shape == (3, ACTION_COUNT)
+        trace = _rollout(vec, 45)
+    # max_steps = 20 : chaque emplacement a forcément été relancé
+    assert np.stack([d for _, d in trace]).any(axis=0).all()
+
+
+def test_worker_processes_match_in_process_run():
+    with MindbugVectorEnv(num_workers=0, envs_per_worker=4, seed=7) as local:
+        expected = _rollout(local, 30)
+    with MindbugVectorEnv(num_workers=2, envs_per_worker=2, seed=7) as vec:
+        assert vec.num_envs == 4
+        actual = _rollout(vec, 30)
+
+    for (obs_a, dones_a), (obs_b, dones_b) in zip(expected, actual):
+        assert np.array_equal(obs_a, obs_b)
+        assert np.array_equal(dones_a, dones_b)
+
+
+def test_illegal_action_is_rejected_before_any_step():
+    with MindbugVectorEnv(num_workers=0, envs_per_worker=2, seed=3) as vec:
+        obs, masks, acting = vec.reset()
+        before = obs.copy()
+        actions = masks.argmax(axis=1)
+        actions[1] = int(np.flatnonzero(~masks[1])[0])
+        with pytest.raises(ValueError):
+            vec.step(actions)
+        with pytest.raises(ValueError):
+            vec.step([actions[0], ACTION_COUNT])
+        assert np.array_equal(vec.buffers["obs"], before)
+        vec.step(masks.argmax(axis=1))